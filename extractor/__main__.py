@@ -0,0 +1,57 @@
+import sys
+from importlib import import_module
+
+# Subcommand -> (module, description). Modules are imported only when their
+# command runs, so `python -m extractor` itself starts about as fast as a bare
+# interpreter and commands never pay for each other's dependencies.
+COMMANDS = {
+    "scan": ("extractor.main", "Extract badges from local markdown (and HTML) files"),
+    "scan-exact": ("extractor.dev", "Extract badges into the exact README categories"),
+    "fetch": ("extractor.badge-extractor", "Fetch a GitHub README and extract its badges"),
+    "catalog": ("extractor.catalog", "Inspect, rebuild or index utils/badge_categories"),
+    "summary": ("extractor.get_category", "Summarize the badge categories of a README"),
+    "readme": ("extractor.readme_generator", "Render the catalog JSON into README tables"),
+    "diff": ("extractor.catalog_diff", "Diff two catalog snapshots into a changelog"),
+    "check-links": ("extractor.link_checker", "Check that catalog badge URLs still serve SVGs"),
+    "resolve": ("extractor.fuzzy_lookup", "Resolve technology names to catalog badges"),
+    "suggest": ("extractor.suggest", "Suggest a badge row from a repo's dependency manifests"),
+    "build": ("extractor.static_build", "Build the minified, hashed, pre-compressed frontend"),
+    "binary": ("extractor.binary_catalog", "Convert the catalog to and from the compact binary format"),
+    "serve": ("extractor.api_server", "Serve catalog queries over HTTP with hot reload"),
+    "restyle": ("extractor.restyle", "Rewrite shields.io badge styles and colours in place"),
+    "loadtest": ("extractor.load_test", "Replay the utils/ page fetch pattern under load"),
+}
+
+def print_usage(file=sys.stdout):
+    """
+    Print the list of available subcommands
+    """
+    print("usage: python -m extractor <command> [options]\n", file=file)
+    print("commands:", file=file)
+    for name, (_, description) in COMMANDS.items():
+        print(f"  {name:<12} {description}", file=file)
+    print("\nRun 'python -m extractor <command> --help' for command options.", file=file)
+
+def main(argv=None):
+    """
+    Dispatch to the subcommand's own main(), importing it on demand
+    """
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv or argv[0] in ("-h", "--help"):
+        print_usage(sys.stdout if argv else sys.stderr)
+        return 0 if argv else 2
+
+    command, command_args = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"Unknown command: {command}\n", file=sys.stderr)
+        print_usage(sys.stderr)
+        return 2
+
+    module_name, _ = COMMANDS[command]
+    # Let argparse in the command show the right program name
+    sys.argv[0] = f"python -m extractor {command}"
+    return import_module(module_name).main(command_args)
+
+if __name__ == "__main__":
+    sys.exit(main())
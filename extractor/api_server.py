@@ -0,0 +1,357 @@
+import os
+import gzip
+import json
+import asyncio
+import hashlib
+import argparse
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qs, unquote, unquote_plus
+
+from . import catalog
+from .binary_catalog import read_source
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8081
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE = 500
+
+# Responses smaller than this aren't worth compressing
+GZIP_MIN_BYTES = 512
+RESPONSE_CACHE_SIZE = 1024
+MAX_HEADER_BYTES = 16 * 1024
+
+REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 431: "Request Header Fields Too Large"}
+
+def badge_logo(url):
+    """
+    The shields logo= slug of a badge URL, lowercased, or ""
+    """
+    query = parse_qs(urlsplit(url).query)
+    return unquote_plus(query["logo"][0]).lower() if "logo" in query else ""
+
+def badge_color(url):
+    """
+    The badge colour: color= if given, else the last dash-separated part
+    of the static badge path, lowercased without any leading '#'
+    """
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    if "color" in query:
+        color = query["color"][0]
+    else:
+        color = unquote(parts.path.rsplit('/', 1)[-1]).rsplit('-', 1)[-1]
+        if color.endswith('.svg'):
+            color = color[:-4]
+    return color.lstrip('#').lower()
+
+def source_signature(source):
+    """
+    Cheap change detector for a catalog file or directory: names, sizes and mtimes
+    """
+    if os.path.isdir(source):
+        paths = catalog.category_files(source)
+    else:
+        paths = [source]
+    signature = []
+    for path in paths:
+        stat = os.stat(path)
+        signature.append((path, stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+class CatalogSnapshot:
+    """
+    One immutable, fully indexed load of the catalog
+
+    Requests hold a reference to the snapshot they started with, so a
+    reload only has to swap the server's current snapshot; old ones are
+    freed once their last request finishes.
+    """
+
+    def __init__(self, source):
+        self.signature = source_signature(source)
+        self.categories = []
+        self.badges = []
+
+        for key, display, badges in read_source(source)[1]:
+            self.categories.append({"key": key, "name": display, "badges_count": len(badges)})
+            for name, url, markdown in badges:
+                self.badges.append({
+                    "category": key, "name": name, "badge_url": url,
+                    "markdown": markdown.strip('`') or f"![{name}]({url})",
+                    "logo": badge_logo(url), "color": badge_color(url),
+                })
+
+        self.by_category = {}
+        self.by_logo = {}
+        self.by_color = {}
+        for badge in self.badges:
+            self.by_category.setdefault(badge["category"], []).append(badge)
+            self.by_logo.setdefault(badge["logo"], []).append(badge)
+            self.by_color.setdefault(badge["color"], []).append(badge)
+        self.search_keys = [f"{badge['name']} {badge['logo']}".lower() for badge in self.badges]
+
+        self.version = hashlib.sha1(repr(self.signature).encode()).hexdigest()[:12]
+        self.responses = OrderedDict()
+        # The always-requested listings are rendered and compressed up front
+        self.response("/categories", {})
+        for key in self.by_category:
+            self.response(f"/categories/{key}", {})
+
+    def query(self, params):
+        """
+        Filter badges by category, q (name/logo substring), logo and color
+
+        Starts from the category, logo or colour index when one is given
+        and filters the remaining conditions over that subset.
+        """
+        logo = params["logo"][0].lower() if "logo" in params else None
+        color = params["color"][0].lstrip('#').lower() if "color" in params else None
+        text = params["q"][0].lower() if "q" in params else None
+
+        if "category" in params:
+            candidates = self.by_category.get(params["category"][0], [])
+        elif logo is not None:
+            candidates, logo = self.by_logo.get(logo, []), None
+        elif color is not None:
+            candidates, color = self.by_color.get(color, []), None
+        elif text is not None:
+            return [b for b, key in zip(self.badges, self.search_keys) if text in key]
+        else:
+            return self.badges
+
+        if logo is not None:
+            candidates = [b for b in candidates if b["logo"] == logo]
+        if color is not None:
+            candidates = [b for b in candidates if b["color"] == color]
+        if text is not None:
+            candidates = [b for b in candidates if text in f"{b['name']} {b['logo']}".lower()]
+        return candidates
+
+    def render(self, path, params):
+        """
+        Build the JSON document for a request, or raise LookupError/ValueError
+        """
+        if path in ("/", "/health"):
+            return {"status": "ok", "version": self.version, "badges": len(self.badges)}
+        if path == "/categories":
+            return {"version": self.version, "categories": self.categories}
+        if path.startswith("/categories/"):
+            key = path[len("/categories/"):]
+            if key not in self.by_category:
+                raise LookupError(f"unknown category: {key}")
+            params = {**params, "category": [key]}
+            path = "/badges"
+        if path != "/badges":
+            raise LookupError(f"no such endpoint: {path}")
+
+        page = int(params.get("page", ["1"])[0])
+        per_page = min(int(params.get("per_page", [str(DEFAULT_PER_PAGE)])[0]), MAX_PER_PAGE)
+        if page < 1 or per_page < 1:
+            raise ValueError("page and per_page must be positive")
+
+        matches = self.query(params)
+        start = (page - 1) * per_page
+        return {
+            "version": self.version,
+            "total": len(matches),
+            "page": page,
+            "per_page": per_page,
+            "pages": (len(matches) + per_page - 1) // per_page,
+            "badges": matches[start:start + per_page],
+        }
+
+    def response(self, path, params):
+        """
+        Cached (etag, body, gzipped body or None) for a request
+
+        Raises LookupError or ValueError for bad requests.
+        """
+        cache_key = (path, tuple(sorted((k, tuple(v)) for k, v in params.items())))
+        cached = self.responses.get(cache_key)
+        if cached is not None:
+            self.responses.move_to_end(cache_key)
+            return cached
+
+        body = json.dumps(self.render(path, params), ensure_ascii=False,
+                          separators=(',', ':')).encode('utf-8')
+        etag = f'"{self.version}-{hashlib.sha1(body).hexdigest()[:16]}"'
+        compressed = gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= GZIP_MIN_BYTES else None
+
+        self.responses[cache_key] = cached = (etag, body, compressed)
+        if len(self.responses) > RESPONSE_CACHE_SIZE:
+            self.responses.popitem(last=False)
+        return cached
+
+class CatalogServer:
+    """
+    Minimal HTTP/1.1 server (GET/HEAD, keep-alive) over a CatalogSnapshot
+    """
+
+    def __init__(self, source=catalog.DEFAULT_CATALOG_DIR, reload_interval=2.0):
+        self.source = source
+        self.reload_interval = reload_interval
+        self.snapshot = CatalogSnapshot(source)
+        self.reloads = 0
+
+    async def watch(self):
+        """
+        Poll the source and swap in a new snapshot when it changes
+
+        The new snapshot is built in a worker thread; requests keep being
+        served from the old one until the single attribute swap.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                if source_signature(self.source) == self.snapshot.signature:
+                    continue
+                snapshot = await loop.run_in_executor(None, CatalogSnapshot, self.source)
+            except Exception as e:
+                # Half-written or malformed JSON: keep serving the old catalog
+                # and retry next tick; the watcher itself must never die
+                print(f"⚠️  Reload of {self.source} failed: {type(e).__name__}: {e}")
+                continue
+            self.snapshot = snapshot
+            self.reloads += 1
+            print(f"🔄 Catalog reloaded (version {snapshot.version}, {len(snapshot.badges)} badges)")
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.send(writer, 431, {"error": "headers too large"}, keep_alive=False)
+                    break
+
+                request_line, *header_lines = head.decode('latin-1').split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ")
+                except ValueError:
+                    await self.send(writer, 400, {"error": "malformed request line"}, keep_alive=False)
+                    break
+
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+
+                if method not in ("GET", "HEAD"):
+                    # The request body (if any) is unread, so the connection
+                    # can't be reused: close it rather than parse the body
+                    # as the next request
+                    keep_alive = False
+                    await self.send(writer, 405, {"error": "only GET and HEAD are supported"},
+                                    keep_alive=False, extra={"Allow": "GET, HEAD"})
+                else:
+                    await self.respond(writer, method, target, headers, keep_alive)
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            # Client went away, or the server is shutting down: just hang up
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, method, target, headers, keep_alive):
+        # Pin the snapshot for the whole request; a reload may swap it meanwhile
+        snapshot = self.snapshot
+        parts = urlsplit(target)
+        params = parse_qs(parts.query)
+
+        try:
+            etag, body, compressed = snapshot.response(parts.path.rstrip('/') or "/", params)
+        except LookupError as e:
+            await self.send(writer, 404, {"error": str(e.args[0])}, keep_alive=keep_alive,
+                            head_only=method == "HEAD")
+            return
+        except ValueError as e:
+            await self.send(writer, 400, {"error": f"bad parameter: {e}"}, keep_alive=keep_alive,
+                            head_only=method == "HEAD")
+            return
+
+        extra = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if etag in [tag.strip() for tag in headers.get("if-none-match", "").split(",")]:
+            await self.send_raw(writer, 304, b"", extra, keep_alive, head_only=True)
+            return
+
+        if compressed is not None and "gzip" in headers.get("accept-encoding", ""):
+            body = compressed
+            extra["Content-Encoding"] = "gzip"
+        await self.send_raw(writer, 200, body, extra, keep_alive, head_only=method == "HEAD")
+
+    async def send(self, writer, status, document, keep_alive, extra=None, head_only=False):
+        body = json.dumps(document).encode('utf-8')
+        await self.send_raw(writer, status, body, extra or {}, keep_alive, head_only)
+
+    async def send_raw(self, writer, status, body, extra, keep_alive, head_only=False):
+        """
+        Write one response; head_only sends the headers a GET would get, no body
+
+        A 304 has neither body nor Content-Length: it would misstate the
+        length of the representation the client already has.
+        """
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}"]
+        if status != 304:
+            lines.append(f"Content-Length: {len(body)}")
+        lines += [f"Connection: {'keep-alive' if keep_alive else 'close'}",
+                  "Access-Control-Allow-Origin: *"]
+        if status != 304:
+            lines.append("Content-Type: application/json; charset=utf-8")
+        lines += [f"{name}: {value}" for name, value in extra.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1'))
+        if not head_only:
+            writer.write(body)
+        await writer.drain()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None):
+        """
+        Run until cancelled; ready, if given, is called with the bound port
+        """
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES)
+        watcher = asyncio.create_task(self.watch()) if self.reload_interval > 0 else None
+        if ready:
+            ready(server.sockets[0].getsockname()[1])
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if watcher:
+                watcher.cancel()
+
+def main(argv=None):
+    """
+    Serve catalog queries over HTTP
+    """
+    parser = argparse.ArgumentParser(description="Serve the badge catalog as a JSON query API")
+    parser.add_argument("source", nargs="?", default=catalog.DEFAULT_CATALOG_DIR,
+                        help="category directory or combined JSON file (default: utils/badge_categories)")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", "-p", type=int, default=DEFAULT_PORT,
+                        help=f"port (default: {DEFAULT_PORT})")
+    parser.add_argument("--reload-interval", type=float, default=2.0, metavar="SECONDS",
+                        help="how often to check the source for changes; 0 disables reloading")
+    args = parser.parse_args(argv)
+
+    server = CatalogServer(args.source, args.reload_interval)
+    snapshot = server.snapshot
+    print(f"📚 {len(snapshot.badges)} badges in {len(snapshot.categories)} categories")
+    print(f"🌐 Serving on http://{args.host}:{args.port}/ "
+          f"(/categories, /categories/<key>, /badges?category=&q=&logo=&color=&page=&per_page=)")
+
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,17 @@
-import requests
 import json
 import re
 import os
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import argparse
+
+DEFAULT_REPO = "https://github.com/Ileriayo/markdown-badges"
 
 def fetch_readme_content(repo_url):
     """
     Fetch README content from a GitHub repository
     """
+    # Imported here so the other commands don't pay for loading requests
+    import requests
+    
     # Convert GitHub repo URL to raw README content URL
     repo_url = repo_url.rstrip('/')
     if repo_url.startswith('https://github.com/'):
@@ -157,12 +160,23 @@ def generate_summary(categories_badges, output_dir="badge_categories"):
     print(f"Summary saved to {summary_path}")
     return summary_path
 
-def main():
+def parse_args(argv=None):
+    """
+    Parse command line options
+    """
+    parser = argparse.ArgumentParser(description="Fetch a README and extract its badges by category")
+    parser.add_argument("repo", nargs="?", default=DEFAULT_REPO,
+                        help=f"GitHub repository or raw README URL (default: {DEFAULT_REPO})")
+    parser.add_argument("--output", "-o", default="badge_categories",
+                        help="directory for the JSON output (default: badge_categories)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """
     Main function to orchestrate the badge extraction process
     """
-    #target_repo = "https://github.com/PsymoNiko/badge-styler"
-    target_repo = "https://github.com/Ileriayo/markdown-badges"
+    args = parse_args(argv)
+    target_repo = args.repo
     
     print(f"Fetching README from: {target_repo}")
     readme_content = fetch_readme_content(target_repo)
@@ -181,15 +195,15 @@ def main():
     print(f"Found {len(categories_badges)} categories with badges")
     
     # Save badges to JSON files
-    saved_files = save_badges_to_json(categories_badges)
+    saved_files = save_badges_to_json(categories_badges, args.output)
     
     # Generate summary
-    generate_summary(categories_badges)
+    generate_summary(categories_badges, args.output)
     
     print(f"\nExtraction completed successfully!")
     print(f"Total categories processed: {len(categories_badges)}")
     print(f"Total badges found: {sum(len(badges) for badges in categories_badges.values())}")
-    print(f"JSON files saved to 'badge_categories' directory")
+    print(f"JSON files saved to '{args.output}' directory")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,608 @@
+import os
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+import sys
+import tracemalloc
+
+from . import main as extractor_main
+from .load_test import http_get, percentile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_README = os.path.join(REPO_ROOT, "utils", "README.md")
+
+def make_markdown_corpus(directory, files=100, copies_per_file=2):
+    """
+    Write a synthetic corpus of README copies and return their paths
+    """
+    with open(SAMPLE_README, 'r', encoding='utf-8') as f:
+        sample = f.read()
+
+    paths = []
+    for i in range(files):
+        path = os.path.join(directory, f"README_{i:05d}.md")
+        with open(path, 'w', encoding='utf-8') as f:
+            # Vary file sizes so the chunker has something to balance
+            f.write(sample * (1 + i % copies_per_file))
+        paths.append(path)
+
+    return paths
+
+def timed(func, *args, **kwargs):
+    """
+    Run func once and return (result, elapsed seconds)
+    """
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def peak_memory(func, *args, **kwargs):
+    """
+    Run func once and return the peak traced Python allocation in MB
+    """
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+def bench_parallel_parse(jobs_list=(2, 4, 8), files=100):
+    """
+    Compare serial parsing against the process pool for several job counts
+    """
+    print("\n⏱️  Parallel parsing (extractor/main.py --jobs)")
+
+    directory = tempfile.mkdtemp(prefix="badge-bench-")
+    try:
+        paths = make_markdown_corpus(directory, files)
+        file_jobs = [(path, False) for path in paths]
+        total_mb = sum(os.path.getsize(path) for path in paths) / 1e6
+        print(f"  Corpus: {len(paths)} files, {total_mb:.1f} MB")
+
+        serial, serial_time = timed(
+            lambda: [extractor_main.extract_badges_from_file(path) for path in paths]
+        )
+        serial_json = json.dumps(serial, ensure_ascii=False)
+        print(f"  serial   : {serial_time:.3f}s")
+
+        for jobs in jobs_list:
+            parallel, parallel_time = timed(extractor_main.parse_files_parallel, file_jobs, jobs)
+            identical = json.dumps(parallel, ensure_ascii=False) == serial_json
+            print(f"  jobs={jobs:<4}: {parallel_time:.3f}s  "
+                  f"speedup {serial_time / parallel_time:.2f}x  "
+                  f"{'identical' if identical else 'MISMATCH'}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def bench_mmap_scan(files=40):
+    """
+    Compare decode-then-parse against the mmap bytes scanner
+    """
+    print("\n⏱️  mmap scanning (scan_markdown_file vs read_markdown_file)")
+
+    directory = tempfile.mkdtemp(prefix="badge-bench-")
+    try:
+        paths = make_markdown_corpus(directory, files)
+        # Make half the corpus latin-1 so the old path pays for its re-read
+        for path in paths[::2]:
+            with open(path, 'rb') as f:
+                data = f.read()
+            with open(path, 'wb') as f:
+                f.write("Caf\xe9 ![latin](https://img.shields.io/badge/x-y)\n".encode('latin-1') + data)
+        total_mb = sum(os.path.getsize(path) for path in paths) / 1e6
+        print(f"  Corpus: {len(paths)} files, {total_mb:.1f} MB (half latin-1)")
+
+        def decode_then_parse():
+            return [
+                extractor_main.extract_badges_from_content(
+                    extractor_main.read_markdown_file(path), os.path.basename(path))
+                for path in paths
+            ]
+
+        def scan_mapped():
+            return [
+                extractor_main.scan_markdown_file(path, os.path.basename(path))
+                for path in paths
+            ]
+
+        old, old_time = timed(decode_then_parse)
+        new, new_time = timed(scan_mapped)
+        print(f"  decode + split : {old_time:.3f}s")
+        print(f"  mmap + bytes re: {new_time:.3f}s  "
+              f"speedup {old_time / new_time:.2f}x  {'identical' if old == new else 'MISMATCH'}")
+
+        largest = max(paths, key=os.path.getsize)
+        old_peak = peak_memory(lambda: extractor_main.extract_badges_from_content(
+            extractor_main.read_markdown_file(largest)))
+        new_peak = peak_memory(extractor_main.scan_markdown_file, largest)
+        print(f"  peak memory on {os.path.getsize(largest) / 1e6:.1f} MB file: "
+              f"{old_peak:.1f} MB -> {new_peak:.1f} MB")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def interpreter_time(code=None, args=None, runs=10):
+    """
+    Best-of-N wall time of a fresh interpreter run from the repo root
+
+    Runs `python -c code`, or `python *args` when args is given.
+    """
+    command = [sys.executable] + (list(args) if args else ["-c", code])
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=REPO_ROOT, check=True, stdout=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def bench_catalog_startup():
+    """
+    Compare eager globbing of the catalog against the lazy catalog module
+    """
+    from . import catalog
+
+    print("\n⏱️  Catalog startup (extractor/catalog.py)")
+
+    eager_code = (
+        "import glob, json\n"
+        "catalog = {f: json.load(open(f, encoding='utf-8'))"
+        " for f in glob.glob('utils/badge_categories/*.json')}"
+    )
+    baseline = interpreter_time("pass")
+    eager = interpreter_time(eager_code)
+    lazy_import = interpreter_time("import extractor.catalog")
+    lazy_query = interpreter_time(
+        "import extractor.catalog as c; c.get_category('languages')"
+    )
+    print(f"  bare interpreter     : {baseline * 1000:.1f} ms")
+    print(f"  eager glob + load    : {eager * 1000:.1f} ms")
+    print(f"  import catalog       : {lazy_import * 1000:.1f} ms")
+    print(f"  import + 1 category  : {lazy_query * 1000:.1f} ms")
+
+    catalog.clear_cache()
+    _, first_query = timed(catalog.get_category, "languages")
+    _, cached_query = timed(catalog.get_category, "languages")
+    print(f"  first query latency  : {first_query * 1e6:.0f} µs (cached: {cached_query * 1e6:.1f} µs)")
+
+def make_catalog(directory, categories=40, badges_per_category=250):
+    """
+    Write a synthetic catalog directory shaped like utils/badge_categories
+    """
+    for c in range(categories):
+        badges = []
+        for b in range(badges_per_category):
+            name = f"Tech {c:03d}-{b:04d}"
+            url = (f"https://img.shields.io/badge/tech{c}x{b}-%23{(c * 7919 + b) % 0xFFFFFF:06X}.svg"
+                   f"?style=for-the-badge&logo=tech{c}x{b}&logoColor=white")
+            badges.append({"name": name, "badge": url, "markdown": f"`![{name}]({url})`"})
+        with open(os.path.join(directory, f"category_{c:03d}.json"), 'w', encoding='utf-8') as f:
+            json.dump({"category": f"Category {c:03d}", "badges": badges}, f, indent=2)
+
+def bench_readme_generation(categories=40, badges_per_category=250):
+    """
+    Time a full README render and an incremental one-category update
+    """
+    from . import catalog, readme_generator
+
+    total = categories * badges_per_category
+    print(f"\n⏱️  README generation ({total} badges, {categories} sections)")
+
+    directory = tempfile.mkdtemp(prefix="badge-bench-")
+    try:
+        catalog_dir = os.path.join(directory, "catalog")
+        readme = os.path.join(directory, "README.md")
+        os.makedirs(catalog_dir)
+        make_catalog(catalog_dir, categories, badges_per_category)
+        catalog.write_manifest(catalog_dir)
+
+        _, full = timed(readme_generator.generate_readme, readme, catalog_dir)
+        _, noop = timed(readme_generator.generate_readme, readme, catalog_dir)
+
+        changed = os.path.join(catalog_dir, "category_007.json")
+        with open(changed, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data["badges"].pop()
+        with open(changed, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        catalog.write_manifest(catalog_dir)
+        catalog.clear_cache()
+
+        (rendered, kept), incremental = timed(readme_generator.generate_readme, readme, catalog_dir)
+        print(f"  full render       : {full * 1000:.1f} ms "
+              f"({os.path.getsize(readme) / 1e6:.1f} MB)")
+        print(f"  nothing changed   : {noop * 1000:.1f} ms")
+        print(f"  one category edit : {incremental * 1000:.1f} ms "
+              f"({rendered} rendered, {kept} copied)")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def bench_catalog_diff(entries=100_000):
+    """
+    Time the hashed snapshot diff on two large synthetic snapshots
+    """
+    import random
+    from . import catalog_diff
+
+    print(f"\n⏱️  Catalog diff ({entries} entries per snapshot)")
+
+    rng = random.Random(42)
+    old = [(f"category_{i % 50:02d}", f"Tech {i}", f"https://img.shields.io/badge/tech{i}-blue")
+           for i in range(entries)]
+    new = list(old)
+    changed = rng.sample(range(entries), entries // 100)
+    for n, i in enumerate(changed):
+        category, name, url = new[i]
+        kind = n % 4
+        if kind == 0:
+            new[i] = (category, name + " Renamed", url)
+        elif kind == 1:
+            new[i] = ("category_moved", name, url)
+        elif kind == 2:
+            new[i] = (category, name, url + "?style=flat")
+        else:
+            new[i] = None
+    new = [record for record in new if record is not None]
+    new += [("category_new", f"Added {i}", f"https://example.com/{i}") for i in range(entries // 400)]
+    rng.shuffle(new)
+
+    changes, elapsed = timed(catalog_diff.diff_snapshots, old, new)
+    print(f"  diff              : {elapsed * 1000:.1f} ms")
+    print("  " + ", ".join(f"{key} {count}" for key, count in changes["summary"].items()))
+
+def bench_fuzzy_lookup(batch=5000):
+    """
+    Time trigram index construction, single queries and batch resolution
+    """
+    import random
+    from . import fuzzy_lookup
+
+    print("\n⏱️  Fuzzy badge lookup (extractor/fuzzy_lookup.py)")
+
+    index, build = timed(fuzzy_lookup.build_index)
+    print(f"  build index       : {build * 1000:.1f} ms "
+          f"({len(index['entries'])} badges, {len(index['postings'])} trigrams)")
+
+    rng = random.Random(7)
+    names = [entry[1] for entry in index["entries"]]
+    queries = []
+    for _ in range(batch):
+        name = rng.choice(names).lower()
+        if len(name) > 3 and rng.random() < 0.5:
+            # Drop a character to simulate a typo
+            cut = rng.randrange(len(name))
+            name = name[:cut] + name[cut + 1:]
+        queries.append(name)
+
+    results, elapsed = timed(fuzzy_lookup.resolve_many, index, queries)
+    resolved = sum(1 for matches in results.values() if matches)
+    print(f"  batch of {batch:<9}: {elapsed * 1000:.1f} ms "
+          f"({elapsed / batch * 1e6:.1f} µs/query, {resolved}/{len(results)} unique resolved)")
+
+def synthetic_badges(count, technologies=50_000, files=1000):
+    """
+    Yield count badge records drawn from a skewed technology distribution
+    """
+    import random
+
+    rng = random.Random(11)
+    for i in range(count):
+        tech = f"Tech{int(rng.paretovariate(0.8)) % technologies}"
+        yield {
+            "technology": tech,
+            "badge_url": f"https://img.shields.io/badge/{tech}-blue?style=flat&i={i % 200_000}",
+            "section": f"Section {i % 40}",
+            "source_file": f"repo_{i % files}/README.md",
+            "line_number": i,
+        }
+
+def bench_streaming_stats(count=300_000):
+    """
+    Compare building the summary from a full badge list against BadgeStats
+    """
+    from .stats import BadgeStats
+
+    print("\n⏱️  Summary statistics (extractor/stats.py)")
+
+    def materialized():
+        badges = list(synthetic_badges(count))
+        return (len(badges), sorted(set(b["source_file"] for b in badges)),
+                sorted(set(b["technology"] for b in badges)))
+
+    def streaming():
+        stats = BadgeStats()
+        for badge in synthetic_badges(count):
+            stats.add(badge, "other")
+        return stats
+
+    exact, list_time = timed(materialized)
+    stats, stream_time = timed(streaming)
+    list_memory = peak_memory(materialized)
+    stream_memory = peak_memory(streaming)
+
+    error = abs(stats.technology_sketch.estimate() - len(exact[2])) / len(exact[2])
+    print(f"  {count} badges, {len(exact[2])} distinct technologies")
+    print(f"  list + sets : {list_time:.2f}s  peak {list_memory:.1f} MB")
+    print(f"  streaming   : {stream_time:.2f}s  peak {stream_memory:.1f} MB  "
+          f"(HLL error {error:.2%}, exact list kept: {stats.exact_technologies is not None})")
+
+def bench_binary_catalog(runs=50):
+    """
+    Compare size and load time of the binary catalog against the JSON files
+    """
+    from . import catalog
+    from . import binary_catalog
+
+    print("\n⏱️  Binary catalog (extractor/binary_catalog.py)")
+
+    directory = tempfile.mkdtemp(prefix="badge-bench-")
+    try:
+        sources = {
+            "badges_categories.json": os.path.join(REPO_ROOT, "extractor", "badges_categories.json"),
+            "utils/badge_categories": catalog.DEFAULT_CATALOG_DIR,
+        }
+        for label, source in sources.items():
+            output = os.path.join(directory, "catalog.bcat")
+            binary_catalog.export_catalog(source, output)
+
+            if os.path.isdir(source):
+                paths = catalog.category_files(source)
+            else:
+                paths = [source]
+            json_size = sum(os.path.getsize(path) for path in paths)
+            first_key = next(iter(binary_catalog.read_source(source)[1]))[0]
+
+            def load_json():
+                for path in paths:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        json.load(f)
+
+            def open_binary():
+                binary_catalog.BinaryCatalog(output).close()
+
+            def one_category():
+                with binary_catalog.BinaryCatalog(output) as binary:
+                    binary.get_category(first_key)
+
+            def all_badges():
+                with binary_catalog.BinaryCatalog(output) as binary:
+                    for _ in binary.iter_badges():
+                        pass
+
+            print(f"  {label}: JSON {json_size / 1024:.1f} KB, "
+                  f"binary {os.path.getsize(output) / 1024:.1f} KB")
+            for name, func in (("json.load", load_json), ("binary open", open_binary),
+                               ("binary 1 category", one_category), ("binary all badges", all_badges)):
+                _, elapsed = timed(lambda: [func() for _ in range(runs)])
+                print(f"    {name:<18}: {elapsed / runs * 1000:.2f} ms")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def bench_api_server(connections=32, requests_per_connection=200):
+    """
+    Load-test the catalog API server over keep-alive connections
+    """
+    import asyncio
+    import threading
+    from .api_server import CatalogServer
+
+    print("\n⏱️  Catalog API server (extractor/api_server.py)")
+
+    server = CatalogServer(reload_interval=0)
+    loop = asyncio.new_event_loop()
+    bound = threading.Event()
+    port = []
+
+    def run_server():
+        asyncio.set_event_loop(loop)
+        task = loop.create_task(server.serve("127.0.0.1", 0, ready=lambda p: (port.append(p), bound.set())))
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+
+    thread = threading.Thread(target=run_server, daemon=True)
+    thread.start()
+    bound.wait()
+
+    categories = [category["key"] for category in server.snapshot.categories]
+    paths = (["/categories"] + [f"/categories/{key}" for key in categories] +
+             ["/badges?q=py", "/badges?logo=docker", "/badges?color=000000&page=2&per_page=10"])
+
+    async def client(index, latencies):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port[0])
+        for i in range(requests_per_connection):
+            path = paths[(index + i) % len(paths)]
+            # Every third request revalidates with gzip, as a browser would
+            headers = "Accept-Encoding: gzip\r\n" if i % 3 else ""
+            start = time.perf_counter()
+            status, _, _ = await http_get(reader, writer, "127.0.0.1", path, headers)
+            latencies.append(time.perf_counter() - start)
+            assert status == 200, (path, status)
+        writer.close()
+        await writer.wait_closed()
+
+    async def run_clients():
+        latencies = []
+        await asyncio.gather(*(client(i, latencies) for i in range(connections)))
+        return latencies
+
+    try:
+        latencies, elapsed = timed(asyncio.run, run_clients())
+    finally:
+        loop.call_soon_threadsafe(lambda: [task.cancel() for task in asyncio.all_tasks(loop)])
+        thread.join(timeout=5)
+
+    latencies.sort()
+    print(f"  {connections} connections x {requests_per_connection} requests "
+          f"(client and server share this process)")
+    print(f"  throughput: {len(latencies) / elapsed:,.0f} req/s")
+    print(f"  latency   : p50 {percentile(latencies, 0.50) * 1000:.2f} ms  "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f} ms  max {latencies[-1] * 1000:.2f} ms")
+
+def bench_restyle(files=60, jobs_list=(1, 2, 4)):
+    """
+    Time restyling a corpus in place, then a no-op pass over the result
+    """
+    from . import restyle
+
+    print("\n⏱️  Badge restyling (extractor/restyle.py)")
+
+    for jobs in jobs_list:
+        directory = tempfile.mkdtemp(prefix="badge-bench-")
+        try:
+            paths = make_markdown_corpus(directory, files)
+            changed, elapsed = timed(restyle.restyle_files, paths, jobs, style="flat")
+            badges = sum(len(changes) for changes in changed.values())
+            _, noop = timed(restyle.restyle_files, paths, jobs, style="flat")
+            print(f"  jobs={jobs:<3}: {elapsed:.3f}s for {badges} badges in {len(changed)} files, "
+                  f"no-op pass {noop:.3f}s")
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+def bench_archive_scan(files=60):
+    """
+    Compare unpacking an archive to disk and scanning it against streaming it
+    """
+    import tarfile
+
+    print("\n⏱️  Archive scanning (extractor/main.py --archives)")
+
+    directory = tempfile.mkdtemp(prefix="badge-bench-")
+    try:
+        corpus = os.path.join(directory, "repo")
+        os.makedirs(corpus)
+        make_markdown_corpus(corpus, files)
+        archive = os.path.join(directory, "snapshot.tar.gz")
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(corpus, arcname="repo")
+        print(f"  {files} files, archive {os.path.getsize(archive) / 1e6:.1f} MB")
+
+        def unpack_and_scan():
+            target = os.path.join(directory, "unpacked")
+            with tarfile.open(archive) as tar:
+                tar.extractall(target)
+            badges = []
+            unpacked = os.path.join(target, "repo")
+            for path in sorted(extractor_main.find_markdown_files(unpacked)):
+                badges.extend(extractor_main.scan_markdown_file(path, os.path.basename(path)) or [])
+            shutil.rmtree(target)
+            return badges
+
+        unpacked, unpack_time = timed(unpack_and_scan)
+        streamed, stream_time = timed(extractor_main.scan_archive, archive, "snapshot.tar.gz")
+        print(f"  unpack + scan : {unpack_time:.3f}s  ({len(unpacked)} badges)")
+        print(f"  stream        : {stream_time:.3f}s  ({len(streamed)} badges)")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def bench_external_sort(count=300_000, memory_budget_mb=8):
+    """
+    Compare in-memory categorize + save against the out-of-core sorter
+    """
+    import contextlib
+    import io
+    from .external_sort import ExternalBadgeSorter
+
+    print("\n⏱️  Out-of-core aggregation (extractor/main.py --memory-budget)")
+
+    directory = tempfile.mkdtemp(prefix="badge-bench-")
+    try:
+        def in_memory():
+            with contextlib.redirect_stdout(io.StringIO()):
+                badges = list(synthetic_badges(count))
+                categorized = extractor_main.categorize_badges(badges)
+                extractor_main.save_badges_to_json(categorized, os.path.join(directory, "memory"))
+
+        def external():
+            with contextlib.redirect_stdout(io.StringIO()):
+                with ExternalBadgeSorter(memory_budget_mb * 1024 * 1024, directory) as sorter:
+                    for badge in synthetic_badges(count):
+                        sorter.add(extractor_main.categorize_badge(badge), badge)
+                    extractor_main.save_badges_external(sorter, os.path.join(directory, "external"))
+                    return sorter.spilled_runs, sorter.duplicates
+
+        _, memory_time = timed(in_memory)
+        (runs, duplicates), external_time = timed(external)
+        memory_peak = peak_memory(in_memory)
+        external_peak = peak_memory(external)
+
+        print(f"  {count} badges, {memory_budget_mb} MB budget")
+        print(f"  in memory : {memory_time:.2f}s  peak {memory_peak:.1f} MB")
+        print(f"  external  : {external_time:.2f}s  peak {external_peak:.1f} MB  "
+              f"({runs} runs, {duplicates} duplicates dropped)")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+# Extra time `python -m extractor` may add on top of a bare interpreter
+CLI_STARTUP_BUDGET_MS = 30
+
+def bench_cli_startup(budget_ms=CLI_STARTUP_BUDGET_MS):
+    """
+    Check that the CLI dispatcher stays within its startup-time budget
+
+    Exits non-zero when the budget is blown, so batch jobs can run this
+    as a gate after dependency or import changes.
+    """
+    print("\n⏱️  CLI startup (python -m extractor)")
+
+    baseline = interpreter_time("pass")
+    usage = interpreter_time(args=["-m", "extractor", "--help"])
+    catalog = interpreter_time(args=["-m", "extractor", "catalog"])
+    heavy = interpreter_time(
+        "import sys; from extractor.__main__ import main; main(['catalog']); "
+        "assert not {'requests', 'bs4', 'lxml', 'concurrent.futures.process'} & set(sys.modules)"
+    )
+
+    overheads = {
+        "--help": usage - baseline,
+        "catalog": catalog - baseline,
+        "catalog (no heavy imports)": heavy - baseline,
+    }
+    print(f"  bare interpreter: {baseline * 1000:.1f} ms")
+    over_budget = False
+    for name, overhead in overheads.items():
+        ok = overhead * 1000 <= budget_ms
+        over_budget = over_budget or not ok
+        print(f"  {name:<27}: +{overhead * 1000:.1f} ms  {'ok' if ok else f'OVER {budget_ms} ms BUDGET'}")
+
+    if over_budget:
+        raise SystemExit(1)
+
+BENCHMARKS = {
+    "parallel": bench_parallel_parse,
+    "mmap": bench_mmap_scan,
+    "catalog": bench_catalog_startup,
+    "startup": bench_cli_startup,
+    "readme": bench_readme_generation,
+    "diff": bench_catalog_diff,
+    "lookup": bench_fuzzy_lookup,
+    "stats": bench_streaming_stats,
+    "binary": bench_binary_catalog,
+    "api": bench_api_server,
+    "restyle": bench_restyle,
+    "archive": bench_archive_scan,
+    "external": bench_external_sort,
+}
+
+def main(argv=None):
+    """
+    Run the selected benchmarks and print their timings
+    """
+    parser = argparse.ArgumentParser(description="Badge extractor benchmarks")
+    parser.add_argument("names", nargs="*", metavar="NAME",
+                        help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    args = parser.parse_args(argv)
+
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark: {name}")
+
+    for name in args.names or BENCHMARKS:
+        BENCHMARKS[name]()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+import os
+import json
+import mmap
+import struct
+import argparse
+
+from . import catalog
+
+# File layout (all integers little-endian uint32 unless noted):
+#
+#   header      MAGIC, version (uint16), flags (uint16), then category,
+#               badge and string counts and the offsets of the four tables
+#   categories  [key, display name, first row, row count] per category
+#   rows        ROW_FORMAT per badge, every field a string id
+#   offsets     string_count + 1 byte offsets into the string data
+#   strings     UTF-8 string data, each string stored once
+#
+# Badge URLs are split into prefix ("https://img.shields.io/badge/"), label
+# and query string so the shared parts are interned separately. markdown is
+# not stored when it is just "![name](url)"; otherwise its string id is kept.
+MAGIC = b"BCAT"
+VERSION = 1
+HEADER_FORMAT = "<4sHH7I"
+CATEGORY_FORMAT = "<4I"
+ROW_FORMAT = "<6I"
+NO_STRING = 0xFFFFFFFF
+
+# Header flags
+FLAG_CATALOG_DIR = 1        # exported from a category directory, not a combined file
+
+# Row flags
+ROW_BACKTICKS = 1           # markdown is wrapped in `backticks`
+
+ROW_STRUCT = struct.Struct(ROW_FORMAT)
+CATEGORY_STRUCT = struct.Struct(CATEGORY_FORMAT)
+OFFSET_PAIR_STRUCT = struct.Struct("<2I")
+
+DEFAULT_OUTPUT = os.path.join(catalog.REPO_ROOT, "extractor", "badges_categories.bcat")
+
+def split_url(url):
+    """
+    Split a badge URL into (prefix, label, query) for interning
+    """
+    query_start = url.find('?')
+    if query_start < 0:
+        query_start = len(url)
+    prefix_end = url.rfind('/', 0, query_start) + 1
+    return url[:prefix_end], url[prefix_end:query_start], url[query_start:]
+
+def default_markdown(name, url):
+    """
+    The markdown a badge gets when the catalog doesn't say otherwise
+    """
+    return f"![{name}]({url})"
+
+def read_source(path):
+    """
+    Read a category directory or combined JSON file
+
+    Returns (flags, categories) where categories is a list of
+    (key, display name, badges) and badges are (name, url, markdown).
+    """
+    categories = []
+
+    if os.path.isdir(path):
+        for file_path in catalog.category_files(path):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            key = os.path.splitext(os.path.basename(file_path))[0]
+            display = data.get("category") or data.get("category_name") or key
+            badges = [(b.get("name", ""), b.get("badge") or b.get("badge_url", ""), b.get("markdown", ""))
+                      for b in data.get("badges", [])]
+            categories.append((key, display, badges))
+        return FLAG_CATALOG_DIR, categories
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    for name, badges in data.items():
+        categories.append((name, name, [(b.get("name", ""), b.get("badge_url") or b.get("badge", ""),
+                                         b.get("markdown", "")) for b in badges]))
+    return 0, categories
+
+def export_catalog(source, output_path=DEFAULT_OUTPUT):
+    """
+    Write a catalog directory or combined JSON file in the binary format
+
+    Returns the number of badges written.
+    """
+    flags, categories = read_source(source)
+
+    strings = []
+    string_ids = {}
+
+    def intern(text):
+        string_id = string_ids.get(text)
+        if string_id is None:
+            string_id = string_ids[text] = len(strings)
+            strings.append(text)
+        return string_id
+
+    category_table = []
+    rows = []
+
+    for key, display, badges in categories:
+        category_table.append((intern(key), intern(display), len(rows), len(badges)))
+        for name, url, markdown in badges:
+            row_flags = 0
+            if len(markdown) > 1 and markdown.startswith('`') and markdown.endswith('`'):
+                markdown = markdown[1:-1]
+                row_flags |= ROW_BACKTICKS
+            markdown_id = NO_STRING if markdown == default_markdown(name, url) else intern(markdown)
+            prefix, label, query = split_url(url)
+            rows.append((intern(name), intern(prefix), intern(label), intern(query), markdown_id, row_flags))
+
+    encoded = [text.encode('utf-8') for text in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    categories_offset = struct.calcsize(HEADER_FORMAT)
+    rows_offset = categories_offset + len(category_table) * struct.calcsize(CATEGORY_FORMAT)
+    string_offsets_offset = rows_offset + len(rows) * struct.calcsize(ROW_FORMAT)
+    string_data_offset = string_offsets_offset + len(offsets) * 4
+
+    temp_path = output_path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, flags, len(category_table), len(rows),
+                            len(strings), categories_offset, rows_offset, string_offsets_offset,
+                            string_data_offset))
+        for entry in category_table:
+            f.write(struct.pack(CATEGORY_FORMAT, *entry))
+        for row in rows:
+            f.write(struct.pack(ROW_FORMAT, *row))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        for data in encoded:
+            f.write(data)
+    os.replace(temp_path, output_path)
+
+    return len(rows)
+
+def is_binary_catalog(path):
+    """
+    Check a file's magic bytes
+    """
+    if not os.path.isfile(path):
+        return False
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+class BinaryCatalog:
+    """
+    Read-only view of a binary catalog through mmap
+
+    Opening only reads the header and category table. Rows are unpacked
+    and strings decoded on access (decoded strings are cached), so looking
+    up one category never touches the rest of the file.
+    """
+
+    def __init__(self, path=DEFAULT_OUTPUT):
+        with open(path, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, self.flags, category_count, self.badge_count, self.string_count,
+         categories_offset, self.rows_offset, self.string_offsets_offset,
+         self.string_data_offset) = struct.unpack_from(HEADER_FORMAT, self.buffer)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a binary catalog")
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported binary catalog version {version}")
+
+        self._strings = {}
+        self.categories = {}
+        for index in range(category_count):
+            key_id, display_id, first, count = CATEGORY_STRUCT.unpack_from(
+                self.buffer, categories_offset + index * CATEGORY_STRUCT.size)
+            self.categories[self.string(key_id)] = (self.string(display_id), first, count)
+
+    def close(self):
+        self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.badge_count
+
+    def string(self, string_id):
+        """
+        Decode one string from the table
+        """
+        text = self._strings.get(string_id)
+        if text is None:
+            start, end = OFFSET_PAIR_STRUCT.unpack_from(self.buffer, self.string_offsets_offset + string_id * 4)
+            text = self._strings[string_id] = self.buffer[
+                self.string_data_offset + start:self.string_data_offset + end].decode('utf-8')
+        return text
+
+    def badge(self, row_index):
+        """
+        One badge as a dict with name, badge_url and markdown
+        """
+        return self._badge(ROW_STRUCT.unpack_from(self.buffer, self.rows_offset + row_index * ROW_STRUCT.size))
+
+    def _rows(self, first, count):
+        """
+        Unpack count consecutive rows starting at first
+        """
+        start = self.rows_offset + first * ROW_STRUCT.size
+        return ROW_STRUCT.iter_unpack(self.buffer[start:start + count * ROW_STRUCT.size])
+
+    def _badge(self, row):
+        name_id, prefix_id, label_id, query_id, markdown_id, row_flags = row
+        string = self.string
+
+        name = string(name_id)
+        url = string(prefix_id) + string(label_id) + string(query_id)
+        markdown = default_markdown(name, url) if markdown_id == NO_STRING else string(markdown_id)
+        if row_flags & ROW_BACKTICKS:
+            markdown = f"`{markdown}`"
+
+        return {"name": name, "badge_url": url, "markdown": markdown}
+
+    def category_name(self, key):
+        """
+        Display name of a category (raises KeyError for unknown keys)
+        """
+        return self.categories[key][0]
+
+    def get_category(self, key):
+        """
+        All badges of one category as a list of dicts
+        """
+        _, first, count = self.categories[key]
+        return [self._badge(row) for row in self._rows(first, count)]
+
+    def iter_badges(self, keys=None):
+        """
+        Yield (category key, badge) pairs in catalog order
+        """
+        for key in (self.categories if keys is None else keys):
+            _, first, count = self.categories[key]
+            for row in self._rows(first, count):
+                yield key, self._badge(row)
+
+def write_json(binary, output):
+    """
+    Convert a binary catalog back into the JSON it was exported from
+
+    Directory exports become a directory of category files, combined
+    exports a single {category: [badges]} file. Both are written in the
+    original layout, so an unchanged round trip is byte-identical.
+    """
+    if binary.flags & FLAG_CATALOG_DIR:
+        os.makedirs(output, exist_ok=True)
+        for key in binary.categories:
+            badges = [{"name": b["name"], "badge": b["badge_url"], "markdown": b["markdown"]}
+                      for b in binary.get_category(key)]
+            with open(os.path.join(output, f"{key}.json"), 'w', encoding='utf-8') as f:
+                json.dump({"category": binary.category_name(key), "badges": badges},
+                          f, indent=2, ensure_ascii=False)
+        return
+
+    data = {binary.category_name(key): binary.get_category(key) for key in binary.categories}
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+def main(argv=None):
+    """
+    Export a catalog to the binary format, or convert one back to JSON
+    """
+    parser = argparse.ArgumentParser(description="Convert the badge catalog to and from the binary format")
+    parser.add_argument("source", nargs="?", default=os.path.join(catalog.REPO_ROOT, "extractor",
+                                                                   "badges_categories.json"),
+                        help="category directory, combined JSON file or .bcat file "
+                             "(default: extractor/badges_categories.json)")
+    parser.add_argument("--output", "-o",
+                        help="where to write: the .bcat file when exporting (default: "
+                             "<source>.bcat), JSON file or directory when converting back")
+    args = parser.parse_args(argv)
+
+    if is_binary_catalog(args.source):
+        with BinaryCatalog(args.source) as binary:
+            if not args.output:
+                print(f"📦 {args.source}: {len(binary.categories)} categories, {len(binary)} badges, "
+                      f"{binary.string_count} strings")
+                return
+            write_json(binary, args.output)
+        print(f"✓ JSON written to {args.output}")
+        return
+
+    output = args.output or os.path.splitext(args.source.rstrip(os.sep))[0] + ".bcat"
+    count = export_catalog(args.source, output)
+    print(f"✓ {count} badges exported to {output} "
+          f"({os.path.getsize(output) / 1024:.1f} KB)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import os
+import json
+
+# Only os and json are imported up front so that importing the catalog stays
+# cheap; re and argparse are pulled in by the code paths that need them.
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CATALOG_DIR = os.path.join(REPO_ROOT, "utils", "badge_categories")
+README_EXTRACTOR = os.path.join(REPO_ROOT, "utils", "extractor.py")
+
+# The manifest sits beside the catalog directory rather than inside it, since
+# consumers of the catalog glob badge_categories/*.json as category files
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Where the badges array starts inside a category file
+BADGES_ARRAY_PATTERN = rb'"badges"\s*:\s*\['
+
+def category_key(display_name):
+    """
+    Category key (file name stem) of a display name like "🧑‍💻 Developer/Forums"
+
+    Same rule utils/extractor.py uses when writing the category files.
+    """
+    import re
+
+    name = re.sub(r'[^\w\s]', '', display_name).strip()
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name).lower()
+
+def category_files(catalog_dir=DEFAULT_CATALOG_DIR):
+    """
+    List the category JSON files in a catalog directory, sorted by name
+    """
+    return sorted(
+        os.path.join(catalog_dir, file) for file in os.listdir(catalog_dir)
+        if file.endswith(".json")
+    )
+
+def manifest_path(catalog_dir=DEFAULT_CATALOG_DIR):
+    """
+    Where the manifest of a catalog directory lives: <catalog_dir>.manifest.json
+    """
+    return os.path.normpath(catalog_dir) + MANIFEST_SUFFIX
+
+def build_manifest(catalog_dir=DEFAULT_CATALOG_DIR):
+    """
+    Build the catalog manifest by reading every category file once
+
+    Each entry records the file name, display name, badge count, file size
+    and the byte offset of the badges array, so loaders can jump straight
+    to the array without parsing anything else.
+    """
+    import re
+
+    badges_array = re.compile(BADGES_ARRAY_PATTERN)
+    categories = {}
+
+    for path in category_files(catalog_dir):
+        with open(path, 'rb') as f:
+            raw = f.read()
+
+        match = badges_array.search(raw)
+        data = json.loads(raw)
+        key = os.path.splitext(os.path.basename(path))[0]
+
+        categories[key] = {
+            "file": os.path.basename(path),
+            "category": data.get("category") or data.get("category_name") or key,
+            "badges_count": len(data.get("badges", [])),
+            "size": len(raw),
+            "badges_offset": match.end() - 1 if match else None
+        }
+
+    return {"categories": categories}
+
+def write_manifest(catalog_dir=DEFAULT_CATALOG_DIR):
+    """
+    Write <catalog_dir>.manifest.json next to the directory and return its path
+    """
+    manifest = build_manifest(catalog_dir)
+    path = manifest_path(catalog_dir)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+    _manifest_cache.pop(catalog_dir, None)
+    return path
+
+# Loaded manifests keyed by catalog_dir, and categories by (catalog_dir, name)
+_manifest_cache = {}
+_category_cache = {}
+
+def manifest_is_current(manifest, catalog_dir=DEFAULT_CATALOG_DIR):
+    """
+    Check a manifest against the directory listing and the files' sizes
+
+    Costs one listdir and a stat per category file, which is far cheaper
+    than the reads the manifest saves.
+    """
+    entries = manifest.get("categories", {})
+    files = {os.path.basename(path) for path in category_files(catalog_dir)}
+    if files != {info.get("file") for info in entries.values()}:
+        return False
+    return all(os.path.getsize(os.path.join(catalog_dir, info["file"])) == info.get("size")
+               for info in entries.values())
+
+def load_manifest(catalog_dir=DEFAULT_CATALOG_DIR):
+    """
+    Load the catalog manifest, rebuilding it in memory if it is missing or stale
+
+    A category file that was added, removed or resized since the manifest
+    was written means the manifest is rebuilt from the directory (but not
+    rewritten; run `catalog --write-manifest` for that).
+    """
+    if catalog_dir not in _manifest_cache:
+        try:
+            with open(manifest_path(catalog_dir), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            manifest = None
+        if manifest is None or not manifest_is_current(manifest, catalog_dir):
+            manifest = build_manifest(catalog_dir)
+        _manifest_cache[catalog_dir] = manifest
+    return _manifest_cache[catalog_dir]
+
+def category_names(catalog_dir=DEFAULT_CATALOG_DIR):
+    """
+    Return the category keys (file names without .json) in the catalog
+    """
+    return list(load_manifest(catalog_dir)["categories"])
+
+def category_info(name, catalog_dir=DEFAULT_CATALOG_DIR):
+    """
+    Return the manifest entry for a category without loading its badges
+    """
+    try:
+        return load_manifest(catalog_dir)["categories"][name]
+    except KeyError:
+        raise KeyError(f"Unknown badge category: {name}") from None
+
+def _read_badges(name, catalog_dir):
+    """
+    Read one category's badges, seeking straight to the badges array
+    """
+    info = category_info(name, catalog_dir)
+    path = os.path.join(catalog_dir, info["file"])
+    offset = info.get("badges_offset")
+
+    with open(path, 'rb') as f:
+        # Trust the offset only if the file has not changed size since
+        if offset is not None and os.fstat(f.fileno()).st_size == info.get("size"):
+            f.seek(offset)
+            raw = f.read()
+            if raw[:1] == b'[':
+                badges, _ = json.JSONDecoder().raw_decode(raw.decode('utf-8'))
+                return badges
+            f.seek(0)
+
+        return json.loads(f.read()).get("badges", [])
+
+def get_category(name, catalog_dir=DEFAULT_CATALOG_DIR):
+    """
+    Return the badges of one category, loading it on first access
+
+    Results are cached per category; treat the returned list as read-only.
+    """
+    key = (catalog_dir, name)
+    if key not in _category_cache:
+        _category_cache[key] = _read_badges(name, catalog_dir)
+    return _category_cache[key]
+
+def iter_badges(categories=None, catalog_dir=DEFAULT_CATALOG_DIR):
+    """
+    Yield (category, badge) pairs one category at a time
+
+    Categories that are not already cached are read, yielded and dropped
+    again, so iterating never holds the whole catalog in memory.
+    """
+    for name in categories or category_names(catalog_dir):
+        badges = _category_cache.get((catalog_dir, name))
+        if badges is None:
+            badges = _read_badges(name, catalog_dir)
+
+        for badge in badges:
+            yield name, badge
+
+def clear_cache():
+    """
+    Forget the cached manifest and categories
+    """
+    _manifest_cache.clear()
+    _category_cache.clear()
+
+def build_from_readme(readme_path, catalog_dir=DEFAULT_CATALOG_DIR):
+    """
+    Regenerate the category files from a badges README with utils/extractor.py
+    """
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("readme_extractor", README_EXTRACTOR)
+    readme_extractor = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(readme_extractor)
+
+    with open(readme_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    readme_extractor.save_categories(readme_extractor.parse_markdown_badges(content), catalog_dir)
+    clear_cache()
+
+def main(argv=None):
+    """
+    Write the catalog manifest or print a category overview
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Badge catalog manifest tools")
+    parser.add_argument("--catalog-dir", default=DEFAULT_CATALOG_DIR,
+                        help="directory holding the category JSON files")
+    parser.add_argument("--build", metavar="README",
+                        help="rebuild the category files from a badges README first")
+    parser.add_argument("--write-manifest", action="store_true",
+                        help=f"(re)generate <catalog-dir>{MANIFEST_SUFFIX} for the catalog")
+    args = parser.parse_args(argv)
+
+    if args.build:
+        build_from_readme(args.build, args.catalog_dir)
+        args.write_manifest = True
+
+    if args.write_manifest:
+        manifest_path = write_manifest(args.catalog_dir)
+        print(f"✓ Manifest saved to {manifest_path}")
+        return
+
+    for name in category_names(args.catalog_dir):
+        info = category_info(name, args.catalog_dir)
+        print(f"  - {info['category']}: {info['badges_count']} badges ({info['file']})")
+
+if __name__ == "__main__":
+    main()
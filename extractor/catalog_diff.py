@@ -0,0 +1,210 @@
+import os
+import re
+import json
+import argparse
+from collections import deque
+
+from . import catalog
+
+NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]')
+
+def canonical_id(name):
+    """
+    Stable badge key: the name lowercased with everything but [a-z0-9] removed
+    """
+    return NON_ALNUM_PATTERN.sub('', name.lower())
+
+# Pairing passes from strictest to loosest, as keys over (category, name, url).
+# Exact names win over canonical ids, so "C#" never pairs with "C++" while
+# both exist; within a pass the same category and then the same URL win ties.
+PAIRING_KEYS = (
+    lambda record: (record[1], record[0], record[2]),
+    lambda record: (record[1], record[0]),
+    lambda record: (record[1], record[2]),
+    lambda record: (record[1],),
+    lambda record: (canonical_id(record[1]), record[0], record[2]),
+    lambda record: (canonical_id(record[1]), record[0]),
+    lambda record: (canonical_id(record[1]), record[2]),
+    lambda record: (canonical_id(record[1]),),
+    # Same image under another name: a rename
+    lambda record: (record[2],),
+)
+
+def _badge_url(badge):
+    """
+    The badge image URL, whichever key the snapshot format uses
+    """
+    return badge.get("badge_url") or badge.get("badge", "")
+
+def _badge_name(badge):
+    """
+    The badge display name across the catalog and extractor formats
+    """
+    return badge.get("name") or badge.get("technology") or badge.get("alt_text", "")
+
+def load_snapshot(path):
+    """
+    Load a catalog snapshot as a list of (category, name, url) records
+
+    Accepts a directory of category files (utils/badge_categories), a
+    combined {category: [badges]} file (badges_categories.json) or a
+    single {"category": ..., "badges": [...]} file. Display names such as
+    "📋 Languages" are mapped to their catalog key ("languages"), so the
+    formats can be diffed against each other.
+    """
+    records = []
+
+    if os.path.isdir(path):
+        # Read the files directly: a snapshot's manifest may be stale
+        for file_path in catalog.category_files(path):
+            category = os.path.splitext(os.path.basename(file_path))[0]
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for badge in json.load(f).get("badges", []):
+                    records.append((category, _badge_name(badge), _badge_url(badge)))
+        return records
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if isinstance(data.get("badges"), list):
+        category = data.get("category") or data.get("category_name") or ""
+        data = {category: data["badges"]}
+
+    for category, badges in data.items():
+        key = catalog.category_key(category)
+        for badge in badges:
+            records.append((key, _badge_name(badge), _badge_url(badge)))
+
+    return records
+
+def diff_snapshots(old_records, new_records):
+    """
+    Compare two snapshots in linear time
+
+    Badges are paired in passes over PAIRING_KEYS: exact name first, then
+    canonical id, and finally a shared URL (a rename). Each pass indexes
+    the still-unpaired old badges in a dict of deques, so a lookup is O(1)
+    however many badges share a name. Paired badges are reported as
+    renamed, moved and/or URL-changed when those fields differ; whatever
+    is left unpaired was added or removed.
+    """
+    old_records = list(old_records)
+    paired = [False] * len(old_records)
+    unmatched_new = list(new_records)
+    changes = {"added": [], "removed": [], "renamed": [], "moved": [], "url_changed": []}
+
+    for key in PAIRING_KEYS:
+        if not unmatched_new:
+            break
+        old_by_key = {}
+        for index, record in enumerate(old_records):
+            if not paired[index]:
+                old_by_key.setdefault(key(record), deque()).append(index)
+
+        still_unmatched = []
+        for record in unmatched_new:
+            candidates = old_by_key.get(key(record))
+            if candidates:
+                index = candidates.popleft()
+                paired[index] = True
+                _record_change(changes, old_records[index], record)
+            else:
+                still_unmatched.append(record)
+        unmatched_new = still_unmatched
+
+    changes["added"] = [_as_badge(record) for record in unmatched_new]
+    changes["removed"] = [_as_badge(record) for index, record in enumerate(old_records) if not paired[index]]
+
+    for entries in changes.values():
+        entries.sort(key=lambda entry: tuple(entry.values()))
+
+    summary = {key: len(entries) for key, entries in changes.items()}
+    return {"summary": summary, **changes}
+
+def _as_badge(record):
+    """
+    Turn a (category, name, url) record into a changelog entry
+    """
+    category, name, url = record
+    return {"category": category, "name": name, "badge_url": url}
+
+def _record_change(changes, old, new):
+    """
+    Classify a paired old/new badge
+    """
+    old_category, old_name, old_url = old
+    new_category, new_name, new_url = new
+
+    if old_name != new_name:
+        changes["renamed"].append({"category": new_category, "from": old_name, "to": new_name})
+    if old_category != new_category:
+        changes["moved"].append({"name": new_name, "from": old_category, "to": new_category})
+    if old_url != new_url:
+        changes["url_changed"].append({
+            "category": new_category, "name": new_name, "from": old_url, "to": new_url
+        })
+
+def render_markdown(changes, title="Badge catalog changes"):
+    """
+    Render a diff as a markdown changelog
+    """
+    lines = [f"## {title}", ""]
+    summary = changes["summary"]
+
+    if not any(summary.values()):
+        lines.append("No changes.")
+        return "\n".join(lines) + "\n"
+
+    if summary["added"]:
+        lines.append(f"### Added ({summary['added']})")
+        lines += [f"- **{b['name']}** ({b['category']}) ![{b['name']}]({b['badge_url']})"
+                  for b in changes["added"]]
+        lines.append("")
+    if summary["removed"]:
+        lines.append(f"### Removed ({summary['removed']})")
+        lines += [f"- **{b['name']}** ({b['category']})" for b in changes["removed"]]
+        lines.append("")
+    if summary["renamed"]:
+        lines.append(f"### Renamed ({summary['renamed']})")
+        lines += [f"- {c['from']} → **{c['to']}** ({c['category']})" for c in changes["renamed"]]
+        lines.append("")
+    if summary["moved"]:
+        lines.append(f"### Moved ({summary['moved']})")
+        lines += [f"- **{c['name']}**: {c['from']} → {c['to']}" for c in changes["moved"]]
+        lines.append("")
+    if summary["url_changed"]:
+        lines.append(f"### Badge URL changed ({summary['url_changed']})")
+        lines += [f"- **{c['name']}** ({c['category']}): `{c['from']}` → `{c['to']}`"
+                  for c in changes["url_changed"]]
+        lines.append("")
+
+    return "\n".join(lines)
+
+def main(argv=None):
+    """
+    Diff two catalog snapshots and print or save the changelog
+    """
+    parser = argparse.ArgumentParser(description="Diff two badge catalog snapshots")
+    parser.add_argument("old", help="old snapshot: category directory or JSON file")
+    parser.add_argument("new", help="new snapshot: category directory or JSON file")
+    parser.add_argument("--format", choices=("markdown", "json"), default="markdown",
+                        help="changelog format (default: markdown)")
+    parser.add_argument("--output", "-o", help="write the changelog here instead of stdout")
+    args = parser.parse_args(argv)
+
+    changes = diff_snapshots(load_snapshot(args.old), load_snapshot(args.new))
+
+    if args.format == "json":
+        text = json.dumps(changes, indent=2, ensure_ascii=False) + "\n"
+    else:
+        text = render_markdown(changes)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+        print(f"✓ Changelog saved to {args.output}")
+    else:
+        print(text, end="")
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,15 @@ import os
 import json
 import re
 import glob
+import argparse
 from pathlib import Path
 
+try:
+    from .stats import BadgeStats
+except ImportError:
+    # Run as a plain script from the extractor directory
+    from stats import BadgeStats
+
 def find_markdown_files(directory="."):
     """
     Find all markdown files in the specified directory
@@ -266,19 +273,17 @@ def save_badges_to_json(categories_badges, output_dir="badge_categories"):
 def generate_summary(categories_badges, output_dir="badge_categories"):
     """
     Generate a summary file with overview of all categories
+
+    Badges are streamed through a BadgeStats aggregator in one pass.
     """
-    total_badges = sum(len(badges) for badges in categories_badges.values())
-    categories_with_badges = {cat: len(badges) for cat, badges in categories_badges.items() if badges}
+    stats = BadgeStats()
+    for category, badges in categories_badges.items():
+        stats.add_category(category, badges)
     
     summary = {
-        "total_categories_with_badges": len(categories_with_badges),
-        "total_badges_found": total_badges,
-        "categories_breakdown": categories_with_badges,
-        "files_processed": list(set(
-            badge["source_file"] 
-            for badges in categories_badges.values() 
-            for badge in badges
-        ))
+        "total_categories_with_badges": len(stats.categories),
+        "categories_breakdown": dict(stats.categories),
+        **stats.summary()
     }
     
     summary_path = os.path.join(output_dir, "extraction_summary.json")
@@ -288,16 +293,117 @@ def generate_summary(categories_badges, output_dir="badge_categories"):
     print(f"✓ Summary saved to {summary_path}")
     return summary_path
 
-def main():
+# Field order of the compact tuples workers send back to the parent
+BADGE_FIELDS = ("technology", "badge_url", "markdown", "alt_text",
+                "source_file", "line_number")
+
+# Files smaller than this are batched together into one worker task
+CHUNK_TARGET_BYTES = 4 * 1024 * 1024
+
+def extract_file_categories(file_path):
+    """
+    Extract categorized badges from a single file, or None if unreadable
+    """
+    content = read_markdown_file(file_path)
+    if not content:
+        return None
+    
+    return extract_badges_by_exact_categories(content, os.path.basename(file_path))
+
+def chunk_files_by_size(file_paths, target_bytes=CHUNK_TARGET_BYTES):
+    """
+    Group files into worker chunks of about target_bytes, biggest first
+    """
+    chunks = []
+    current = []
+    current_size = 0
+    
+    for index, file_path in enumerate(file_paths):
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            size = 0
+        
+        if size >= target_bytes:
+            chunks.append((size, [(index, file_path)]))
+            continue
+        
+        if current and current_size + size > target_bytes:
+            chunks.append((current_size, current))
+            current = []
+            current_size = 0
+        
+        current.append((index, file_path))
+        current_size += size
+    
+    if current:
+        chunks.append((current_size, current))
+    
+    chunks.sort(key=lambda chunk: chunk[0], reverse=True)
+    return [chunk for _, chunk in chunks]
+
+def parse_file_chunk(chunk):
+    """
+    Worker entry point: parse a chunk, keeping only non-empty categories
+    """
+    results = []
+    
+    for index, file_path in chunk:
+        file_categories = extract_file_categories(file_path)
+        if file_categories is not None:
+            file_categories = {
+                category: [tuple(badge[field] for field in BADGE_FIELDS) for badge in badges]
+                for category, badges in file_categories.items() if badges
+            }
+        results.append((index, file_categories))
+    
+    return results
+
+def parse_files_parallel(file_paths, jobs):
+    """
+    Parse files across a process pool, returning results in input order
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    file_results = [None] * len(file_paths)
+    
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for chunk_results in executor.map(parse_file_chunk, chunk_files_by_size(file_paths)):
+            for index, file_categories in chunk_results:
+                if file_categories is not None:
+                    file_categories = {
+                        category: [dict(zip(BADGE_FIELDS, row)) for row in rows]
+                        for category, rows in file_categories.items()
+                    }
+                file_results[index] = file_categories
+    
+    return file_results
+
+def parse_args(argv=None):
+    """
+    Parse command line options
+    """
+    parser = argparse.ArgumentParser(description="Extract badges using exact categories")
+    parser.add_argument("directory", nargs="?", default=".",
+                        help="directory to scan (default: current directory)")
+    parser.add_argument("--output", "-o", default="badge_categories",
+                        help="directory for the JSON output (default: badge_categories)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="parse files across N worker processes (default: 1)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """
     Main function to extract badges using exact categories
     """
-    print("🔍 Scanning for markdown files in current directory...")
+    args = parse_args(argv)
     
-    markdown_files = find_markdown_files()
+    print(f"🔍 Scanning for markdown files in {args.directory}...")
+    
+    markdown_files = find_markdown_files(args.directory)
     
     if not markdown_files:
-        print("❌ No markdown files found in the current directory.")
+        print(f"❌ No markdown files found in {args.directory}.")
         return
     
     print(f"📁 Found {len(markdown_files)} markdown file(s):")
@@ -321,13 +427,20 @@ def main():
     for category in exact_categories:
         all_categories_badges[category] = []
     
-    for file_path in markdown_files:
+    if args.jobs > 1:
+        print(f"\n⚙️  Parsing with {args.jobs} worker processes...")
+        file_results = parse_files_parallel(markdown_files, args.jobs)
+    else:
+        file_results = None
+    
+    for index, file_path in enumerate(markdown_files):
         print(f"\n📖 Reading {file_path}...")
-        content = read_markdown_file(file_path)
+        if file_results is None:
+            file_categories = extract_file_categories(file_path)
+        else:
+            file_categories = file_results[index]
         
-        if content:
-            file_categories = extract_badges_by_exact_categories(content, os.path.basename(file_path))
-            
+        if file_categories is not None:
             # Merge badges from this file into the main collection
             for category, badges in file_categories.items():
                 all_categories_badges[category].extend(badges)
@@ -347,10 +460,10 @@ def main():
     
     # Save to JSON files
     print("\n💾 Saving badges to JSON files by category...")
-    saved_files = save_badges_to_json(all_categories_badges)
+    saved_files = save_badges_to_json(all_categories_badges, args.output)
     
     # Generate summary
-    generate_summary(all_categories_badges)
+    generate_summary(all_categories_badges, args.output)
     
     # Print final statistics
     categories_with_badges = {cat: len(badges) for cat, badges in all_categories_badges.items() if badges}
@@ -358,7 +471,7 @@ def main():
     print(f"\n✅ Extraction completed!")
     print(f"📊 Total badges extracted: {total_badges}")
     print(f"📁 Categories with badges: {len(categories_with_badges)}")
-    print(f"📄 JSON files saved to: badge_categories/")
+    print(f"📄 JSON files saved to: {args.output}/")
     
     print("\n📋 Categories with badges found:")
     for category, count in categories_with_badges.items():
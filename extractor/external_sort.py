@@ -0,0 +1,125 @@
+import os
+import json
+import heapq
+import shutil
+import tempfile
+from operator import itemgetter
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+# Most runs merged at once; beyond this, runs are first merged in batches
+MAX_MERGE_FANIN = 128
+
+# Rough per-record overhead of the dict, key tuple and list slot
+RECORD_OVERHEAD_BYTES = 600
+
+def badge_sort_key(category, badge):
+    """
+    Total order of badge records: category, technology, then the badge itself
+
+    Identical badges (same category, URL and markdown) always sort next to
+    each other, which is what lets the merge drop duplicates in one pass.
+    """
+    technology = badge.get("technology", "")
+    return (category, technology.lower(), technology, badge.get("badge_url", ""),
+            badge.get("markdown", ""), badge.get("source_file", ""), badge.get("section", ""),
+            badge.get("line_number", 0))
+
+def _estimate_size(badge):
+    """
+    Approximate in-memory footprint of a buffered badge record
+    """
+    return RECORD_OVERHEAD_BYTES + 2 * sum(len(value) for value in badge.values() if isinstance(value, str))
+
+def _read_run(path):
+    """
+    Stream (sort key, category, badge) records back from a run file
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            category, badge = json.loads(line)
+            yield badge_sort_key(category, badge), category, badge
+
+class ExternalBadgeSorter:
+    """
+    Sort and deduplicate badge records that may not fit in memory
+
+    Records are buffered until their estimated size reaches memory_budget,
+    then sorted and spilled to a JSON-lines run file in a private temporary
+    directory. merged() k-way merges the runs (plus whatever is still
+    buffered) with heapq.merge, so only one record per run is held at a
+    time. Use as a context manager to remove the run files afterwards.
+    """
+
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET, temp_dir=None):
+        self.memory_budget = memory_budget
+        self.temp_dir = tempfile.mkdtemp(prefix="badge-runs-", dir=temp_dir)
+        self.buffer = []
+        self.buffer_bytes = 0
+        self.runs = []
+        self.spilled_runs = 0
+        self.added = 0
+        self.duplicates = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def add(self, category, badge):
+        self.buffer.append((badge_sort_key(category, badge), category, badge))
+        self.buffer_bytes += _estimate_size(badge)
+        self.added += 1
+        if self.buffer_bytes >= self.memory_budget:
+            self._spill()
+
+    def _new_run_path(self):
+        path = os.path.join(self.temp_dir, f"run-{self.spilled_runs:06d}.jsonl")
+        self.spilled_runs += 1
+        return path
+
+    def _write_run(self, records):
+        path = self._new_run_path()
+        with open(path, 'w', encoding='utf-8') as f:
+            for _, category, badge in records:
+                f.write(json.dumps([category, badge], ensure_ascii=False))
+                f.write('\n')
+        return path
+
+    def _spill(self):
+        self.buffer.sort(key=itemgetter(0))
+        self.runs.append(self._write_run(self.buffer))
+        self.buffer = []
+        self.buffer_bytes = 0
+
+    def _reduce_runs(self):
+        """
+        Merge runs in batches until a single merge can open them all
+        """
+        while len(self.runs) > MAX_MERGE_FANIN:
+            batch, self.runs = self.runs[:MAX_MERGE_FANIN], self.runs[MAX_MERGE_FANIN:]
+            merged = heapq.merge(*(_read_run(path) for path in batch), key=itemgetter(0))
+            self.runs.append(self._write_run(merged))
+            for path in batch:
+                os.remove(path)
+
+    def merged(self):
+        """
+        Yield (category, badge) in sorted order with duplicates removed
+        """
+        self._reduce_runs()
+        self.buffer.sort(key=itemgetter(0))
+        sources = [_read_run(path) for path in self.runs] + [iter(self.buffer)]
+
+        previous = None
+        for _, category, badge in heapq.merge(*sources, key=itemgetter(0)):
+            identity = (category, badge.get("badge_url"), badge.get("markdown"))
+            if identity == previous:
+                self.duplicates += 1
+                continue
+            previous = identity
+            yield category, badge
@@ -0,0 +1,211 @@
+import os
+import re
+import json
+import argparse
+from urllib.parse import unquote_plus
+
+from . import catalog
+
+# Common spellings that trigrams alone can't bridge
+ALIASES = {
+    "vs code": "visual studio code",
+    "vscode": "visual studio code",
+    "postgres": "postgresql",
+    "k8s": "kubernetes",
+    "js": "javascript",
+    "ts": "typescript",
+    "golang": "go",
+    "py": "python",
+    "mongo": "mongodb",
+    "gh": "github",
+}
+
+LOGO_PATTERN = re.compile(r'[?&]logo=([^&]*)')
+NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]+')
+
+def normalize(text):
+    """
+    Lowercase text and reduce it to space-separated [a-z0-9] words
+
+    "+" and "#" become "plus" and "sharp" so C++ and C# survive, and dots
+    are dropped so "node.js" and "nodejs" normalize the same way.
+    """
+    text = text.lower().replace('+', 'plus').replace('#', 'sharp').replace('.', '')
+    return NON_ALNUM_PATTERN.sub(' ', text).strip()
+
+def trigrams(key):
+    """
+    Padded character trigrams of a normalized key
+    """
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def badge_keys(name, badge_url):
+    """
+    Lookup keys for a badge: its name plus aliases from the shields logo= slug
+    """
+    keys = {normalize(name)}
+
+    match = LOGO_PATTERN.search(badge_url)
+    if match:
+        slug = normalize(unquote_plus(match.group(1)))
+        keys.add(slug)
+        # simple-icons spells dots out: nodedotjs, dotnet
+        if "dot" in slug:
+            keys.add(slug.replace("dot", ""))
+
+    keys |= {key.replace(' ', '') for key in keys}
+    keys.discard('')
+    return sorted(keys)
+
+def build_index(catalog_dir=catalog.DEFAULT_CATALOG_DIR):
+    """
+    Build the trigram index over every badge in the catalog
+
+    The index is a plain dict so it can be saved as JSON: "entries" holds
+    [category, name, badge_url, markdown] rows, "keys" holds
+    [key, entry_id, trigram_count] rows and "postings" maps each trigram
+    to the key ids containing it.
+    """
+    entries = []
+    keys = []
+    postings = {}
+
+    for category, badge in catalog.iter_badges(catalog_dir=catalog_dir):
+        name = badge.get("name", "")
+        badge_url = badge.get("badge") or badge.get("badge_url", "")
+        entry_id = len(entries)
+        entries.append([category, name, badge_url, badge.get("markdown", "").strip('`')])
+
+        for key in badge_keys(name, badge_url):
+            grams = trigrams(key)
+            key_id = len(keys)
+            keys.append([key, entry_id, len(grams)])
+            for gram in grams:
+                postings.setdefault(gram, []).append(key_id)
+
+    return _prepare({"manifest": catalog.load_manifest(catalog_dir), "entries": entries,
+                     "keys": keys, "postings": postings})
+
+def _prepare(index):
+    """
+    Add the in-memory exact-match table to a built or loaded index
+    """
+    exact = {}
+    for key_id, (key, _, _) in enumerate(index["keys"]):
+        exact.setdefault(key, []).append(key_id)
+    index["exact"] = exact
+    return index
+
+def save_index(index, index_path):
+    """
+    Write an index to disk so later processes can skip building it
+    """
+    data = {field: index[field] for field in ("manifest", "entries", "keys", "postings")}
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+def load_index(index_path=None, catalog_dir=catalog.DEFAULT_CATALOG_DIR):
+    """
+    Load a prebuilt index, rebuilding it if missing or the catalog changed
+    """
+    if index_path and os.path.exists(index_path):
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get("manifest") == catalog.load_manifest(catalog_dir):
+            return _prepare(index)
+
+    index = build_index(catalog_dir)
+    if index_path:
+        save_index(index, index_path)
+    return index
+
+def search(index, query, limit=5, min_score=0.3):
+    """
+    Rank catalog badges against a free-text technology name
+
+    Scores are the Dice coefficient of trigram sets (1.0 for an exact key
+    match), taking the best key per badge. Returns a list of dicts with
+    score, category, name, badge_url and markdown.
+    """
+    query_key = normalize(query)
+    query_key = ALIASES.get(query_key, query_key)
+    if not query_key:
+        return []
+
+    scores = {}
+    exact = index["exact"]
+    for key_id in exact.get(query_key, []) + exact.get(query_key.replace(' ', ''), []):
+        scores[index["keys"][key_id][1]] = 1.0
+
+    query_grams = trigrams(query_key)
+    shared = {}
+    for gram in query_grams:
+        for key_id in index["postings"].get(gram, ()):
+            shared[key_id] = shared.get(key_id, 0) + 1
+
+    keys = index["keys"]
+    for key_id, count in shared.items():
+        _, entry_id, gram_count = keys[key_id]
+        score = 2.0 * count / (len(query_grams) + gram_count)
+        if score > scores.get(entry_id, 0.0):
+            scores[entry_id] = score
+
+    ranked = sorted(
+        (item for item in scores.items() if item[1] >= min_score),
+        key=lambda item: (-item[1], index["entries"][item[0]][1].lower())
+    )[:limit]
+
+    results = []
+    for entry_id, score in ranked:
+        category, name, badge_url, markdown = index["entries"][entry_id]
+        results.append({"score": round(score, 3), "category": category, "name": name,
+                        "badge_url": badge_url, "markdown": markdown})
+    return results
+
+def resolve_many(index, names, limit=1, min_score=0.3):
+    """
+    Resolve a batch of names, returning {name: matches}
+    """
+    return {name: search(index, name, limit, min_score) for name in names}
+
+def main(argv=None):
+    """
+    Resolve technology names to catalog badges
+    """
+    parser = argparse.ArgumentParser(description="Resolve technology names to catalog badges")
+    parser.add_argument("names", nargs="*", help="technology names to look up")
+    parser.add_argument("--file", "-f", help="read names from this file, one per line")
+    parser.add_argument("--limit", "-n", type=int, default=3, help="matches per name (default: 3)")
+    parser.add_argument("--min-score", type=float, default=0.3,
+                        help="drop matches scoring below this (default: 0.3)")
+    parser.add_argument("--catalog-dir", default=catalog.DEFAULT_CATALOG_DIR,
+                        help="directory holding the category JSON files")
+    parser.add_argument("--index", help="prebuilt index file; built and saved here if missing or stale")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    names = list(args.names)
+    if args.file:
+        with open(args.file, 'r', encoding='utf-8') as f:
+            names += [line.strip() for line in f if line.strip()]
+    if not names:
+        parser.error("no names given")
+
+    index = load_index(args.index, args.catalog_dir)
+    results = resolve_many(index, names, args.limit, args.min_score)
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+
+    for name, matches in results.items():
+        if not matches:
+            print(f"❌ {name}: no match")
+            continue
+        print(f"🔎 {name}:")
+        for match in matches:
+            print(f"  {match['score']:.2f}  {match['name']} ({match['category']})")
+
+if __name__ == "__main__":
+    main()
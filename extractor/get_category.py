@@ -1,5 +1,7 @@
+import os
 import re
 import json
+import argparse
 
 def extract_badge_categories(readme_content):
     """
@@ -47,9 +49,22 @@ def extract_badges_from_section(section_content):
     
     return badges
 
-def main():
+def parse_args(argv=None):
+    """
+    Parse command line options
+    """
+    parser = argparse.ArgumentParser(description="Summarize the badge categories of a README")
+    parser.add_argument("readme", nargs="?", default="README.md",
+                        help="README to read (default: README.md)")
+    parser.add_argument("--output", "-o", default=".",
+                        help="directory for the JSON output (default: current directory)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    
     # Read the README.md file
-    with open('README.md', 'r', encoding='utf-8') as file:
+    with open(args.readme, 'r', encoding='utf-8') as file:
         content = file.read()
     
     # Find the start of the badges section
@@ -70,20 +85,22 @@ def main():
         print(f"  - {category_name}: {len(badges)} badges")
     
     # Save to JSON file
-    with open('badges_categories.json', 'w', encoding='utf-8') as json_file:
+    categories_path = os.path.join(args.output, 'badges_categories.json')
+    with open(categories_path, 'w', encoding='utf-8') as json_file:
         json.dump(categories, json_file, indent=2, ensure_ascii=False)
     
-    print(f"\nData saved to badges_categories.json")
+    print(f"\nData saved to {categories_path}")
     
     # Also create a simplified version with just category names and counts
     category_summary = {
         category: len(badges) for category, badges in categories.items()
     }
     
-    with open('categories_summary.json', 'w', encoding='utf-8') as summary_file:
+    summary_path = os.path.join(args.output, 'categories_summary.json')
+    with open(summary_path, 'w', encoding='utf-8') as summary_file:
         json.dump(category_summary, summary_file, indent=2, ensure_ascii=False)
     
-    print(f"Summary saved to categories_summary.json")
+    print(f"Summary saved to {summary_path}")
 
 if __name__ == "__main__":
     main()
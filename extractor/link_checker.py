@@ -0,0 +1,209 @@
+import os
+import json
+import time
+import argparse
+import tempfile
+import threading
+from urllib.parse import urlsplit
+
+from . import catalog
+from .catalog_diff import load_snapshot
+
+DEFAULT_CACHE = ".badge_link_cache.json"
+DEFAULT_TTL = 24 * 60 * 60
+VALID_CONTENT_TYPES = ("image/svg+xml",)
+
+# Status codes servers use when they don't support HEAD; retry those with GET
+HEAD_UNSUPPORTED = (403, 405, 501)
+
+def load_cache(cache_path):
+    """
+    Load cached results keyed by requested URL, or an empty cache
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_cache(cache_path, cache):
+    """
+    Atomically write the result cache
+    """
+    directory = os.path.dirname(os.path.abspath(cache_path))
+    fd, temp_path = tempfile.mkstemp(prefix=".link-cache-", dir=directory)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, ensure_ascii=False, sort_keys=True)
+    os.replace(temp_path, cache_path)
+
+def rewrite_url(url, rewrites):
+    """
+    Apply ORIGIN=REPLACEMENT prefix rewrites, e.g. to hit a local stand-in server
+    """
+    for origin, replacement in rewrites:
+        if url.startswith(origin):
+            return replacement + url[len(origin):]
+    return url
+
+def parse_rewrites(values):
+    """
+    Parse ORIGIN=REPLACEMENT options into (origin, replacement) pairs
+    """
+    rewrites = []
+    for value in values:
+        origin, sep, replacement = value.partition('=')
+        if not sep or not origin or not replacement:
+            raise argparse.ArgumentTypeError(f"expected ORIGIN=REPLACEMENT, got {value!r}")
+        rewrites.append((origin, replacement))
+    return rewrites
+
+def check_url(session, url, timeout):
+    """
+    Check that a badge URL answers 200 with an SVG body
+    """
+    import requests
+
+    try:
+        response = session.head(url, timeout=timeout, allow_redirects=True)
+        if response.status_code in HEAD_UNSUPPORTED:
+            response = session.get(url, timeout=timeout, allow_redirects=True, stream=True)
+            response.close()
+    except requests.RequestException as e:
+        return {"ok": False, "status": None, "content_type": None, "error": str(e)}
+
+    status = response.status_code
+    content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+
+    if status != 200:
+        error = f"HTTP {status}"
+    elif content_type not in VALID_CONTENT_TYPES:
+        error = f"unexpected content type: {content_type or 'none'}"
+    else:
+        error = None
+
+    return {"ok": error is None, "status": status, "content_type": content_type, "error": error}
+
+def check_links(urls, cache, ttl=DEFAULT_TTL, jobs=16, per_host=4, timeout=10, rewrites=()):
+    """
+    Check every URL whose cached result is missing or older than ttl
+
+    Requests go out on a thread pool over one pooled keep-alive session,
+    with at most per_host requests in flight to any single host. Results
+    are cached under the URL actually requested (after rewrites), so runs
+    against a stand-in server never answer for the real host. Transport
+    failures (timeouts, DNS or connection errors, recorded with status None)
+    are kept for this run's report but re-checked on the next one, so a
+    network blip doesn't mark badges broken for a whole ttl. Returns the
+    number of URLs checked.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from concurrent.futures import ThreadPoolExecutor
+
+    now = time.time()
+    stale = sorted({
+        target for target in (rewrite_url(url, rewrites) for url in set(urls))
+        if target not in cache or cache[target].get("status") is None
+        or now - cache[target].get("checked_at", 0) > ttl
+    })
+    if not stale:
+        return 0
+
+    hosts = {urlsplit(target).netloc for target in stale}
+    host_slots = {host: threading.Semaphore(per_host) for host in hosts}
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=len(hosts), pool_maxsize=per_host)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    def check(target):
+        with host_slots[urlsplit(target).netloc]:
+            result = check_url(session, target, timeout)
+        result["checked_at"] = time.time()
+        return target, result
+
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for target, result in executor.map(check, stale):
+                cache[target] = result
+    finally:
+        session.close()
+
+    return len(stale)
+
+def build_report(records, results, rewrites=()):
+    """
+    Group link results by category: counts plus the broken badges
+
+    results is keyed by requested URL, i.e. after rewrites.
+    """
+    report = {}
+
+    for category, name, url in records:
+        entry = report.setdefault(category, {"badges": 0, "ok": 0, "broken": []})
+        entry["badges"] += 1
+        result = results.get(rewrite_url(url, rewrites), {})
+        if result.get("ok"):
+            entry["ok"] += 1
+        else:
+            entry["broken"].append({"name": name, "badge_url": url, "error": result.get("error")})
+
+    return dict(sorted(report.items()))
+
+def main(argv=None):
+    """
+    Check catalog badge URLs and print a per-category report
+    """
+    parser = argparse.ArgumentParser(description="Check that catalog badge URLs still resolve to SVGs")
+    parser.add_argument("sources", nargs="*", default=[catalog.DEFAULT_CATALOG_DIR],
+                        help="category directories or catalog JSON files "
+                             "(default: utils/badge_categories)")
+    parser.add_argument("--cache", default=DEFAULT_CACHE,
+                        help=f"result cache file (default: {DEFAULT_CACHE})")
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL,
+                        help="seconds before a cached result is re-checked (default: 1 day)")
+    parser.add_argument("--jobs", "-j", type=int, default=16,
+                        help="concurrent requests overall (default: 16)")
+    parser.add_argument("--per-host", type=int, default=4,
+                        help="concurrent requests per host (default: 4)")
+    parser.add_argument("--timeout", type=float, default=10, help="request timeout in seconds")
+    parser.add_argument("--rewrite", action="append", default=[], metavar="ORIGIN=REPLACEMENT",
+                        help="rewrite URL prefixes, e.g. https://img.shields.io=http://127.0.0.1:8000")
+    parser.add_argument("--output", "-o", help="also save the report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        rewrites = parse_rewrites(args.rewrite)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    records = [record for source in args.sources for record in load_snapshot(source)]
+    urls = {url for _, _, url in records}
+
+    cache = load_cache(args.cache)
+    print(f"🔗 {len(records)} badges, {len(urls)} unique URLs")
+    checked = check_links(urls, cache, args.ttl, args.jobs, args.per_host, args.timeout, rewrites)
+    save_cache(args.cache, cache)
+    targets = {rewrite_url(url, rewrites) for url in urls}
+    print(f"  Checked {checked} URL(s), reused {len(targets) - checked} cached")
+
+    report = build_report(records, cache, rewrites)
+    broken_total = 0
+    for category, entry in report.items():
+        broken_total += len(entry["broken"])
+        if entry["broken"]:
+            print(f"  ❌ {category}: {len(entry['broken'])} of {entry['badges']} broken")
+            for badge in entry["broken"]:
+                print(f"      - {badge['name']}: {badge['error']}")
+        else:
+            print(f"  ✓ {category}: {entry['badges']} ok")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"✓ Report saved to {args.output}")
+
+    return 1 if broken_total else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
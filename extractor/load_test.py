@@ -0,0 +1,488 @@
+import os
+import re
+import json
+import time
+import argparse
+from urllib.parse import urlsplit
+
+DEFAULT_URL = "http://localhost:8080/"
+
+# The page's hard-coded list of category files: `const categoryFiles = [...]`
+CATEGORY_FILES_PATTERN = re.compile(r'categoryFiles\s*=\s*\[(.*?)\]', re.DOTALL)
+QUOTED_NAME_PATTERN = re.compile(r'[\'"]([^\'"]+\.json)[\'"]')
+CATEGORY_PREFIX = "badge_categories/"
+
+# What a browser sends; without Accept-Encoding nginx never uses the .gz files
+BROWSER_HEADERS = "Accept: */*\r\nAccept-Encoding: {encodings}\r\n"
+
+STUB_SVG = (b'<svg xmlns="http://www.w3.org/2000/svg" width="90" height="28">'
+            b'<rect width="90" height="28" fill="#555"/></svg>')
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile of an already sorted list
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+async def http_get(reader, writer, host, path, extra_headers="", method="GET"):
+    """
+    Send one keep-alive request and read the response
+
+    Returns (status, headers, body bytes) with header names lowercased.
+    Handles Content-Length and chunked bodies, and bodiless 204/304 and
+    HEAD responses, which covers what nginx sends for static files.
+    """
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n{extra_headers}\r\n".encode('latin-1'))
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode('latin-1').split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+
+    if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+        return status, headers, b""
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16)
+            if size == 0:
+                # Skip any trailers up to the blank line
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        return status, headers, b"".join(chunks)
+
+    length = int(headers.get("content-length", 0))
+    body = await reader.readexactly(length) if length else b""
+    return status, headers, body
+
+def browser_headers():
+    """
+    BROWSER_HEADERS, advertising br only when brotli is there to decode it
+    """
+    import importlib.util
+    encodings = "gzip, br" if importlib.util.find_spec("brotli") else "gzip"
+    return BROWSER_HEADERS.format(encodings=encodings)
+
+def decode_body(headers, body):
+    """
+    Undo gzip/brotli Content-Encoding so the page's JSON can be parsed
+
+    Raises ValueError for a corrupt body or an encoding that can't be decoded.
+    """
+    encoding = headers.get("content-encoding", "")
+    try:
+        if encoding == "gzip":
+            import gzip
+            return gzip.decompress(body)
+        if encoding == "br":
+            import brotli
+            return brotli.decompress(body)
+    except Exception as e:
+        # BadGzipFile, zlib.error, EOFError, brotli.error, or no brotli at all
+        raise ValueError(f"cannot decode {encoding} body: {type(e).__name__}: {e}") from e
+    return body
+
+def category_paths(html, page_path="/"):
+    """
+    The category JSON paths a page fetches, in the order it fetches them
+    """
+    match = CATEGORY_FILES_PATTERN.search(html)
+    if not match:
+        return []
+    base = page_path.rsplit('/', 1)[0] + '/'
+    return [base + CATEGORY_PREFIX + name for name in QUOTED_NAME_PATTERN.findall(match.group(1))]
+
+def badge_image_paths(data):
+    """
+    Path and query of every badge image in one category JSON document
+    """
+    paths = []
+    for badge in data.get("badges", []):
+        url = badge.get("badge_url") or badge.get("badge")
+        if not url:
+            continue
+        parts = urlsplit(url)
+        paths.append(parts.path + (f"?{parts.query}" if parts.query else ""))
+    return paths
+
+class LoadStats:
+    """
+    Latencies, statuses and byte counts per request kind ("html", "json", "image")
+    """
+
+    def __init__(self):
+        self.latencies = {}
+        self.statuses = {}
+        self.bytes = {}
+        self.errors = 0
+        self.page_times = []
+
+    def record(self, kind, status, size, latency):
+        self.latencies.setdefault(kind, []).append(latency)
+        self.statuses.setdefault(kind, {})
+        self.statuses[kind][status] = self.statuses[kind].get(status, 0) + 1
+        self.bytes[kind] = self.bytes.get(kind, 0) + size
+
+    def report(self, elapsed):
+        """
+        Print throughput, latency percentiles and bytes per request kind
+        """
+        total_requests = sum(len(values) for values in self.latencies.values())
+        total_bytes = sum(self.bytes.values())
+        print(f"\n📊 {len(self.page_times)} page loads, {total_requests} requests in {elapsed:.2f}s "
+              f"({self.errors} errors)")
+        print(f"  throughput : {total_requests / elapsed:,.0f} req/s, "
+              f"{len(self.page_times) / elapsed:,.1f} pages/s, {total_bytes / elapsed / 1e6:.2f} MB/s")
+
+        rows = [(kind, sorted(values)) for kind, values in self.latencies.items()]
+        rows.append(("page", sorted(self.page_times)))
+        print(f"\n  {'kind':<6} {'count':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8} {'bytes':>12}")
+        for kind, values in rows:
+            if not values:
+                continue
+            print(f"  {kind:<6} {len(values):>7} {percentile(values, 0.50) * 1000:>8.2f} "
+                  f"{percentile(values, 0.90) * 1000:>8.2f} {percentile(values, 0.99) * 1000:>8.2f} "
+                  f"{values[-1] * 1000:>8.2f} {self.bytes.get(kind, 0):>12,}")
+
+        for kind, counts in self.statuses.items():
+            summary = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items(), key=str))
+            print(f"  {kind} status codes: {summary}")
+
+    def to_dict(self, elapsed):
+        return {
+            "elapsed_seconds": elapsed,
+            "page_loads": len(self.page_times),
+            "errors": self.errors,
+            "kinds": {
+                kind: {
+                    "requests": len(values),
+                    "bytes": self.bytes.get(kind, 0),
+                    "statuses": {str(status): count for status, count in self.statuses[kind].items()},
+                    "p50_ms": percentile(sorted(values), 0.50) * 1000,
+                    "p90_ms": percentile(sorted(values), 0.90) * 1000,
+                    "p99_ms": percentile(sorted(values), 0.99) * 1000,
+                }
+                for kind, values in self.latencies.items()
+            },
+            "page_p50_ms": percentile(sorted(self.page_times), 0.50) * 1000,
+            "page_p99_ms": percentile(sorted(self.page_times), 0.99) * 1000,
+        }
+
+class Connection:
+    """
+    One keep-alive connection, reopened when the server closes it
+    """
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def get(self, path, extra_headers=""):
+        import asyncio
+        for attempt in (0, 1):
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            try:
+                status, headers, body = await http_get(self.reader, self.writer, self.host_header,
+                                                       path, extra_headers)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                # Idle keep-alive connection closed by the server; retry once
+                await self.close()
+                if attempt:
+                    raise
+                continue
+            if headers.get("connection", "").lower() == "close":
+                await self.close()
+            return status, headers, body
+
+    @property
+    def host_header(self):
+        return self.host if self.port == 80 else f"{self.host}:{self.port}"
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.reader = self.writer = None
+
+class PageLoader:
+    """
+    Replays the frontend's fetch pattern: the page, then each category JSON
+
+    Each virtual user keeps browser-like state: up to fetch_parallel
+    keep-alive connections to the site, and (when warm) the ETag and
+    Last-Modified of everything it fetched, sent back as conditional
+    headers on the next page load. With an image server the badge images
+    in the JSON are fetched from it as well.
+    """
+
+    def __init__(self, host, port, page_path, stats, fetch_parallel=1, warm=False,
+                 image_server=None, max_images=None):
+        self.host = host
+        self.port = port
+        self.page_path = page_path
+        self.stats = stats
+        self.fetch_parallel = fetch_parallel
+        self.warm = warm
+        self.image_server = image_server
+        self.max_images = max_images
+        self.validators = {}
+        self.connections = [Connection(host, port) for _ in range(fetch_parallel)]
+        self.image_connections = ([Connection(*image_server) for _ in range(fetch_parallel)]
+                                  if image_server else [])
+        self.cached_html = None
+        self.cached_json = {}
+        self.base_headers = browser_headers()
+
+    def _headers(self, path):
+        headers = self.base_headers
+        validators = self.validators.get(path) if self.warm else None
+        if validators:
+            etag, modified = validators
+            if etag:
+                headers += f"If-None-Match: {etag}\r\n"
+            if modified:
+                headers += f"If-Modified-Since: {modified}\r\n"
+        return headers
+
+    async def fetch(self, connection, kind, path):
+        start = time.perf_counter()
+        try:
+            status, headers, body = await connection.get(path, self._headers(path))
+        except (OSError, EOFError, ValueError) as e:
+            self.stats.errors += 1
+            self.stats.record(kind, f"error: {type(e).__name__}", 0, time.perf_counter() - start)
+            return None, {}, b""
+        self.stats.record(kind, status, len(body), time.perf_counter() - start)
+        if self.warm and status == 200:
+            self.validators[path] = (headers.get("etag"), headers.get("last-modified"))
+        return status, headers, body
+
+    async def fetch_all(self, connections, kind, paths, on_body=None):
+        """
+        Fetch paths over the given connections, each taking the next path in turn
+        """
+        import asyncio
+        queue = list(reversed(paths))
+
+        async def worker(connection):
+            while queue:
+                path = queue.pop()
+                status, headers, body = await self.fetch(connection, kind, path)
+                if on_body is not None:
+                    on_body(path, status, headers, body)
+
+        await asyncio.gather(*(worker(connection) for connection in connections))
+
+    async def load_page(self):
+        start = time.perf_counter()
+        status, headers, body = await self.fetch(self.connections[0], "html", self.page_path)
+        if status == 200:
+            try:
+                self.cached_html = decode_body(headers, body).decode('utf-8', 'replace')
+            except ValueError:
+                self.stats.errors += 1
+        html = self.cached_html
+        if html is None:
+            self.stats.page_times.append(time.perf_counter() - start)
+            return
+
+        images = []
+
+        def on_json(path, status, headers, body):
+            if status == 200:
+                try:
+                    self.cached_json[path] = json.loads(decode_body(headers, body))
+                except ValueError:
+                    self.stats.errors += 1
+                    return
+            data = self.cached_json.get(path)
+            if data is not None and self.image_server:
+                images.extend(badge_image_paths(data))
+
+        await self.fetch_all(self.connections, "json", category_paths(html, self.page_path), on_json)
+
+        if self.image_server and images:
+            unique = list(dict.fromkeys(images))
+            if self.max_images is not None:
+                unique = unique[:self.max_images]
+            await self.fetch_all(self.image_connections, "image", unique)
+
+        self.stats.page_times.append(time.perf_counter() - start)
+
+    async def close(self):
+        for connection in self.connections + self.image_connections:
+            await connection.close()
+
+async def serve_stub_images(ready):
+    """
+    Answer every GET with a small SVG, standing in for img.shields.io
+    """
+    import asyncio
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if not head.strip():
+                    break
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: image/svg+xml\r\n"
+                             b"Cache-Control: max-age=300\r\nContent-Length: "
+                             + str(len(STUB_SVG)).encode() + b"\r\n\r\n" + STUB_SVG)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    ready.set_result(server.sockets[0].getsockname()[:2])
+    async with server:
+        await server.serve_forever()
+
+async def run_load(url, users=10, page_loads=100, duration=None, fetch_parallel=1, warm=False,
+                   images=False, max_images=None):
+    """
+    Run virtual users against url until page_loads (or duration) is reached
+
+    Returns (LoadStats, elapsed seconds).
+    """
+    import asyncio
+
+    parts = urlsplit(url)
+    if parts.scheme != "http":
+        raise ValueError(f"only http:// URLs are supported, got {url!r}")
+    host = parts.hostname or "localhost"
+    port = parts.port or 80
+    page_path = parts.path or "/"
+
+    stats = LoadStats()
+    stub_task = None
+    image_server = None
+    if images:
+        ready = asyncio.get_running_loop().create_future()
+        stub_task = asyncio.create_task(serve_stub_images(ready))
+        image_server = await ready
+
+    remaining = [page_loads]
+    deadline = time.perf_counter() + duration if duration else None
+
+    async def user():
+        loader = PageLoader(host, port, page_path, stats, fetch_parallel, warm, image_server, max_images)
+        try:
+            while True:
+                if deadline is not None:
+                    if time.perf_counter() >= deadline:
+                        break
+                elif remaining[0] <= 0:
+                    break
+                else:
+                    remaining[0] -= 1
+                await loader.load_page()
+        finally:
+            await loader.close()
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(user() for _ in range(users)))
+    finally:
+        elapsed = time.perf_counter() - start
+        if stub_task is not None:
+            stub_task.cancel()
+            try:
+                await stub_task
+            except asyncio.CancelledError:
+                pass
+
+    return stats, elapsed
+
+def serve_directory(directory):
+    """
+    Serve a directory over HTTP from a background thread; returns its URL
+
+    A stand-in for nginx when it isn't running: it has no gzip_static or
+    cache headers, so compare configurations against the real container.
+    """
+    import threading
+    from functools import partial
+    from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=directory))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}/index.html"
+
+def main(argv=None):
+    """
+    Load-test the utils/ frontend by replaying its page fetch pattern
+    """
+    import asyncio
+
+    parser = argparse.ArgumentParser(description="Replay the utils/ page fetch pattern under load")
+    parser.add_argument("url", nargs="?", default=DEFAULT_URL,
+                        help=f"page to load (default: {DEFAULT_URL}, the docker-compose port)")
+    parser.add_argument("--local", metavar="DIR",
+                        help="serve DIR (e.g. utils or utils/dist) with a built-in server and test that instead")
+    parser.add_argument("--users", "-c", type=int, default=10, metavar="N",
+                        help="concurrent virtual users (default: 10)")
+    parser.add_argument("--pages", "-n", type=int, default=100, metavar="N",
+                        help="total page loads (default: 100)")
+    parser.add_argument("--duration", "-d", type=float, metavar="SECONDS",
+                        help="run for SECONDS instead of a fixed number of page loads")
+    parser.add_argument("--fetch-parallel", type=int, default=1, metavar="N",
+                        help="connections per user for the JSON fetches; 1 matches the page's "
+                             "sequential loop, 6 a browser's per-host limit (default: 1)")
+    parser.add_argument("--warm", action="store_true",
+                        help="revalidate with If-None-Match/If-Modified-Since after each user's "
+                             "first load (default: every load is a cold cache)")
+    parser.add_argument("--images", action="store_true",
+                        help="also fetch every badge image, from a local stub instead of img.shields.io")
+    parser.add_argument("--max-images", type=int, metavar="N", help="cap badge images per page load")
+    parser.add_argument("--json", metavar="FILE", help="also write the results to FILE as JSON")
+    args = parser.parse_args(argv)
+
+    url = serve_directory(os.path.abspath(args.local)) if args.local else args.url
+    target = f"{args.duration:g}s" if args.duration else f"{args.pages} page loads"
+    print(f"🚀 {url}: {args.users} users, {target}, {args.fetch_parallel} connection(s) per user, "
+          f"{'warm' if args.warm else 'cold'} cache{', with images' if args.images else ''}")
+
+    try:
+        stats, elapsed = asyncio.run(run_load(url, args.users, args.pages, args.duration, args.fetch_parallel,
+                                              args.warm, args.images, args.max_images))
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    if not stats.latencies.get("json") and not stats.errors:
+        print("⚠️  No category JSON was fetched; is the page's categoryFiles list present?")
+    stats.report(elapsed)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(stats.to_dict(elapsed), f, indent=2)
+        print(f"\n✓ Results saved to {args.json}")
+
+if __name__ == "__main__":
+    main()
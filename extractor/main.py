@@ -2,8 +2,20 @@ import os
 import json
 import re
 import glob
+import mmap
+import codecs
+import shutil
+import argparse
 from pathlib import Path
 
+try:
+    from .stats import BadgeStats
+    from .external_sort import ExternalBadgeSorter
+except ImportError:
+    # Run as a plain script from the extractor directory
+    from stats import BadgeStats
+    from external_sort import ExternalBadgeSorter
+
 def find_markdown_files(directory="."):
     """
     Find all markdown files in the specified directory
@@ -23,6 +35,20 @@ def find_markdown_files(directory="."):
     
     return markdown_files
 
+def find_html_files(directory="."):
+    """
+    Find all saved HTML pages in the specified directory
+    """
+    html_files = []
+    
+    for file in sorted(os.listdir(directory)):
+        if file.lower().endswith(('.html', '.htm')):
+            full_path = os.path.join(directory, file)
+            if os.path.isfile(full_path):
+                html_files.append(full_path)
+    
+    return html_files
+
 def read_markdown_file(file_path):
     """
     Read content from a markdown file
@@ -42,6 +68,222 @@ def read_markdown_file(file_path):
         print(f"Error reading file {file_path}: {e}")
         return None
 
+# Bytes versions of the header and badge rules in extract_badges_from_content,
+# so files can be scanned straight off an mmap without decoding them first.
+# Header candidates are lines whose first non-blank byte is "#"; any
+# non-ASCII byte counts as blank here, since str.strip() also strips Unicode
+# whitespace such as NBSP. header_section applies the exact rule to them.
+HEADER_PATTERN_BYTES = rb'^(?P<header>[ \t\r\f\v\x1c-\x1f\x80-\xff]*#.*)$'
+BADGE_PATTERN_BYTES = re.compile(rb'!\[(?P<alt>.*?)\]\((?P<url>.*?)\)')
+SCAN_PATTERN_BYTES = re.compile(
+    HEADER_PATTERN_BYTES + rb'|' + BADGE_PATTERN_BYTES.pattern, re.MULTILINE
+)
+
+# Prefix size used to decide between UTF-8 and latin-1
+ENCODING_SAMPLE_BYTES = 64 * 1024
+
+def detect_encoding(buffer, sample_size=ENCODING_SAMPLE_BYTES):
+    """
+    Decide once, from a prefix sample, how matched spans should be decoded
+    """
+    sample = buffer[:sample_size]
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    
+    try:
+        # A multi-byte character cut off at the end of the sample is fine
+        decoder.decode(sample, final=len(buffer) <= sample_size)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'latin-1'
+
+def _decode_span(raw, encoding):
+    """
+    Decode a matched span, falling back to latin-1 like read_markdown_file
+    """
+    try:
+        return raw.decode(encoding)
+    except UnicodeDecodeError:
+        return raw.decode('latin-1')
+
+def header_section(line):
+    """
+    Section name if line is a "#", "##" or "###" header, else None
+
+    The same rule extract_badges_from_content applies to each line.
+    """
+    line = line.strip()
+    if line.startswith(('# ', '## ', '### ')):
+        return line.lstrip('# ').strip()
+    return None
+
+def scan_markdown_buffer(buffer, source_file="", encoding=None):
+    """
+    Extract badge information from raw markdown bytes
+
+    Works on any bytes-like buffer, including an mmap. Header and badge
+    patterns run as one compiled bytes regex and only the matched spans
+    are decoded. Produces the same records as extract_badges_from_content
+    for "\n" and "\r\n" line endings (tests/test_main.py checks this);
+    files using bare "\r" (classic Mac) are read as one long line.
+    """
+    if encoding is None:
+        encoding = detect_encoding(buffer)
+    
+    badges = []
+    current_section = "General"
+    line_number = 1
+    last_position = 0
+    
+    def add_badge(match):
+        alt_text = _decode_span(match.group('alt'), encoding)
+        badge_url = _decode_span(match.group('url'), encoding)
+        
+        if is_likely_badge(badge_url, alt_text):
+            badges.append({
+                "technology": extract_tech_name(alt_text),
+                "badge_url": badge_url,
+                "markdown": f"![{alt_text}]({badge_url})",
+                "alt_text": alt_text,
+                "section": current_section,
+                "source_file": source_file,
+                "line_number": line_number
+            })
+    
+    for match in SCAN_PATTERN_BYTES.finditer(buffer):
+        start, end = match.span()
+        line_number += buffer[last_position:start].count(b'\n')
+        last_position = start
+        
+        if match.group('header') is None:
+            add_badge(match)
+            continue
+        
+        section = header_section(_decode_span(match.group('header'), encoding))
+        if section is not None:
+            current_section = section
+        
+        # The header consumed its whole line, so pick up badges inside it
+        for badge_match in BADGE_PATTERN_BYTES.finditer(buffer, start, end):
+            add_badge(badge_match)
+    
+    return badges
+
+def scan_markdown_file(file_path, source_file=""):
+    """
+    Extract badges from a markdown file through a read-only memory map
+
+    Avoids decoding and copying the whole file; returns None if the file
+    is empty or cannot be read.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return scan_markdown_buffer(buffer, source_file)
+    except (OSError, ValueError) as e:
+        print(f"Error reading file {file_path}: {e}")
+        return None
+
+# Archives whose markdown members can be scanned without unpacking to disk
+TAR_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+ARCHIVE_SUFFIXES = TAR_SUFFIXES + ('.zip', '.gz')
+
+# Larger members are skipped (a plain .gz is scanned up to this size), with a
+# warning either way: READMEs are small, and each member is read whole
+MAX_ARCHIVE_MEMBER_BYTES = 64 * 1024 * 1024
+
+def is_archive(file_path):
+    """
+    Check whether a path names a supported archive
+    """
+    return file_path.lower().endswith(ARCHIVE_SUFFIXES)
+
+def is_markdown_name(name):
+    """
+    Apply the find_markdown_files naming rules to an archive member path
+    """
+    base = name.rsplit('/', 1)[-1].lower()
+    return base.endswith(('.md', '.markdown')) or (base.startswith('readme') and not is_archive(base))
+
+def find_archive_files(directory="."):
+    """
+    Find all supported archives in the specified directory
+    """
+    archive_files = []
+    
+    for file in sorted(os.listdir(directory)):
+        full_path = os.path.join(directory, file)
+        if is_archive(file) and os.path.isfile(full_path):
+            archive_files.append(full_path)
+    
+    return archive_files
+
+def iter_archive_markdown(file_path):
+    """
+    Yield (member path, bytes) for the markdown members of an archive
+
+    Tar archives (compressed or not) are read in stream mode, a single
+    sequential pass with no seeking; zip members are opened straight from
+    the central directory and a plain .gz is one member named after the
+    file. Nothing is written to disk.
+    """
+    lower = file_path.lower()
+    limit_mb = MAX_ARCHIVE_MEMBER_BYTES // (1024 * 1024)
+    
+    if lower.endswith(TAR_SUFFIXES):
+        import tarfile
+        with tarfile.open(file_path, 'r|*') as archive:
+            for member in archive:
+                if not (member.isfile() and is_markdown_name(member.name)):
+                    continue
+                if member.size > MAX_ARCHIVE_MEMBER_BYTES:
+                    print(f"⚠️  Skipping {file_path}!{member.name}: larger than {limit_mb} MB")
+                    continue
+                yield member.name, archive.extractfile(member).read()
+    elif lower.endswith('.zip'):
+        import zipfile
+        with zipfile.ZipFile(file_path) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or not is_markdown_name(info.filename):
+                    continue
+                if info.file_size > MAX_ARCHIVE_MEMBER_BYTES:
+                    print(f"⚠️  Skipping {file_path}!{info.filename}: larger than {limit_mb} MB")
+                    continue
+                with archive.open(info) as member:
+                    yield info.filename, member.read()
+    elif lower.endswith('.gz'):
+        import gzip
+        member_name = os.path.basename(file_path)[:-3]
+        if is_markdown_name(member_name):
+            with gzip.open(file_path, 'rb') as member:
+                # The uncompressed size is only known after reading it all
+                data = member.read(MAX_ARCHIVE_MEMBER_BYTES)
+                if member.read(1):
+                    print(f"⚠️  Truncated {file_path}: only the first {limit_mb} MB were scanned")
+                yield member_name, data
+    
+def scan_archive(file_path, source_file=""):
+    """
+    Extract badges from every markdown member of an archive
+
+    Each badge's source_file is "<archive>!<member path>". Returns None if
+    the archive cannot be read.
+    """
+    import tarfile
+    import zipfile
+    
+    badges = []
+    try:
+        for member_name, data in iter_archive_markdown(file_path):
+            if data:
+                badges.extend(scan_markdown_buffer(data, f"{source_file}!{member_name}"))
+    except (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile) as e:
+        print(f"Error reading archive {file_path}: {e}")
+        return None
+    
+    return badges
+
 def extract_badges_from_content(content, source_file=""):
     """
     Extract badge information from markdown content
@@ -89,6 +331,76 @@ def extract_badges_from_content(content, source_file=""):
     
     return badges
 
+HTML_HEADING_TAGS = ('h1', 'h2', 'h3')
+
+def extract_badges_from_html(file_path, source_file=""):
+    """
+    Extract badge information from a saved HTML page
+
+    lxml's iterparse streams parser events instead of building a DOM.
+    Every element is cleared as soon as it closes (headings are kept
+    until their text has been read), so memory stays flat even on
+    pages that are hundreds of MB. Records match the markdown path.
+    """
+    from lxml import etree
+    
+    badges = []
+    heading_badges = []
+    current_section = "General"
+    heading_depth = 0
+    
+    try:
+        context = etree.iterparse(
+            file_path, events=("start", "end"), html=True,
+            remove_comments=True, remove_pis=True, huge_tree=True
+        )
+        for event, element in context:
+            tag = element.tag.lower() if isinstance(element.tag, str) else ""
+            
+            if event == "start":
+                if tag in HTML_HEADING_TAGS:
+                    heading_depth += 1
+                continue
+            
+            # Section headers take the text of the nearest preceding heading
+            if tag in HTML_HEADING_TAGS:
+                heading_depth -= 1
+                heading_text = " ".join("".join(element.itertext()).split())
+                if heading_text:
+                    current_section = heading_text
+                # Badges inside the heading belong to its own section, as
+                # badges on a markdown header line do
+                if heading_depth == 0:
+                    for badge_info in heading_badges:
+                        badge_info["section"] = current_section
+                    badges.extend(heading_badges)
+                    heading_badges = []
+            elif tag == "img":
+                alt_text = element.get("alt", "")
+                badge_url = element.get("src", "")
+                
+                if badge_url and is_likely_badge(badge_url, alt_text):
+                    badge_info = {
+                        "technology": extract_tech_name(alt_text),
+                        "badge_url": badge_url,
+                        "markdown": f"![{alt_text}]({badge_url})",
+                        "alt_text": alt_text,
+                        "section": current_section,
+                        "source_file": source_file,
+                        "line_number": element.sourceline
+                    }
+                    (heading_badges if heading_depth else badges).append(badge_info)
+            
+            # Drop everything already seen unless a heading is still open
+            if heading_depth == 0:
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+    except (OSError, etree.LxmlError) as e:
+        print(f"Error reading file {file_path}: {e}")
+    
+    return badges
+
 def is_likely_badge(url, alt_text):
     """
     Determine if the image is likely a badge (not a regular image)
@@ -148,87 +460,148 @@ def extract_tech_name(alt_text):
     
     return tech_name if tech_name else "Unknown Technology"
 
-def categorize_badges(badges):
+def extract_badges_from_file(file_path, html=False):
     """
-    Organize badges into categories based on technology type
+    Extract badges from a single file, or None if it could not be read
     """
-    categories = {
-        "programming_languages": [],
-        "frameworks": [],
-        "tools": [],
-        "services": [],
-        "devops": [],
-        "social": [],
-        "other": []
-    }
+    source_file = os.path.basename(file_path)
     
-    # Technology keywords for categorization
-    programming_langs = ['python', 'javascript', 'java', 'c++', 'c#', 'go', 'rust', 
-                        'php', 'ruby', 'swift', 'kotlin', 'typescript', 'html', 'css']
+    if html:
+        return extract_badges_from_html(file_path, source_file)
     
-    frameworks = ['react', 'vue', 'angular', 'django', 'flask', 'spring', 'laravel',
-                 'express', 'rails', 'bootstrap', 'tailwind', 'jquery']
+    if is_archive(file_path):
+        return scan_archive(file_path, source_file)
     
-    tools = ['git', 'github', 'gitlab', 'vscode', 'visual studio', 'docker', 'kubernetes',
-            'postman', 'figma', 'photoshop', 'illustrator']
+    return scan_markdown_file(file_path, source_file)
+
+# Field order of the compact tuples workers send back to the parent
+BADGE_FIELDS = ("technology", "badge_url", "markdown", "alt_text",
+                "section", "source_file", "line_number")
+
+# Files smaller than this are batched together into one worker task
+CHUNK_TARGET_BYTES = 4 * 1024 * 1024
+
+def chunk_files_by_size(file_jobs, target_bytes=CHUNK_TARGET_BYTES):
+    """
+    Group (file_path, html) jobs into worker chunks of about target_bytes
+
+    Small files are batched so per-task overhead is amortised, files at
+    or above the target get a chunk of their own, and the biggest chunks
+    are returned first so a large file never ends up as the tail task.
+    Each entry keeps its input index so results can be put back in order.
+    """
+    chunks = []
+    current = []
+    current_size = 0
     
-    services = ['aws', 'azure', 'google cloud', 'firebase', 'mongodb', 'mysql', 
-               'postgresql', 'redis', 'nginx', 'apache']
+    for index, (file_path, html) in enumerate(file_jobs):
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            size = 0
+        
+        if size >= target_bytes:
+            chunks.append((size, [(index, file_path, html)]))
+            continue
+        
+        if current and current_size + size > target_bytes:
+            chunks.append((current_size, current))
+            current = []
+            current_size = 0
+        
+        current.append((index, file_path, html))
+        current_size += size
     
-    devops = ['docker', 'kubernetes', 'jenkins', 'travis', 'circleci', 'github actions',
-             'gitlab ci', 'ansible', 'terraform', 'prometheus', 'grafana']
+    if current:
+        chunks.append((current_size, current))
     
-    social = ['twitter', 'linkedin', 'facebook', 'instagram', 'youtube', 'discord',
-             'telegram', 'slack', 'reddit']
+    chunks.sort(key=lambda chunk: chunk[0], reverse=True)
+    return [chunk for _, chunk in chunks]
+
+def parse_file_chunk(chunk):
+    """
+    Worker entry point: parse a chunk and return compact badge tuples
+    """
+    results = []
+    
+    for index, file_path, html in chunk:
+        badges = extract_badges_from_file(file_path, html)
+        if badges is not None:
+            badges = [tuple(badge[field] for field in BADGE_FIELDS) for badge in badges]
+        results.append((index, badges))
+    
+    return results
+
+def iter_files_parallel(file_jobs, jobs):
+    """
+    Parse (file_path, html) jobs across a process pool, yielding as chunks finish
+
+    Yields (index, badges) pairs, badges being None for unreadable files.
+    Chunks come back biggest first rather than in input order; only one
+    chunk's results are held at a time.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    chunks = chunk_files_by_size(file_jobs)
+    
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for chunk_results in executor.map(parse_file_chunk, chunks):
+            for index, rows in chunk_results:
+                if rows is not None:
+                    rows = [dict(zip(BADGE_FIELDS, row)) for row in rows]
+                yield index, rows
+
+def parse_files_parallel(file_jobs, jobs):
+    """
+    Parse (file_path, html) jobs across a process pool
+
+    Returns one badge list (or None for unreadable files) per job, in
+    the same order as file_jobs, so the output is identical to a serial run.
+    """
+    file_results = [None] * len(file_jobs)
+    for index, badges in iter_files_parallel(file_jobs, jobs):
+        file_results[index] = badges
+    return file_results
+
+# Technology keywords per category, checked in this order; the first
+# category with a keyword contained in the technology name wins
+CATEGORY_KEYWORDS = [
+    ("programming_languages", ['python', 'javascript', 'java', 'c++', 'c#', 'go', 'rust',
+                               'php', 'ruby', 'swift', 'kotlin', 'typescript', 'html', 'css']),
+    ("frameworks", ['react', 'vue', 'angular', 'django', 'flask', 'spring', 'laravel',
+                    'express', 'rails', 'bootstrap', 'tailwind', 'jquery']),
+    ("tools", ['git', 'github', 'gitlab', 'vscode', 'visual studio', 'docker', 'kubernetes',
+               'postman', 'figma', 'photoshop', 'illustrator']),
+    ("services", ['aws', 'azure', 'google cloud', 'firebase', 'mongodb', 'mysql',
+                  'postgresql', 'redis', 'nginx', 'apache']),
+    ("devops", ['docker', 'kubernetes', 'jenkins', 'travis', 'circleci', 'github actions',
+                'gitlab ci', 'ansible', 'terraform', 'prometheus', 'grafana']),
+    ("social", ['twitter', 'linkedin', 'facebook', 'instagram', 'youtube', 'discord',
+                'telegram', 'slack', 'reddit']),
+]
+
+def categorize_badge(badge):
+    """
+    Return the category key for a single badge
+    """
+    tech_name = badge["technology"].lower()
+    
+    for category, keywords in CATEGORY_KEYWORDS:
+        for keyword in keywords:
+            if keyword in tech_name:
+                return category
+    
+    return "other"
+
+def categorize_badges(badges):
+    """
+    Organize badges into categories based on technology type
+    """
+    categories = {category: [] for category, _ in CATEGORY_KEYWORDS}
+    categories["other"] = []
     
     for badge in badges:
-        tech_name = badge["technology"].lower()
-        categorized = False
-        
-        # Check each category
-        for lang in programming_langs:
-            if lang in tech_name:
-                categories["programming_languages"].append(badge)
-                categorized = True
-                break
-        
-        if not categorized:
-            for framework in frameworks:
-                if framework in tech_name:
-                    categories["frameworks"].append(badge)
-                    categorized = True
-                    break
-        
-        if not categorized:
-            for tool in tools:
-                if tool in tech_name:
-                    categories["tools"].append(badge)
-                    categorized = True
-                    break
-        
-        if not categorized:
-            for service in services:
-                if service in tech_name:
-                    categories["services"].append(badge)
-                    categorized = True
-                    break
-        
-        if not categorized:
-            for devop in devops:
-                if devop in tech_name:
-                    categories["devops"].append(badge)
-                    categorized = True
-                    break
-        
-        if not categorized:
-            for social_media in social:
-                if social_media in tech_name:
-                    categories["social"].append(badge)
-                    categorized = True
-                    break
-        
-        if not categorized:
-            categories["other"].append(badge)
+        categories[categorize_badge(badge)].append(badge)
     
     # Remove empty categories
     return {category: badges for category, badges in categories.items() if badges}
@@ -260,18 +633,17 @@ def save_badges_to_json(categorized_badges, output_dir="badge_data"):
     
     return saved_files
 
-def generate_summary(all_badges, categorized_badges, output_dir="badge_data"):
+def save_summary(stats, output_dir="badge_data", extra=None):
     """
-    Generate a summary file with statistics
+    Write a BadgeStats summary (plus any extra fields) to extraction_summary.json
     """
-    summary = {
-        "total_badges_found": len(all_badges),
-        "files_processed": list(set(badge["source_file"] for badge in all_badges)),
-        "categories_summary": {
-            category: len(badges) for category, badges in categorized_badges.items()
-        },
-        "unique_technologies": list(set(badge["technology"] for badge in all_badges))
-    }
+    summary = stats.summary()
+    summary["categories_summary"] = dict(stats.categories)
+    unique_technologies = stats.unique_technologies()
+    if unique_technologies is not None:
+        summary["unique_technologies"] = unique_technologies
+    if extra:
+        summary.update(extra)
     
     summary_path = os.path.join(output_dir, "extraction_summary.json")
     with open(summary_path, 'w', encoding='utf-8') as f:
@@ -280,30 +652,216 @@ def generate_summary(all_badges, categorized_badges, output_dir="badge_data"):
     print(f"✓ Summary saved to {summary_path}")
     return summary_path
 
-def main():
+def generate_summary(all_badges, categorized_badges, output_dir="badge_data"):
     """
-    Main function to extract badges from local markdown files
+    Generate a summary file with statistics
+
+    Badges are streamed through a BadgeStats aggregator, so the summary
+    needs no extra copies of the badge list and stays bounded in size:
+    past 10,000 distinct technologies "unique_technologies" is dropped in
+    favour of the estimated count.
+    """
+    stats = BadgeStats()
+    for category, badges in categorized_badges.items():
+        stats.add_category(category, badges)
+    
+    return save_summary(stats, output_dir)
+
+def _write_category_file(output_dir, category, count, part_path):
+    """
+    Wrap a streamed badge array in the layout save_badges_to_json writes
+    """
+    filepath = os.path.join(output_dir, f"{category}.json")
+    header = json.dumps(category.replace('_', ' ').title(), ensure_ascii=False)
+    
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(f'{{\n  "category": {header},\n  "badges_count": {count},\n')
+        if count:
+            f.write('  "badges": [\n')
+            with open(part_path, 'r', encoding='utf-8') as part:
+                shutil.copyfileobj(part, f)
+            f.write('\n  ]\n}')
+        else:
+            f.write('  "badges": []\n}')
+    
+    print(f"✓ Saved {count} badges to {filepath}")
+    return filepath
+
+def save_badges_external(sorter, output_dir="badge_data"):
+    """
+    Stream an ExternalBadgeSorter's merged output into per-category JSON files
+
+    Records arrive grouped by category, so each category file is written
+    in one pass without holding its badges in memory. The files match what
+    save_badges_to_json writes for the same (sorted, deduplicated) badges.
+    Returns (saved files, BadgeStats of the written badges).
+    """
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    
+    stats = BadgeStats()
+    saved_files = []
+    part_path = os.path.join(sorter.temp_dir, "category.part")
+    category = None
+    part = None
+    count = 0
+    
+    for badge_category, badge in sorter.merged():
+        if badge_category != category:
+            if part is not None:
+                part.close()
+                saved_files.append(_write_category_file(output_dir, category, count, part_path))
+            category = badge_category
+            part = open(part_path, 'w', encoding='utf-8')
+            count = 0
+        
+        if count:
+            part.write(',\n')
+        text = json.dumps(badge, indent=2, ensure_ascii=False)
+        part.write('\n'.join('    ' + line for line in text.split('\n')))
+        count += 1
+        stats.add(badge, badge_category)
+    
+    if part is not None:
+        part.close()
+        saved_files.append(_write_category_file(output_dir, category, count, part_path))
+        os.remove(part_path)
+    
+    return saved_files, stats
+
+def parse_args(argv=None):
+    """
+    Parse command line options
     """
-    print("🔍 Scanning for markdown files in current directory...")
+    parser = argparse.ArgumentParser(description="Extract badges from local markdown files")
+    parser.add_argument("directory", nargs="?", default=".",
+                        help="directory or archive to scan (default: current directory)")
+    parser.add_argument("--output", "-o", default="badge_data",
+                        help="directory for the JSON output (default: badge_data)")
+    parser.add_argument("--html", action="store_true",
+                        help="also extract badges from saved HTML pages (requires lxml)")
+    parser.add_argument("--archives", action="store_true",
+                        help="also scan markdown inside .tar(.gz/.bz2/.xz), .zip and .gz archives")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="parse files across N worker processes (default: 1)")
+    parser.add_argument("--memory-budget", type=float, metavar="MB",
+                        help="sort and deduplicate badges out of core, spilling to temporary "
+                             "files past MB megabytes (default: keep everything in memory)")
+    return parser.parse_args(argv)
+
+def extract_external(file_jobs, args):
+    """
+    Out-of-core variant of main(): badges go through an ExternalBadgeSorter
+
+    Each file's badges are categorized and handed to the sorter as soon as
+    they are parsed, so memory stays near --memory-budget however large
+    the input is. Output is sorted by category and technology, and exact
+    duplicates (same category, URL and markdown) are dropped.
+    """
+    memory_budget = int(args.memory_budget * 1024 * 1024)
+    # Recorded while parsing: files whose badges all turn out to be
+    # duplicates never reach the merged output
+    source_files = set()
+    
+    with ExternalBadgeSorter(memory_budget) as sorter:
+        if args.jobs > 1:
+            print(f"\n⚙️  Parsing with {args.jobs} worker processes...")
+            results = iter_files_parallel(file_jobs, args.jobs)
+        else:
+            results = ((index, extract_badges_from_file(file_path, html))
+                       for index, (file_path, html) in enumerate(file_jobs))
+        
+        for index, badges in results:
+            file_path, html = file_jobs[index]
+            print(f"\n📖 {'Parsed' if html else 'Read'} {file_path}")
+            if badges is None:
+                print(f"  ❌ Could not read file")
+                continue
+            for badge in badges:
+                source_files.add(badge.get("source_file", ""))
+                sorter.add(categorize_badge(badge), badge)
+            print(f"  Found {len(badges)} badges")
+        
+        if not sorter.added:
+            print("\n❌ No badges found in any markdown files.")
+            return
+        
+        print(f"\n🎯 Total badges found: {sorter.added}")
+        print(f"📂 Sorting and deduplicating ({len(sorter.runs)} run(s) spilled to disk)...")
+        
+        print("\n💾 Saving badges to JSON files...")
+        saved_files, stats = save_badges_external(sorter, args.output)
+        stats.files = source_files
+        save_summary(stats, args.output, {"total_badges_found": sorter.added,
+                                          "badges_saved": stats.total,
+                                          "duplicates_removed": sorter.duplicates,
+                                          "external_runs": sorter.spilled_runs})
     
-    markdown_files = find_markdown_files()
+    print(f"\n✅ Extraction completed!")
+    print(f"📊 Total badges extracted: {sorter.added} ({stats.total} saved, "
+          f"{sorter.duplicates} duplicates removed)")
+    print(f"📁 Categories created: {len(saved_files)}")
+    print(f"📄 JSON files saved to: {args.output}/")
     
-    if not markdown_files:
-        print("❌ No markdown files found in the current directory.")
+    print("\n📋 Category breakdown:")
+    for category, count in stats.categories.items():
+        category_name = category.replace('_', ' ').title()
+        print(f"  - {category_name}: {count} badges")
+
+def main(argv=None):
+    """
+    Main function to extract badges from local markdown files
+    """
+    args = parse_args(argv)
+    
+    print(f"🔍 Scanning for markdown files in {args.directory}...")
+    
+    html_files = []
+    archive_files = []
+    if os.path.isfile(args.directory) and is_archive(args.directory):
+        # A single archive snapshot given directly
+        markdown_files = []
+        archive_files = [args.directory]
+    else:
+        markdown_files = find_markdown_files(args.directory)
+        if args.html:
+            html_files = find_html_files(args.directory)
+            markdown_files = [f for f in markdown_files if f not in html_files]
+        if args.archives:
+            archive_files = find_archive_files(args.directory)
+            markdown_files = [f for f in markdown_files if f not in archive_files]
+    
+    if not markdown_files and not html_files and not archive_files:
+        print(f"❌ No markdown files found in {args.directory}.")
         return
     
-    print(f"📁 Found {len(markdown_files)} markdown file(s):")
-    for file in markdown_files:
+    print(f"📁 Found {len(markdown_files) + len(html_files) + len(archive_files)} file(s):")
+    for file in markdown_files + html_files + archive_files:
         print(f"  - {file}")
     
+    file_jobs = ([(f, False) for f in markdown_files] + [(f, True) for f in html_files] +
+                 [(f, False) for f in archive_files])
+    
+    if args.memory_budget is not None:
+        extract_external(file_jobs, args)
+        return
+    
+    if args.jobs > 1:
+        print(f"\n⚙️  Parsing with {args.jobs} worker processes...")
+        file_results = parse_files_parallel(file_jobs, args.jobs)
+    else:
+        file_results = None
+    
     all_badges = []
     
-    for file_path in markdown_files:
-        print(f"\n📖 Reading {file_path}...")
-        content = read_markdown_file(file_path)
+    for index, (file_path, html) in enumerate(file_jobs):
+        print(f"\n📖 {'Parsing' if html else 'Reading'} {file_path}...")
+        if file_results is None:
+            badges = extract_badges_from_file(file_path, html)
+        else:
+            badges = file_results[index]
         
-        if content:
-            badges = extract_badges_from_content(content, os.path.basename(file_path))
+        if badges is not None:
             all_badges.extend(badges)
             print(f"  Found {len(badges)} badges")
         else:
@@ -321,16 +879,16 @@ def main():
     
     # Save to JSON files
     print("\n💾 Saving badges to JSON files...")
-    saved_files = save_badges_to_json(categorized_badges)
+    saved_files = save_badges_to_json(categorized_badges, args.output)
     
     # Generate summary
-    generate_summary(all_badges, categorized_badges)
+    generate_summary(all_badges, categorized_badges, args.output)
     
     # Print final statistics
     print(f"\n✅ Extraction completed!")
     print(f"📊 Total badges extracted: {len(all_badges)}")
     print(f"📁 Categories created: {len(categorized_badges)}")
-    print(f"📄 JSON files saved to: badge_data/")
+    print(f"📄 JSON files saved to: {args.output}/")
     
     # Show category breakdown
     print("\n📋 Category breakdown:")
@@ -0,0 +1,228 @@
+import os
+import re
+import shutil
+import hashlib
+import argparse
+import tempfile
+
+from . import catalog
+
+DEFAULT_README = os.path.join(catalog.REPO_ROOT, "utils", "README.md")
+
+# Generated sections are fenced by markers carrying a hash of the category
+# file they were rendered from, so unchanged sections can be copied as-is.
+SECTION_START = "<!-- badges:{key} {digest} -->\n"
+SECTION_END = "<!-- /badges:{key} -->\n"
+SECTION_START_PATTERN = re.compile(r'^<!-- badges:(\S+) ([0-9a-f]+) -->$')
+SECTION_MARKER_BYTES = b"<!-- badges:"
+
+TABLE_HEADER = "| Name | Badge | Markdown |\n| ---- | ----- | -------- |\n"
+BACK_TO_TOP = "[(Back to top)](#table-of-contents)\n"
+ALT_TEXT_PATTERN = re.compile(r'!\[(.*?)\]')
+
+def heading_key(heading):
+    """
+    Catalog key of a "### <emoji> Name" heading, as utils/extractor.py names files
+    """
+    return catalog.category_key(heading.lstrip('#'))
+
+def category_digest(name, catalog_dir=catalog.DEFAULT_CATALOG_DIR):
+    """
+    Hash a category's JSON file so changed sections can be detected
+    """
+    info = catalog.category_info(name, catalog_dir)
+    with open(os.path.join(catalog_dir, info["file"]), 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
+
+def render_badge_row(badge):
+    """
+    Render one "| Name | Badge | Markdown |" table row
+    """
+    name = badge.get("name", "")
+    badge_url = badge.get("badge") or badge.get("badge_url", "")
+    markdown = badge.get("markdown", "").strip().strip('`') or f"![{name}]({badge_url})"
+
+    alt_match = ALT_TEXT_PATTERN.match(markdown)
+    alt_text = alt_match.group(1) if alt_match else name
+
+    return f"| {name} | ![{alt_text}]({badge_url}) | `{markdown}` |\n"
+
+def render_section(out, name, digest, catalog_dir=catalog.DEFAULT_CATALOG_DIR, heading=None):
+    """
+    Stream one category section, markers included, into out
+
+    heading is the section's existing heading line. It is kept as written
+    (emoji, punctuation) so table-of-contents anchors keep resolving; only
+    new sections get a "### <category>" heading from the catalog.
+    """
+    if heading is None:
+        heading = f"### {catalog.category_info(name, catalog_dir)['category']}\n"
+
+    out.write(SECTION_START.format(key=name, digest=digest))
+    out.write(heading + "\n")
+    out.write(TABLE_HEADER)
+    for _, badge in catalog.iter_badges([name], catalog_dir):
+        out.write(render_badge_row(badge))
+    out.write("\n" + BACK_TO_TOP)
+    out.write(SECTION_END.format(key=name))
+
+def _adopt_sections(readme, out, pending, catalog_dir):
+    """
+    Put markers around the hand-written "### " sections left in readme
+
+    Each section whose heading names a catalog category is re-rendered in
+    place under its original heading line; anything else is copied as is.
+    Returns the number of sections rendered.
+    """
+    rendered = 0
+    section = []
+
+    def flush():
+        nonlocal rendered
+        key = heading_key(section[0]) if section else None
+        if key not in pending:
+            out.writelines(section)
+            return
+        # Keep the blank lines that separated this section from the next
+        trailing = len(section) - len(''.join(section).rstrip('\n').split('\n'))
+        render_section(out, key, pending.pop(key), catalog_dir, heading=section[0])
+        out.write("\n" * trailing)
+        rendered += 1
+
+    for line in readme:
+        if line.startswith("### "):
+            flush()
+            section = [line]
+        elif section:
+            section.append(line)
+        else:
+            out.write(line)
+    flush()
+    return rendered
+
+def _has_markers(readme_path):
+    """
+    Check whether a README already contains generated sections
+    """
+    with open(readme_path, 'rb') as f:
+        return any(SECTION_MARKER_BYTES in line for line in f)
+
+def generate_readme(readme_path=DEFAULT_README, catalog_dir=catalog.DEFAULT_CATALOG_DIR,
+                    replace_from="# Badges"):
+    """
+    Render the catalog tables into a README, re-rendering only what changed
+
+    Existing sections whose hash still matches their category file are
+    copied through untouched; stale ones are re-rendered in place, removed
+    categories are dropped and new ones are appended at the end. In a
+    README without markers yet, the hand-written "### " sections after the
+    replace_from heading line are adopted in place (see _adopt_sections);
+    ValueError is raised when that heading is missing. Returns (rendered,
+    kept) section counts; the file is only replaced when something was
+    rendered or dropped.
+    """
+    pending = {name: category_digest(name, catalog_dir) for name in catalog.category_names(catalog_dir)}
+    rendered = 0
+    kept = 0
+    dropped = 0
+
+    directory = os.path.dirname(os.path.abspath(readme_path))
+    fd, temp_path = tempfile.mkstemp(prefix=".readme-", dir=directory)
+
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as out:
+            if os.path.exists(readme_path):
+                adopting = not _has_markers(readme_path)
+
+                with open(readme_path, 'r', encoding='utf-8') as readme:
+                    skipping_to = None
+                    for line in readme:
+                        if skipping_to is not None:
+                            if line == skipping_to:
+                                skipping_to = None
+                            continue
+
+                        if adopting and line.rstrip('\n') == replace_from:
+                            # Hand-written tables from here on get markers
+                            out.write(line)
+                            rendered += _adopt_sections(readme, out, pending, catalog_dir)
+                            adopting = False
+                            break
+
+                        match = SECTION_START_PATTERN.match(line.rstrip('\n'))
+                        if not match:
+                            out.write(line)
+                            continue
+
+                        key, old_digest = match.groups()
+                        end_marker = SECTION_END.format(key=key)
+
+                        if key not in pending:
+                            dropped += 1
+                            skipping_to = end_marker
+                        elif pending[key] == old_digest:
+                            out.write(line)
+                            for section_line in readme:
+                                out.write(section_line)
+                                if section_line == end_marker:
+                                    break
+                            del pending[key]
+                            kept += 1
+                        else:
+                            heading = next(readme, "")
+                            render_section(out, key, pending.pop(key), catalog_dir,
+                                           heading if heading.startswith("#") else None)
+                            rendered += 1
+                            skipping_to = None if heading == end_marker else end_marker
+
+                if adopting:
+                    # Appending after an unmarked copy would duplicate every table
+                    raise ValueError(f"{readme_path} has no generated sections and no "
+                                     f"{replace_from!r} heading line to adopt them from")
+            else:
+                out.write(replace_from + "\n\n")
+
+            for index, (key, digest) in enumerate(pending.items()):
+                if index or kept or rendered:
+                    out.write("\n")
+                render_section(out, key, digest, catalog_dir)
+                rendered += 1
+
+        if rendered or dropped:
+            # mkstemp creates the file 0600; keep the README's own mode
+            if os.path.exists(readme_path):
+                shutil.copymode(readme_path, temp_path)
+            else:
+                os.chmod(temp_path, 0o644)
+            os.replace(temp_path, readme_path)
+        else:
+            os.remove(temp_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return rendered, kept
+
+def main(argv=None):
+    """
+    Regenerate the README badge tables from the catalog JSON
+    """
+    parser = argparse.ArgumentParser(description="Render the catalog JSON into README tables")
+    parser.add_argument("readme", nargs="?", default=DEFAULT_README,
+                        help="README to update (default: utils/README.md)")
+    parser.add_argument("--catalog-dir", default=catalog.DEFAULT_CATALOG_DIR,
+                        help="directory holding the category JSON files")
+    parser.add_argument("--replace-from", default="# Badges", metavar="HEADING",
+                        help="in a README without generated sections yet, adopt the "
+                             "'### ' sections after this heading line (default: '# Badges')")
+    args = parser.parse_args(argv)
+
+    try:
+        rendered, kept = generate_readme(args.readme, args.catalog_dir, args.replace_from)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"✓ {args.readme}: {rendered} section(s) rendered, {kept} unchanged")
+
+if __name__ == "__main__":
+    main()
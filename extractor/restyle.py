@@ -0,0 +1,253 @@
+import os
+import re
+import mmap
+import shutil
+import argparse
+import tempfile
+from urllib.parse import urlsplit, unquote_plus
+
+from .main import BADGE_PATTERN_BYTES
+from .suggest import SKIP_DIRECTORIES
+
+STYLES = ("flat", "flat-square", "plastic", "for-the-badge", "social")
+SHIELDS_HOSTS = ("img.shields.io", "shields.io")
+MARKDOWN_EXTENSIONS = ('.md', '.markdown')
+
+# Static badge paths end in "<label>-<color>" or "<label>-<message>-<color>";
+# "--" is an escaped dash, so the colour follows the last single dash
+STATIC_BADGE_PATTERN = re.compile(r'^(?P<head>/badge/.*[^-])-(?P<color>[^-/]+?)(?P<ext>\.svg)?$')
+
+# The destination part of "(<url> "title")": an optional <...> wrapper, then
+# the URL up to the first whitespace; whatever follows is the link title
+LINK_DESTINATION_PATTERN_BYTES = re.compile(rb'\s*(?:<(?P<bracketed>[^<>\n]*)>|(?P<bare>\S+))')
+
+def find_markdown_files_recursive(directory="."):
+    """
+    Walk a repository for markdown and README files, skipping vendored trees
+    """
+    files = []
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRECTORIES)
+        for name in sorted(names):
+            # Bare README files are markdown too; README.pdf or readme.md.gz aren't
+            if name.lower().endswith(MARKDOWN_EXTENSIONS) or name.lower() == 'readme':
+                files.append(os.path.join(root, name))
+    return files
+
+def _set_param(params, key, value):
+    """
+    Replace a raw key=value query parameter in place, or append it
+    """
+    for index, (name, _) in enumerate(params):
+        if name == key:
+            params[index] = (key, value)
+            return
+    params.append((key, value))
+
+def restyle_url(url, style=None, logo_color=None, colors=None):
+    """
+    Return url with the requested shields style, logoColor and colour
+
+    colors maps lowercased logo slugs or badge labels to colours. Only
+    the parameters being changed are touched; the rest of the URL keeps
+    its exact original encoding. Non-shields URLs are returned unchanged.
+    """
+    parts = urlsplit(url)
+    if parts.netloc not in SHIELDS_HOSTS:
+        return url
+
+    # Empty parameters ("?&style=...") are kept so untouched URLs round-trip
+    params = [tuple(param.split('=', 1)) if '=' in param else (param, None)
+              for param in (parts.query.split('&') if parts.query else [])]
+    path = parts.path
+    logo = next((unquote_plus(value).lower() for name, value in params if name == "logo" and value), None)
+
+    if style:
+        _set_param(params, "style", style)
+    if logo_color and logo:
+        _set_param(params, "logoColor", logo_color.lstrip('#'))
+
+    if colors:
+        static = STATIC_BADGE_PATTERN.match(path)
+        label = unquote_plus(path.split('/')[2].split('-')[0]).lower() if static else None
+        color = colors.get(logo) if logo else None
+        if color is None and label:
+            color = colors.get(label)
+        if color is not None:
+            color = color.lstrip('#')
+            if static and not any(name == "color" for name, _ in params):
+                path = f"{static.group('head')}-{color}{static.group('ext') or ''}"
+            else:
+                _set_param(params, "color", color)
+
+    query = '&'.join(name if value is None else f"{name}={value}" for name, value in params)
+    rebuilt = f"{parts.scheme}://{parts.netloc}{path}"
+    if query:
+        rebuilt += f"?{query}"
+    if parts.fragment:
+        rebuilt += f"#{parts.fragment}"
+
+    # Keep the original text when nothing changed (e.g. a trailing "?")
+    return url if rebuilt == url or (rebuilt + "?" == url) else rebuilt
+
+def find_edits(buffer, style=None, logo_color=None, colors=None):
+    """
+    Collect (start, end, replacement bytes) for every badge URL that changes
+    """
+    edits = []
+    for match in BADGE_PATTERN_BYTES.finditer(buffer):
+        # Only the URL is edited; a "title", 'title' or (title) after it is kept
+        destination = LINK_DESTINATION_PATTERN_BYTES.match(match.group('url'))
+        if not destination:
+            continue
+        group = 'bracketed' if destination.group('bracketed') is not None else 'bare'
+        raw = destination.group(group)
+        if b"shields.io" not in raw:
+            continue
+        try:
+            url = raw.decode('utf-8')
+        except UnicodeDecodeError:
+            continue
+        new_url = restyle_url(url, style, logo_color, colors)
+        if new_url != url:
+            offset = match.start('url')
+            edits.append((offset + destination.start(group), offset + destination.end(group),
+                          new_url.encode('utf-8')))
+    return edits
+
+def restyle_file(file_path, style=None, logo_color=None, colors=None, dry_run=False):
+    """
+    Rewrite one file's badge URLs; returns the list of (line, old, new) changes
+
+    The file is read through mmap and the output streamed to a temporary
+    file in the same directory: unchanged ranges are copied straight from
+    the map and only the edited URLs are written fresh, then the result is
+    swapped in with os.replace. Files with no changes are never opened for
+    writing. Symlinks are followed so the link target is edited, and files
+    with several hard links are rewritten in place to keep them shared.
+    """
+    real_path = os.path.realpath(file_path)
+    try:
+        with open(real_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                edits = find_edits(buffer, style, logo_color, colors)
+                if not edits:
+                    return []
+
+                changes = []
+                line = 1
+                position = 0
+                for start, end, replacement in edits:
+                    line += buffer[position:start].count(b'\n')
+                    position = start
+                    changes.append((line, buffer[start:end].decode('utf-8'), replacement.decode('utf-8')))
+
+                if dry_run:
+                    return changes
+
+                fd, temp_path = tempfile.mkstemp(prefix=".restyle-", dir=os.path.dirname(real_path))
+                try:
+                    with os.fdopen(fd, 'wb') as out:
+                        position = 0
+                        for start, end, replacement in edits:
+                            out.write(buffer[position:start])
+                            out.write(replacement)
+                            position = end
+                        out.write(buffer[position:])
+                    shutil.copymode(real_path, temp_path)
+                except BaseException:
+                    os.remove(temp_path)
+                    raise
+    except (OSError, ValueError) as e:
+        print(f"Error restyling {file_path}: {e}")
+        return []
+
+    if os.stat(real_path).st_nlink > 1:
+        # os.replace would detach this name from the other links
+        with open(temp_path, 'rb') as src, open(real_path, 'r+b') as dst:
+            shutil.copyfileobj(src, dst)
+            dst.truncate()
+        os.remove(temp_path)
+    else:
+        os.replace(temp_path, real_path)
+    return changes
+
+def _restyle_job(job):
+    """
+    Process pool entry point: unpack a (path, options) job
+    """
+    file_path, options = job
+    return file_path, restyle_file(file_path, **options)
+
+def restyle_files(file_paths, jobs=1, **options):
+    """
+    Restyle many files, across a process pool when jobs > 1
+
+    Returns {path: changes} for the files that changed.
+    """
+    work = [(path, options) for path in file_paths]
+    if jobs > 1 and len(work) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_restyle_job, work, chunksize=max(1, len(work) // (jobs * 4))))
+    else:
+        results = [_restyle_job(job) for job in work]
+    return {path: changes for path, changes in results if changes}
+
+def parse_color_overrides(values):
+    """
+    Parse NAME=COLOR options into {lowercased name: colour}
+    """
+    colors = {}
+    for value in values:
+        name, sep, color = value.partition('=')
+        if not sep or not name or not color:
+            raise argparse.ArgumentTypeError(f"expected NAME=COLOR, got {value!r}")
+        colors[name.strip().lower()] = color.strip()
+    return colors
+
+def main(argv=None):
+    """
+    Restyle shields.io badges across markdown files in place
+    """
+    parser = argparse.ArgumentParser(description="Rewrite shields.io badge styles and colours in markdown files")
+    parser.add_argument("paths", nargs="*", default=["."],
+                        help="markdown files or directories to walk (default: current directory)")
+    parser.add_argument("--style", choices=STYLES, help="badge style to apply")
+    parser.add_argument("--logo-color", metavar="COLOR", help="logoColor for badges that have a logo")
+    parser.add_argument("--color", action="append", default=[], metavar="NAME=COLOR",
+                        help="colour override by logo slug or badge label, e.g. python=3776AB (repeatable)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, metavar="N",
+                        help="process files across N worker processes (default: CPU count)")
+    parser.add_argument("--dry-run", "-n", action="store_true", help="show the changes without writing")
+    args = parser.parse_args(argv)
+
+    try:
+        colors = parse_color_overrides(args.color)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    if not (args.style or args.logo_color or colors):
+        parser.error("nothing to do: give --style, --logo-color and/or --color")
+
+    files = []
+    for path in args.paths:
+        files += find_markdown_files_recursive(path) if os.path.isdir(path) else [path]
+
+    results = restyle_files(files, args.jobs, style=args.style, logo_color=args.logo_color,
+                            colors=colors, dry_run=args.dry_run)
+
+    total = 0
+    for path, changes in sorted(results.items()):
+        total += len(changes)
+        print(f"{'🔍' if args.dry_run else '✏️ '} {path}: {len(changes)} badge(s)")
+        if args.dry_run:
+            for line, old, new in changes:
+                print(f"    {line}: {old}\n     → {new}")
+
+    verb = "would change" if args.dry_run else "changed"
+    print(f"✓ {len(files)} file(s) scanned, {len(results)} {verb}, {total} badge(s) restyled")
+
+if __name__ == "__main__":
+    main()
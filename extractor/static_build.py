@@ -0,0 +1,244 @@
+import os
+import re
+import gzip
+import json
+import shutil
+import hashlib
+import argparse
+
+from . import catalog
+
+UTILS_DIR = os.path.join(catalog.REPO_ROOT, "utils")
+DEFAULT_OUTPUT = os.path.join(UTILS_DIR, "dist")
+ASSET_MANIFEST = "asset-manifest.json"
+
+# Length of the content hash inserted into built file names; the HTML pages
+# strip a ".<hash>" of this length when deriving category keys from them
+HASH_LENGTH = 10
+COMPRESSED_EXTENSIONS = (".html", ".json")
+
+# Content of these elements is left exactly as written. Comments are matched
+# too, so an element name mentioned inside a comment doesn't open a block.
+PRESERVE_OR_COMMENT_PATTERN = re.compile(r'<!--.*?-->|<(pre|textarea|script)\b', re.IGNORECASE | re.DOTALL)
+HTML_COMMENT_PATTERN = re.compile(r'<!--(?!\[if).*?-->', re.DOTALL)
+
+def content_hash(data):
+    """
+    Short hex digest used to version a built file name
+    """
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+def _contains(directory, path):
+    """
+    Whether path is directory itself or somewhere below it
+    """
+    directory = os.path.realpath(directory)
+    path = os.path.realpath(path)
+    return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+def check_output_dir(output_dir, source_dir, catalog_dir):
+    """
+    Raise ValueError unless output_dir is safe to delete and rebuild
+
+    Only an empty directory or a previous build (one holding an
+    asset-manifest.json) is replaced, and never one that holds the
+    pages or the catalog the site is built from.
+    """
+    for label, path in (("source", source_dir), ("catalog", catalog_dir)):
+        if _contains(output_dir, path):
+            raise ValueError(f"output directory {output_dir} contains the {label} directory {path}")
+    if (os.path.isdir(output_dir) and os.listdir(output_dir)
+            and not os.path.isfile(os.path.join(output_dir, ASSET_MANIFEST))):
+        raise ValueError(f"output directory {output_dir} is not empty and holds no "
+                         f"{ASSET_MANIFEST} from a previous build; refusing to replace it")
+
+def minify_json(file_path):
+    """
+    Re-serialize a JSON file without whitespace
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _minify_markup(text, at_line_start, at_end):
+    """
+    Drop comments, indentation and blank lines from markup between preserved elements
+
+    Whitespace next to a preserved element on the same line is kept, since
+    only whole-line indentation is known to be insignificant.
+    """
+    lines = HTML_COMMENT_PATTERN.sub('', text).split('\n')
+    if len(lines) == 1:
+        return lines[0].strip() if at_line_start and at_end else lines[0]
+
+    first = lines[0].strip() if at_line_start else lines[0].rstrip()
+    last = lines[-1].strip() if at_end else lines[-1].lstrip()
+    middle = [line.strip() for line in lines[1:-1]]
+
+    kept = [line for line in middle if line]
+    if first or not at_line_start:
+        kept.insert(0, first)
+    if last or not at_end:
+        kept.append(last)
+    return '\n'.join(kept)
+
+def minify_html(text):
+    """
+    Conservatively shrink an HTML page
+
+    Drops comments, indentation and blank lines. <pre>, <textarea> and
+    <script> elements are copied untouched, comment-like text included,
+    since their content is significant (template literals, strings such
+    as '<!-- ... -->', placeholder text).
+    """
+    parts = []
+    position = 0
+    length = len(text)
+
+    while position < length:
+        match = PRESERVE_OR_COMMENT_PATTERN.search(text, position)
+        while match and match.group(1) is None:
+            match = PRESERVE_OR_COMMENT_PATTERN.search(text, match.end())
+        if match is None:
+            parts.append(_minify_markup(text[position:], position == 0 or text[position - 1] == '\n', True))
+            break
+
+        tag = match.group(1).lower()
+        close = re.compile(rf'</{tag}\s*>', re.IGNORECASE).search(text, match.end())
+        end = close.end() if close else length
+
+        parts.append(_minify_markup(text[position:match.start()],
+                                    position == 0 or text[position - 1] == '\n', False))
+        parts.append(text[match.start():end])
+        position = end
+
+    return ''.join(parts).strip('\n') + '\n'
+
+def rewrite_references(text, renames):
+    """
+    Point quoted or path references to original file names at hashed names
+    """
+    if not renames:
+        return text
+    names = '|'.join(re.escape(name) for name in sorted(renames, key=len, reverse=True))
+    pattern = re.compile(rf'(?<=[/\'"`])({names})(?=[\'"`?#])')
+    return pattern.sub(lambda match: renames[match.group(1)], text)
+
+def write_compressed(file_path, data, use_brotli=True):
+    """
+    Write .gz (and .br when brotli is installed) variants next to a file
+
+    gzip output carries no timestamp so rebuilding unchanged input gives
+    byte-identical files. Returns the variants written.
+    """
+    written = []
+    with open(file_path + ".gz", 'wb') as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    written.append(file_path + ".gz")
+
+    if use_brotli:
+        try:
+            import brotli
+        except ImportError:
+            return written
+        with open(file_path + ".br", 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+        written.append(file_path + ".br")
+
+    return written
+
+def build_site(source_dir=UTILS_DIR, output_dir=DEFAULT_OUTPUT, catalog_dir=None, compress=True):
+    """
+    Build the static frontend into output_dir
+
+    Category JSON is minified and written as <name>.<hash>.json, HTML
+    pages are minified with their references to those files rewritten,
+    and every HTML/JSON file gets pre-compressed variants for nginx's
+    gzip_static/brotli_static. Returns the {original: built} asset manifest.
+    output_dir is replaced, so see check_output_dir for what it may be.
+    """
+    catalog_dir = catalog_dir or os.path.join(source_dir, "badge_categories")
+    data_dir = os.path.join(output_dir, "badge_categories")
+
+    check_output_dir(output_dir, source_dir, catalog_dir)
+    if os.path.exists(output_dir):
+        shutil.rmtree(output_dir)
+    os.makedirs(data_dir)
+
+    renames = {}
+    outputs = {}
+
+    for file_path in catalog.category_files(catalog_dir):
+        data = minify_json(file_path)
+        name = os.path.basename(file_path)
+        hashed = f"{os.path.splitext(name)[0]}.{content_hash(data)}.json"
+        renames[name] = hashed
+        outputs[os.path.join(data_dir, hashed)] = data
+
+    for name in sorted(os.listdir(source_dir)):
+        if not name.endswith(".html"):
+            continue
+        with open(os.path.join(source_dir, name), 'r', encoding='utf-8') as f:
+            text = f.read()
+        html = minify_html(rewrite_references(text, renames))
+        # Pages stay at stable URLs; only the data they point to is versioned
+        outputs[os.path.join(output_dir, name)] = html.encode('utf-8')
+
+    manifest = {f"badge_categories/{name}": f"badge_categories/{hashed}"
+                for name, hashed in sorted(renames.items())}
+    outputs[os.path.join(output_dir, ASSET_MANIFEST)] = (
+        json.dumps(manifest, indent=2) + "\n").encode('utf-8')
+
+    for file_path, data in outputs.items():
+        with open(file_path, 'wb') as f:
+            f.write(data)
+        if compress and file_path.endswith(COMPRESSED_EXTENSIONS):
+            write_compressed(file_path, data)
+
+    return manifest
+
+def directory_size(directory, suffix=""):
+    """
+    Total bytes of the files under directory ending in suffix
+    """
+    total = 0
+    for root, _, files in os.walk(directory):
+        for file in files:
+            if file.endswith(suffix):
+                total += os.path.getsize(os.path.join(root, file))
+    return total
+
+def main(argv=None):
+    """
+    Build the minified, hashed and pre-compressed frontend for nginx
+    """
+    parser = argparse.ArgumentParser(description="Build the utils/ frontend for static serving")
+    parser.add_argument("--source", default=UTILS_DIR,
+                        help="directory holding the HTML pages (default: utils)")
+    parser.add_argument("--catalog-dir", help="category JSON directory (default: <source>/badge_categories)")
+    parser.add_argument("--output", "-o", default=DEFAULT_OUTPUT,
+                        help="build directory, replaced on every run; must be empty or a previous "
+                             "build (default: utils/dist)")
+    parser.add_argument("--no-compress", action="store_true", help="skip the .gz/.br variants")
+    args = parser.parse_args(argv)
+
+    try:
+        manifest = build_site(args.source, args.output, args.catalog_dir, not args.no_compress)
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+    if brotli is None and not args.no_compress:
+        print("⚠️  brotli is not installed; only .gz variants were written (pip install brotli)")
+
+    print(f"✓ Built {len(manifest)} category files into {args.output}")
+    for suffix in (".json", ".html", ".gz", ".br"):
+        size = directory_size(args.output, suffix)
+        if size:
+            print(f"  {suffix:<6} {size / 1024:8.1f} KB")
+
+if __name__ == "__main__":
+    main()
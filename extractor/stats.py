@@ -0,0 +1,192 @@
+import math
+import heapq
+import hashlib
+
+def _hash64(value):
+    """
+    Stable 64-bit hash of a string (unlike hash(), the same in every process)
+    """
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+
+class HyperLogLog:
+    """
+    Fixed-size distinct-count estimator
+
+    Uses 2 ** precision one-byte registers (4 KB at the default precision
+    of 12, for a standard error of about 1.6%). Sketches built in separate
+    workers can be combined with merge().
+    """
+
+    def __init__(self, precision=12):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value):
+        hashed = _hash64(value)
+        index = hashed >> (64 - self.precision)
+        remainder = hashed & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError("cannot merge sketches with different precision")
+        self.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -register for register in self.registers)
+
+        # Small cardinalities: linear counting over the empty registers
+        empty = self.registers.count(0)
+        if raw <= 2.5 * m and empty:
+            return round(m * math.log(m / empty))
+        return round(raw)
+
+class TopCounter:
+    """
+    Approximate top-N counter with bounded memory (Space-Saving)
+
+    Tracks at most capacity keys. When a new key arrives at capacity it
+    replaces the current minimum and inherits its count, so counts are
+    upper bounds; keys with a true count above total / capacity are never
+    lost. Exact while fewer than capacity distinct keys have been seen.
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.counts = {}
+        # Lazy min-heap of (count, key), built on the first eviction; stale
+        # entries are skipped when popped and the heap is compacted when it grows
+        self.heap = []
+
+    def add(self, key, count=1):
+        if key in self.counts or len(self.counts) < self.capacity:
+            self.counts[key] = self.counts.get(key, 0) + count
+            if not self.heap:
+                return
+        else:
+            if not self.heap:
+                self._rebuild_heap()
+            while True:
+                smallest_count, smallest = heapq.heappop(self.heap)
+                if self.counts.get(smallest) == smallest_count:
+                    break
+            del self.counts[smallest]
+            self.counts[key] = smallest_count + count
+
+        heapq.heappush(self.heap, (self.counts[key], key))
+        if len(self.heap) > 4 * self.capacity:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self.heap = [(value, name) for name, value in self.counts.items()]
+        heapq.heapify(self.heap)
+
+    def merge(self, other):
+        for key, count in other.counts.items():
+            self.add(key, count)
+
+    def top(self, n):
+        """
+        The n most frequent keys as [key, count] pairs, ties broken by key
+        """
+        return [[key, count] for key, count in
+                sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))[:n]]
+
+class BadgeStats:
+    """
+    Streaming summary statistics over extracted badges
+
+    Feed badges one at a time with add(); memory stays bounded however
+    many flow through. Category counts are exact, technologies and sections
+    are kept in TopCounters and distinct technologies/URLs in HyperLogLog
+    sketches. The exact technology list is kept too until it grows past
+    exact_limit names, after which only the estimate is reported.
+    """
+
+    def __init__(self, top_n=20, capacity=1000, precision=12, exact_limit=10_000):
+        self.top_n = top_n
+        self.exact_limit = exact_limit
+        self.total = 0
+        self.files = set()
+        self.categories = {}
+        self.sections = TopCounter(capacity)
+        self.technologies = TopCounter(capacity)
+        self.technology_sketch = HyperLogLog(precision)
+        self.url_sketch = HyperLogLog(precision)
+        self.exact_technologies = set()
+
+    def add(self, badge, category=None):
+        self.total += 1
+        self.files.add(badge.get("source_file", ""))
+        if category is not None:
+            self.categories[category] = self.categories.get(category, 0) + 1
+        if badge.get("section"):
+            self.sections.add(badge["section"])
+
+        technology = badge.get("technology", "")
+        self.technologies.add(technology)
+        self.technology_sketch.add(technology)
+        self.url_sketch.add(badge.get("badge_url", ""))
+
+        if self.exact_technologies is not None:
+            self.exact_technologies.add(technology)
+            if len(self.exact_technologies) > self.exact_limit:
+                self.exact_technologies = None
+
+    def add_category(self, category, badges):
+        for badge in badges:
+            self.add(badge, category)
+
+    def merge(self, other):
+        """
+        Fold in stats gathered elsewhere, e.g. by another worker
+        """
+        self.total += other.total
+        self.files |= other.files
+        for category, count in other.categories.items():
+            self.categories[category] = self.categories.get(category, 0) + count
+        self.sections.merge(other.sections)
+        self.technologies.merge(other.technologies)
+        self.technology_sketch.merge(other.technology_sketch)
+        self.url_sketch.merge(other.url_sketch)
+
+        if self.exact_technologies is not None and other.exact_technologies is not None:
+            self.exact_technologies |= other.exact_technologies
+            if len(self.exact_technologies) > self.exact_limit:
+                self.exact_technologies = None
+        else:
+            self.exact_technologies = None
+
+    def unique_technologies(self):
+        """
+        Sorted distinct technology names, or None once past exact_limit
+        """
+        if self.exact_technologies is None:
+            return None
+        return sorted(self.exact_technologies)
+
+    def unique_technologies_count(self):
+        """
+        Exact distinct technology count when known, else the sketch estimate
+        """
+        if self.exact_technologies is not None:
+            return len(self.exact_technologies)
+        return self.technology_sketch.estimate()
+
+    def summary(self):
+        """
+        Summary fields shared by the extractors' extraction_summary.json
+        """
+        return {
+            "total_badges_found": self.total,
+            "files_processed": sorted(self.files),
+            "unique_technologies_count": self.unique_technologies_count(),
+            "unique_technologies_exact": self.exact_technologies is not None,
+            "unique_badge_urls_estimate": self.url_sketch.estimate(),
+            "top_technologies": self.technologies.top(self.top_n),
+            "top_sections": self.sections.top(self.top_n),
+        }
@@ -0,0 +1,312 @@
+import os
+import re
+import sys
+import json
+import argparse
+
+from . import catalog
+
+CURATED_CATALOG = os.path.join(catalog.REPO_ROOT, "extractor", "badges_categories.json")
+DEFAULT_SOURCES = (catalog.DEFAULT_CATALOG_DIR, CURATED_CATALOG)
+DEFAULT_INDEX = os.path.join(catalog.REPO_ROOT, "extractor", "package_index.json")
+
+# Package, module and image names whose badge key differs from the name
+PACKAGE_ALIASES = {
+    "psycopg": "postgresql", "psycopg2": "postgresql", "psycopg2binary": "postgresql",
+    "asyncpg": "postgresql", "pg": "postgresql", "postgres": "postgresql",
+    "pymongo": "mongodb", "mongoose": "mongodb", "motor": "mongodb", "mongo": "mongodb",
+    "mysqlclient": "mysql", "pymysql": "mysql", "mysql2": "mysql",
+    "redispy": "redis", "ioredis": "redis",
+    "djangorestframework": "djangorest",
+    "torch": "pytorch", "torchvision": "pytorch",
+    "tensorflowgpu": "tensorflow", "tfkeras": "keras",
+    "sklearn": "scikitlearn",
+    "opencvpython": "opencv", "opencvpythonheadless": "opencv",
+    "pythonsocketio": "socketio", "socketioclient": "socketio",
+    "reactdom": "react", "reactscripts": "react",
+    "vue": "vuejs", "nuxt": "nuxtjs",
+    "angularcore": "angular", "nestjscore": "nestjs",
+    "next": "nextjs", "express": "expressjs",
+    "three": "threejs", "electron": "electronjs",
+    "node": "nodejs", "golang": "go",
+    "pika": "rabbitmq", "amqplib": "rabbitmq",
+    "elasticsearchpy": "elasticsearch",
+    "httpd": "apache",
+}
+
+# Badges implied by the kind of manifest itself
+MANIFEST_TECHNOLOGIES = {
+    "requirements": ("python",),
+    "pyproject": ("python",),
+    "package.json": ("nodejs",),
+    "go.mod": ("go",),
+    "dockerfile": ("docker",),
+    "compose": ("docker",),
+}
+
+SKIP_DIRECTORIES = {".git", "node_modules", ".venv", "venv", "__pycache__",
+                    "dist", "build", "vendor", ".tox", ".mypy_cache"}
+
+REQUIREMENT_NAME_PATTERN = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9._-]*)')
+# requirements.txt comments start at a "#" after whitespace, so "#egg=" survives
+REQUIREMENTS_COMMENT_PATTERN = re.compile(r'(?:^|\s)#.*')
+EDITABLE_OPTION_PATTERN = re.compile(r'^(?:-e|--editable)(?:\s+|=)')
+EGG_PATTERN = re.compile(r'[#&]egg=([A-Za-z0-9][A-Za-z0-9._-]*)')
+VCS_PREFIXES = ("git+", "hg+", "svn+", "bzr+")
+DOCKER_FROM_PATTERN = re.compile(r'^\s*FROM\s+(?:--\S+\s+)*(\S+)', re.IGNORECASE | re.MULTILINE)
+COMPOSE_IMAGE_PATTERN = re.compile(r'^\s*image:\s*["\']?([^\s"\']+)', re.MULTILINE)
+GO_REQUIRE_PATTERN = re.compile(r'^\s*(?:require\s+)?([\w.-]+\.[\w.-]+/[^\s]+)\s+v', re.MULTILINE)
+TOML_REQUIREMENT_PATTERN = re.compile(r'["\']([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*[<>=!~;"\']')
+NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]')
+
+def package_key(name):
+    """
+    Reduce a package, module or image name to its index key
+    """
+    key = NON_ALNUM_PATTERN.sub('', name.lower())
+    return PACKAGE_ALIASES.get(key, key)
+
+def manifest_kind(file_name):
+    """
+    Classify a file name as a supported manifest, or None
+    """
+    lower = file_name.lower()
+    if lower.startswith("requirements") and lower.endswith(".txt"):
+        return "requirements"
+    if lower == "pyproject.toml":
+        return "pyproject"
+    if lower in ("package.json", "go.mod"):
+        return lower
+    if lower.startswith("dockerfile") or lower.endswith(".dockerfile"):
+        return "dockerfile"
+    if lower.startswith(("docker-compose", "compose")) and lower.endswith((".yml", ".yaml")):
+        return "compose"
+    return None
+
+def find_manifests(directory="."):
+    """
+    Walk a repository and return the manifest files it contains
+    """
+    manifests = []
+
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRECTORIES)
+        for file in sorted(files):
+            if manifest_kind(file):
+                manifests.append(os.path.join(root, file))
+
+    return manifests
+
+def _image_name(image):
+    """
+    Strip registry, namespace, tag and digest from a container image reference
+    """
+    image = image.split("@", 1)[0]
+    name = image.rsplit("/", 1)[-1]
+    return name.split(":", 1)[0]
+
+def _pyproject_dependencies(content):
+    """
+    Dependency names from a pyproject.toml (PEP 621, Poetry and dependency groups)
+    """
+    try:
+        import tomllib
+    except ImportError:
+        return TOML_REQUIREMENT_PATTERN.findall(content)
+
+    try:
+        data = tomllib.loads(content)
+    except tomllib.TOMLDecodeError:
+        return TOML_REQUIREMENT_PATTERN.findall(content)
+
+    requirements = list(data.get("project", {}).get("dependencies", []))
+    for group in data.get("project", {}).get("optional-dependencies", {}).values():
+        requirements += group
+    for group in data.get("dependency-groups", {}).values():
+        requirements += [item for item in group if isinstance(item, str)]
+
+    names = []
+    for requirement in requirements:
+        match = REQUIREMENT_NAME_PATTERN.match(requirement)
+        if match:
+            names.append(match.group(1))
+
+    poetry = data.get("tool", {}).get("poetry", {})
+    names += list(poetry.get("dependencies", {}))
+    names += list(poetry.get("dev-dependencies", {}))
+    for group in poetry.get("group", {}).values():
+        names += list(group.get("dependencies", {}))
+
+    return names
+
+def _requirement_name(line):
+    """
+    Project name of a requirements.txt line, or None
+
+    URL and VCS lines ("git+https://...") only name a project through
+    "#egg=name" or a PEP 508 "name @ url"; the scheme is not a dependency.
+    """
+    line = REQUIREMENTS_COMMENT_PATTERN.sub('', line).strip()
+    line = EDITABLE_OPTION_PATTERN.sub('', line)
+    if not line or line.startswith("-"):
+        return None
+
+    match = REQUIREMENT_NAME_PATTERN.match(line)
+    if "://" in line or line.lower().startswith(VCS_PREFIXES):
+        if match and line[match.end():].lstrip().startswith("@"):
+            return match.group(1)
+        egg = EGG_PATTERN.search(line)
+        return egg.group(1) if egg else None
+    return match.group(1) if match else None
+
+def parse_manifest(file_path):
+    """
+    Return the dependency and tool names a manifest mentions
+
+    Worker entry point for the process pool; unreadable or malformed
+    files yield an empty list.
+    """
+    kind = manifest_kind(os.path.basename(file_path))
+
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read()
+    except OSError as e:
+        print(f"Error reading file {file_path}: {e}")
+        return []
+
+    names = list(MANIFEST_TECHNOLOGIES.get(kind, ()))
+
+    if kind == "requirements":
+        for line in content.splitlines():
+            name = _requirement_name(line)
+            if name:
+                names.append(name)
+    elif kind == "pyproject":
+        names += _pyproject_dependencies(content)
+    elif kind == "package.json":
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            return names
+        for field in ("dependencies", "devDependencies", "peerDependencies"):
+            for package in data.get(field, {}):
+                names.append(package)
+                # "@angular/core" -> also try "angular"
+                if package.startswith("@"):
+                    names.append(package[1:].split("/", 1)[0])
+    elif kind == "go.mod":
+        for module in GO_REQUIRE_PATTERN.findall(content):
+            parts = module.split("/")
+            names += [parts[-1], parts[-2] if len(parts) > 2 else parts[-1]]
+    elif kind == "dockerfile":
+        names += [_image_name(image) for image in DOCKER_FROM_PATTERN.findall(content)]
+    elif kind == "compose":
+        names += [_image_name(image) for image in COMPOSE_IMAGE_PATTERN.findall(content)]
+
+    return names
+
+def build_package_index(sources=DEFAULT_SOURCES):
+    """
+    Map package keys to badges from the catalog sources
+
+    Categories are stored as catalog keys whichever source a badge came
+    from. Every badge is indexed under its normalized name and shields logo slug
+    (see fuzzy_lookup.badge_keys). Names take precedence over logo slugs,
+    so "react" maps to React rather than another badge using its logo, and
+    earlier sources win on remaining conflicts.
+    """
+    from .catalog_diff import load_snapshot
+    from .fuzzy_lookup import badge_keys, normalize
+
+    # Combined snapshots are keyed by display name ("📚 Frameworks, ..."),
+    # directories by file name; group both under the catalog key
+    records = [(catalog.category_key(category), name, badge_url)
+               for source in sources for category, name, badge_url in load_snapshot(source)]
+
+    packages = {}
+    for category, name, badge_url in records:
+        packages.setdefault(normalize(name).replace(' ', ''), [category, name, badge_url])
+    for category, name, badge_url in records:
+        for key in badge_keys(name, badge_url):
+            packages.setdefault(key.replace(' ', ''), [category, name, badge_url])
+    packages.pop('', None)
+
+    return {"packages": dict(sorted(packages.items()))}
+
+def write_package_index(index_path=DEFAULT_INDEX, sources=DEFAULT_SOURCES):
+    """
+    Build the package index and save it next to the catalog
+    """
+    index = build_package_index(sources)
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=1, ensure_ascii=False)
+        f.write('\n')
+    return index_path
+
+def load_package_index(index_path=DEFAULT_INDEX):
+    """
+    Load the shipped package index
+    """
+    with open(index_path, 'r', encoding='utf-8') as f:
+        return json.load(f)["packages"]
+
+def suggest_badges(manifests, packages, jobs=1):
+    """
+    Parse manifests (in parallel when jobs > 1) and map their names to badges
+
+    Returns badges as (category, name, badge_url) tuples, deduplicated
+    and sorted by category then name.
+    """
+    if jobs > 1 and len(manifests) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            parsed = list(executor.map(parse_manifest, manifests, chunksize=16))
+    else:
+        parsed = [parse_manifest(path) for path in manifests]
+
+    badges = set()
+    for names in parsed:
+        for name in names:
+            badge = packages.get(package_key(name))
+            if badge:
+                badges.add(tuple(badge))
+
+    return sorted(badges, key=lambda badge: (badge[0].lower(), badge[1].lower()))
+
+def main(argv=None):
+    """
+    Suggest a badge row for a repository from its dependency manifests
+    """
+    parser = argparse.ArgumentParser(description="Suggest badges from a repository's dependency manifests")
+    parser.add_argument("directory", nargs="?", default=".",
+                        help="repository to scan (default: current directory)")
+    parser.add_argument("--index", default=DEFAULT_INDEX,
+                        help="package index file (default: extractor/package_index.json)")
+    parser.add_argument("--build-index", action="store_true",
+                        help="rebuild the package index from the catalog and exit")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, metavar="N",
+                        help="parse manifests across N worker processes (default: CPU count)")
+    parser.add_argument("--separator", default=" ", help="text between badges (default: a space)")
+    parser.add_argument("--json", action="store_true", help="print the suggested badges as JSON")
+    args = parser.parse_args(argv)
+
+    if args.build_index:
+        index_path = write_package_index(args.index)
+        print(f"✓ Package index saved to {index_path}")
+        return
+
+    packages = load_package_index(args.index)
+    manifests = find_manifests(args.directory)
+    badges = suggest_badges(manifests, packages, args.jobs)
+
+    if args.json:
+        print(json.dumps([{"category": c, "name": n, "badge_url": u, "markdown": f"![{n}]({u})"}
+                          for c, n, u in badges], indent=2, ensure_ascii=False))
+        return
+
+    print(f"📁 {len(manifests)} manifest(s), {len(badges)} badge(s)", file=sys.stderr)
+    print(args.separator.join(f"![{name}]({url})" for _, name, url in badges))
+
+if __name__ == "__main__":
+    main()
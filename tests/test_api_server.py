@@ -0,0 +1,93 @@
+import asyncio
+import json
+import shutil
+
+from extractor import catalog
+from extractor.api_server import CatalogServer
+
+def copy_catalog(tmp_path):
+    directory = tmp_path / "catalog"
+    shutil.copytree(catalog.DEFAULT_CATALOG_DIR, directory)
+    return directory
+
+async def wait_for(condition, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.02)
+
+def test_watcher_survives_malformed_category(tmp_path):
+    directory = copy_catalog(tmp_path)
+    blog = directory / "blog.json"
+    original = blog.read_text(encoding="utf-8")
+    server = CatalogServer(str(directory), reload_interval=0.05)
+
+    async def scenario():
+        watcher = asyncio.create_task(server.watch())
+        try:
+            # Valid JSON that is not a category document
+            blog.write_text("[]", encoding="utf-8")
+            await asyncio.sleep(0.3)
+            assert not watcher.done()
+            assert server.reloads == 0
+
+            data = json.loads(original)
+            data["badges"] = data["badges"][:1]
+            blog.write_text(json.dumps(data), encoding="utf-8")
+            await wait_for(lambda: server.reloads == 1)
+        finally:
+            watcher.cancel()
+
+    asyncio.run(scenario())
+
+def exchange(server, request):
+    """
+    Send raw request bytes on one connection and read until the server closes it
+    """
+    async def scenario():
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            response = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+        finally:
+            listener.close()
+            await listener.wait_closed()
+        return response
+
+    return asyncio.run(scenario())
+
+def test_rejected_method_closes_the_connection(tmp_path):
+    body = b"GET /categories HTTP/1.1\r\nHost: x\r\n\r\n"
+    server = CatalogServer(str(copy_catalog(tmp_path)), reload_interval=0)
+    response = exchange(server, b"POST /categories HTTP/1.1\r\nHost: x\r\nContent-Length: "
+                        + str(len(body)).encode() + b"\r\n\r\n" + body)
+    assert response.startswith(b"HTTP/1.1 405")
+    assert b"Connection: close" in response
+    # The body was not parsed as a second request
+    assert response.count(b"HTTP/1.1 ") == 1
+
+def test_head_errors_have_no_body(tmp_path):
+    server = CatalogServer(str(copy_catalog(tmp_path)), reload_interval=0)
+    response = exchange(server, b"HEAD /nope HTTP/1.1\r\nHost: x\r\n\r\n"
+                                b"HEAD /badges?page=0 HTTP/1.1\r\nHost: x\r\n\r\n"
+                                b"GET /health HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n")
+    not_found, bad_request, health = response.split(b"HTTP/1.1 ")[1:]
+
+    assert not_found.startswith(b"404") and not_found.endswith(b"\r\n\r\n")
+    assert bad_request.startswith(b"400") and bad_request.endswith(b"\r\n\r\n")
+    assert health.startswith(b"200")
+    assert json.loads(health.split(b"\r\n\r\n", 1)[1])["status"] == "ok"
+
+def test_not_modified_has_no_content_length(tmp_path):
+    server = CatalogServer(str(copy_catalog(tmp_path)), reload_interval=0)
+    first = exchange(server, b"GET /health HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n")
+    etag = next(line.split(b": ", 1)[1] for line in first.split(b"\r\n") if line.startswith(b"ETag: "))
+
+    response = exchange(server, b"GET /health HTTP/1.1\r\nHost: x\r\nConnection: close\r\n"
+                                b"If-None-Match: " + etag + b"\r\n\r\n")
+    assert response.startswith(b"HTTP/1.1 304")
+    assert b"Content-Length" not in response
+    assert response.endswith(b"\r\n\r\n")
@@ -0,0 +1,51 @@
+import json
+import os
+
+import pytest
+
+from extractor import binary_catalog, catalog
+from extractor.binary_catalog import BinaryCatalog, export_catalog, write_json
+
+COMBINED = os.path.join(catalog.REPO_ROOT, "extractor", "badges_categories.json")
+
+def read_tree(path):
+    if os.path.isdir(path):
+        return {name: read_tree(os.path.join(path, name)) for name in sorted(os.listdir(path))}
+    with open(path, 'rb') as f:
+        return f.read()
+
+@pytest.mark.parametrize("source", [catalog.DEFAULT_CATALOG_DIR, COMBINED])
+def test_round_trip_is_byte_identical(tmp_path, source):
+    output = tmp_path / "catalog.bcat"
+    count = export_catalog(source, str(output))
+    assert binary_catalog.is_binary_catalog(str(output))
+
+    restored = tmp_path / ("restored" if os.path.isdir(source) else "restored.json")
+    with BinaryCatalog(str(output)) as binary:
+        assert len(binary) == count
+        write_json(binary, str(restored))
+
+    assert read_tree(str(restored)) == read_tree(source)
+
+def test_lookup_matches_the_json(tmp_path):
+    output = tmp_path / "catalog.bcat"
+    export_catalog(catalog.DEFAULT_CATALOG_DIR, str(output))
+    with open(os.path.join(catalog.DEFAULT_CATALOG_DIR, "blog.json"), encoding="utf-8") as f:
+        blog = json.load(f)
+
+    with BinaryCatalog(str(output)) as binary:
+        assert binary.category_name("blog") == blog["category"]
+        badges = binary.get_category("blog")
+        assert [(b["name"], b["badge_url"], b["markdown"]) for b in badges] == [
+            (b["name"], b["badge"], b["markdown"]) for b in blog["badges"]]
+        assert binary.badge(binary.categories["blog"][1]) == badges[0]
+        assert sum(1 for _ in binary.iter_badges(["blog"])) == len(blog["badges"])
+        with pytest.raises(KeyError):
+            binary.get_category("nope")
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "not.bcat"
+    path.write_bytes(b"JSON" + bytes(64))
+    assert not binary_catalog.is_binary_catalog(str(path))
+    with pytest.raises(ValueError, match="not a binary catalog"):
+        BinaryCatalog(str(path))
@@ -0,0 +1,74 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from extractor import catalog
+
+def write_category(directory, key, category, names):
+    badges = [{"name": name, "badge": f"https://img.shields.io/badge/{name}-blue"} for name in names]
+    (directory / f"{key}.json").write_text(json.dumps({"category": category, "badges": badges}, indent=2),
+                                           encoding="utf-8")
+
+@pytest.fixture
+def catalog_dir(tmp_path):
+    directory = tmp_path / "badge_categories"
+    directory.mkdir()
+    write_category(directory, "languages", "Languages", ["Go", "Rust"])
+    write_category(directory, "databases", "Databases", ["Redis"])
+    catalog.clear_cache()
+    yield str(directory)
+    catalog.clear_cache()
+
+def test_manifest_lives_beside_the_directory(catalog_dir):
+    path = catalog.write_manifest(catalog_dir)
+
+    assert path == catalog_dir + catalog.MANIFEST_SUFFIX
+    assert sorted(os.listdir(catalog_dir)) == ["databases.json", "languages.json"]
+    manifest = json.loads(open(path, encoding="utf-8").read())
+    assert manifest["categories"]["languages"]["badges_count"] == 2
+    assert catalog.manifest_is_current(manifest, catalog_dir)
+
+def test_badges_are_read_through_the_manifest_offset(catalog_dir):
+    catalog.write_manifest(catalog_dir)
+
+    assert catalog.category_names(catalog_dir) == ["databases", "languages"]
+    assert [badge["name"] for badge in catalog.get_category("languages", catalog_dir)] == ["Go", "Rust"]
+    assert [(name, badge["name"]) for name, badge in catalog.iter_badges(None, catalog_dir)] == [
+        ("databases", "Redis"), ("languages", "Go"), ("languages", "Rust")]
+    with pytest.raises(KeyError, match="Unknown badge category"):
+        catalog.category_info("nope", catalog_dir)
+
+@pytest.mark.parametrize("change, expected", [
+    ("add", ["databases", "languages", "tools"]),
+    ("remove", ["languages"]),
+    ("resize", ["databases", "languages"]),
+])
+def test_stale_manifest_is_rebuilt(catalog_dir, change, expected):
+    catalog.write_manifest(catalog_dir)
+    directory = Path(catalog_dir)
+    if change == "add":
+        write_category(directory, "tools", "Tools", ["Vim"])
+    elif change == "remove":
+        (directory / "databases.json").unlink()
+    else:
+        write_category(directory, "languages", "Languages", ["Go", "Rust", "Zig"])
+    catalog.clear_cache()
+
+    manifest = catalog.load_manifest(catalog_dir)
+
+    assert sorted(manifest["categories"]) == expected
+    assert catalog.manifest_is_current(manifest, catalog_dir)
+    names = [badge["name"] for badge in catalog.get_category("languages", catalog_dir)]
+    assert names == (["Go", "Rust", "Zig"] if change == "resize" else ["Go", "Rust"])
+
+def test_missing_or_corrupt_manifest_is_rebuilt(catalog_dir):
+    with open(catalog.manifest_path(catalog_dir), "w", encoding="utf-8") as f:
+        f.write("{not json")
+
+    assert catalog.category_info("languages", catalog_dir)["badges_count"] == 2
+
+def test_category_key_matches_file_names():
+    assert catalog.category_key("🧑‍💻 Developer/Forums") == "developerforums"
+    assert catalog.category_key("📚 Frameworks, Platforms and Libraries") == "frameworks_platforms_and_libraries"
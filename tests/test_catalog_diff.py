@@ -0,0 +1,49 @@
+import json
+
+from extractor.catalog_diff import diff_snapshots, load_snapshot
+
+C = ("languages", "C", "https://img.shields.io/badge/c-00599C")
+C_SHARP = ("languages", "C#", "https://img.shields.io/badge/c%23-239120")
+C_PLUS_PLUS = ("languages", "C++", "https://img.shields.io/badge/c++-%2300599C")
+
+def names(entries):
+    return [entry["name"] for entry in entries]
+
+def test_removing_c_sharp_does_not_pair_c_plus_plus():
+    changes = diff_snapshots([C, C_SHARP, C_PLUS_PLUS], [C, C_PLUS_PLUS])
+
+    assert changes["summary"] == {"added": 0, "removed": 1, "renamed": 0, "moved": 0, "url_changed": 0}
+    assert names(changes["removed"]) == ["C#"]
+
+def test_canonical_id_and_url_pair_renames():
+    old = [C_SHARP, ("databases", "MongoDB", "https://img.shields.io/badge/mongo-green")]
+    new = [("languages", "c#", C_SHARP[2]),
+           ("databases", "Mongo DB Atlas", "https://img.shields.io/badge/mongo-green")]
+
+    changes = diff_snapshots(old, new)
+
+    assert changes["renamed"] == [
+        {"category": "databases", "from": "MongoDB", "to": "Mongo DB Atlas"},
+        {"category": "languages", "from": "C#", "to": "c#"},
+    ]
+    assert not changes["added"] and not changes["removed"]
+
+def test_moves_and_url_changes():
+    new = [("other", "C", C[2]), ("languages", "C#", "https://img.shields.io/badge/csharp-239120")]
+
+    changes = diff_snapshots([C, C_SHARP], new)
+
+    assert changes["moved"] == [{"name": "C", "from": "languages", "to": "other"}]
+    assert names(changes["url_changed"]) == ["C#"]
+
+def test_directory_and_combined_file_use_the_same_categories(tmp_path):
+    badges = [{"name": "Go", "badge": "https://img.shields.io/badge/go-blue"}]
+    directory = tmp_path / "badge_categories"
+    directory.mkdir()
+    (directory / "developerforums.json").write_text(
+        json.dumps({"category": "Developer/Forums", "badges": badges}), encoding="utf-8")
+    combined = tmp_path / "badges_categories.json"
+    combined.write_text(json.dumps({"🧑‍💻 Developer/Forums": badges}), encoding="utf-8")
+
+    assert load_snapshot(str(combined)) == load_snapshot(str(directory))
+    assert diff_snapshots(load_snapshot(str(combined)), load_snapshot(str(directory)))["summary"]["moved"] == 0
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+from extractor.benchmark import CLI_STARTUP_BUDGET_MS, REPO_ROOT, interpreter_time
+
+# Modules that only specific subcommands need; none may load at dispatch time
+HEAVY_MODULES = {"requests", "bs4", "lxml", "asyncio", "concurrent.futures.process"}
+
+def loaded_modules(code):
+    """
+    Run code in a fresh interpreter and return the modules it left loaded
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys\nprint('\\n'.join(sys.modules))"],
+        cwd=REPO_ROOT, check=True, capture_output=True, text=True,
+    )
+    return set(result.stdout.split())
+
+def test_help_loads_no_heavy_modules():
+    modules = loaded_modules("from extractor.__main__ import print_usage; import io; print_usage(io.StringIO())")
+    assert not HEAVY_MODULES & modules
+
+def test_catalog_command_loads_no_heavy_modules():
+    modules = loaded_modules("from extractor.__main__ import main; main(['catalog'])")
+    assert not HEAVY_MODULES & modules
+
+def test_dispatch_overhead_within_budget():
+    baseline = interpreter_time("pass", runs=5)
+    usage = interpreter_time(args=["-m", "extractor", "--help"], runs=5)
+    overhead_ms = (usage - baseline) * 1000
+    assert overhead_ms <= CLI_STARTUP_BUDGET_MS, (
+        f"python -m extractor --help adds {overhead_ms:.1f} ms over a bare interpreter "
+        f"(budget {CLI_STARTUP_BUDGET_MS} ms)"
+    )
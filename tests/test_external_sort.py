@@ -0,0 +1,82 @@
+import json
+import random
+
+from extractor import external_sort, main
+from extractor.external_sort import ExternalBadgeSorter, badge_sort_key
+
+def random_badges(count, seed=42):
+    rng = random.Random(seed)
+    badges = []
+    for index in range(count):
+        tech = rng.choice(["Python", "Go", "rust", "Rust", "Docker", "Vim"])
+        url = f"https://img.shields.io/badge/{tech}-{rng.randrange(3)}"
+        badges.append((rng.choice(["languages", "other"]), {
+            "technology": tech, "badge_url": url, "markdown": f"![{tech}]({url})",
+            "alt_text": tech, "section": "S", "source_file": f"f{index % 7}.md", "line_number": index}))
+    return badges
+
+def expected_order(records):
+    """
+    What merged() should produce: sorted by badge_sort_key, exact duplicates dropped
+    """
+    result = []
+    seen = set()
+    for category, badge in sorted(records, key=lambda record: badge_sort_key(*record)):
+        identity = (category, badge["badge_url"], badge["markdown"])
+        if identity not in seen:
+            seen.add(identity)
+            result.append((category, badge))
+    return result
+
+def test_spilled_merge_matches_an_in_memory_sort(tmp_path, monkeypatch):
+    records = random_badges(2_000)
+    monkeypatch.setattr(external_sort, "MAX_MERGE_FANIN", 3)
+
+    with ExternalBadgeSorter(memory_budget=20_000, temp_dir=str(tmp_path)) as sorter:
+        for category, badge in records:
+            sorter.add(category, badge)
+        merged = list(sorter.merged())
+        assert sorter.spilled_runs > 3
+        assert len(sorter.runs) <= 3
+
+    assert merged == expected_order(records)
+    assert sorter.added == len(records)
+    assert sorter.duplicates == len(records) - len(merged)
+    # The run files go with the sorter
+    assert list(tmp_path.iterdir()) == []
+
+def test_external_category_files_match_save_badges_to_json(tmp_path):
+    records = random_badges(500)
+
+    with ExternalBadgeSorter(memory_budget=10_000) as sorter:
+        for category, badge in records:
+            sorter.add(category, badge)
+        main.save_badges_external(sorter, str(tmp_path / "external"))
+
+    grouped = {}
+    for category, badge in expected_order(records):
+        grouped.setdefault(category, []).append(badge)
+    main.save_badges_to_json(grouped, str(tmp_path / "memory"))
+
+    for path in sorted((tmp_path / "memory").iterdir()):
+        assert (tmp_path / "external" / path.name).read_bytes() == path.read_bytes()
+
+def test_memory_budget_summary_counts_parsed_files_and_badges(tmp_path):
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    text = ("# Stack\n![Python](https://img.shields.io/badge/python-blue)\n"
+            "![Go](https://img.shields.io/badge/go-blue)\n")
+    (corpus / "a.md").write_text(text, encoding="utf-8")
+    # Every badge here duplicates one in a.md, so none of them reach the output
+    (corpus / "b.md").write_text(text, encoding="utf-8")
+    output = tmp_path / "out"
+
+    main.main([str(corpus), "-o", str(output), "--memory-budget", "0.01"])
+
+    summary = json.loads((output / "extraction_summary.json").read_text(encoding="utf-8"))
+    assert summary["files_processed"] == ["a.md", "b.md"]
+    assert summary["total_badges_found"] == 4
+    assert summary["badges_saved"] == 2
+    assert summary["duplicates_removed"] == 2
+    saved = json.loads((output / "programming_languages.json").read_text(encoding="utf-8"))
+    assert [badge["technology"] for badge in saved["badges"]] == ["Go", "Python"]
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from extractor import catalog, fuzzy_lookup
+
+BADGES = {
+    "languages": [("C#", "c%23-239120?logo=csharp"), ("C++", "c++-00599C?logo=c%2B%2B"),
+                  ("Python", "python-3670A0?logo=python")],
+    "frameworks": [("Node.js", "node.js-6DA55F?logo=node.js"),
+                   ("Visual Studio Code", "vscode-0078d7?logo=visualstudiocode")],
+}
+
+def write_catalog(directory):
+    directory.mkdir(exist_ok=True)
+    for key, badges in BADGES.items():
+        data = {"category": key.title(), "badges": [
+            {"name": name, "badge": f"https://img.shields.io/badge/{path}"} for name, path in badges]}
+        (directory / f"{key}.json").write_text(json.dumps(data), encoding="utf-8")
+    catalog.clear_cache()
+
+@pytest.fixture
+def index(tmp_path):
+    write_catalog(tmp_path / "badge_categories")
+    yield fuzzy_lookup.build_index(str(tmp_path / "badge_categories"))
+    catalog.clear_cache()
+
+def top(index, query):
+    results = fuzzy_lookup.search(index, query, limit=1)
+    return results[0]["name"] if results else None
+
+@pytest.mark.parametrize("query, name", [
+    ("C#", "C#"),
+    ("c++", "C++"),
+    ("nodejs", "Node.js"),
+    ("vscode", "Visual Studio Code"),
+    ("py", "Python"),
+    ("pyhton", "Python"),
+    ("cobol", None),
+])
+def test_search(index, query, name):
+    assert top(index, query) == name
+
+def test_exact_matches_score_one(index):
+    (result,) = fuzzy_lookup.search(index, "Node.js", limit=1)
+    assert result["score"] == 1.0
+    assert result["category"] == "frameworks"
+
+def test_saved_index_is_reused_until_the_catalog_changes(tmp_path):
+    catalog_dir = tmp_path / "badge_categories"
+    write_catalog(catalog_dir)
+    index_path = tmp_path / "index.json"
+
+    built = fuzzy_lookup.load_index(str(index_path), str(catalog_dir))
+    assert index_path.exists()
+    loaded = fuzzy_lookup.load_index(str(index_path), str(catalog_dir))
+    assert loaded["entries"] == built["entries"] and loaded["exact"] == built["exact"]
+
+    (catalog_dir / "tools.json").write_text(json.dumps({"category": "Tools", "badges": [
+        {"name": "Vim", "badge": "https://img.shields.io/badge/vim-green?logo=vim"}]}), encoding="utf-8")
+    catalog.clear_cache()
+
+    rebuilt = fuzzy_lookup.load_index(str(index_path), str(catalog_dir))
+    assert top(rebuilt, "vim") == "Vim"
+    catalog.clear_cache()
@@ -0,0 +1,114 @@
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from extractor import link_checker
+
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg"/>'
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    /badge/ok-* serves an SVG, /badge/png-* a PNG, /head-405/* refuses HEAD,
+    anything else is a 404
+    """
+
+    def _respond(self, send_body):
+        if self.path.startswith("/head-405/") and self.command == "HEAD":
+            self.send_response(405)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if "/ok-" in self.path or self.path.startswith("/head-405/"):
+            status, content_type = 200, "image/svg+xml; charset=utf-8"
+        elif "/png-" in self.path:
+            status, content_type = 200, "image/png"
+        else:
+            status, content_type = 404, "text/plain"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(SVG)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(SVG)
+
+    def do_HEAD(self):
+        self._respond(False)
+
+    def do_GET(self):
+        self._respond(True)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def stub_origin():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def snapshot(tmp_path):
+    urls = {
+        "Good": "https://img.shields.io/badge/ok-1",
+        "Png": "https://img.shields.io/badge/png-2",
+        "Gone": "https://img.shields.io/badge/missing-3",
+        "NoHead": "https://img.shields.io/head-405/x",
+    }
+    data = {"category": "Test", "badges": [{"name": name, "badge": url} for name, url in urls.items()]}
+    path = tmp_path / "test.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+def test_check_links_against_stub(stub_origin, snapshot):
+    rewrites = [("https://img.shields.io", stub_origin)]
+    records = link_checker.load_snapshot(str(snapshot))
+    cache = {}
+
+    checked = link_checker.check_links({url for _, _, url in records}, cache, rewrites=rewrites)
+    report = link_checker.build_report(records, cache, rewrites)["test"]
+
+    assert checked == 4
+    assert report["ok"] == 2
+    errors = {badge["name"]: badge["error"] for badge in report["broken"]}
+    assert errors == {"Png": "unexpected content type: image/png", "Gone": "HTTP 404"}
+
+def test_cache_is_keyed_by_rewritten_url(stub_origin, snapshot, tmp_path):
+    cache_path = tmp_path / "cache.json"
+    args = [str(snapshot), "--cache", str(cache_path), "--rewrite", f"https://img.shields.io={stub_origin}"]
+    link_checker.main(args)
+
+    # A later run without the rewrite must not find the stub's results
+    cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert len(cache) == 4
+    assert all(url.startswith(stub_origin) for url in cache)
+
+def test_rewrite_without_separator_is_a_usage_error(snapshot, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        link_checker.main([str(snapshot), "--rewrite", "https://img.shields.io"])
+    assert excinfo.value.code == 2
+    assert "ORIGIN=REPLACEMENT" in capsys.readouterr().err
+
+def test_transport_failures_are_rechecked(stub_origin):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        closed_origin = f"http://127.0.0.1:{sock.getsockname()[1]}"
+    urls = {"https://img.shields.io/badge/ok-1"}
+    cache = {}
+
+    assert link_checker.check_links(urls, cache, rewrites=[("https://img.shields.io", closed_origin)]) == 1
+    (result,) = cache.values()
+    assert result["status"] is None and not result["ok"]
+
+    # Still failing, but checked again rather than served from the cache
+    assert link_checker.check_links(urls, cache, rewrites=[("https://img.shields.io", closed_origin)]) == 1
+
+    # Real answers are cached for the ttl
+    stub = [("https://img.shields.io", stub_origin)]
+    assert link_checker.check_links(urls, cache, rewrites=stub) == 1
+    assert link_checker.check_links(urls, cache, rewrites=stub) == 0
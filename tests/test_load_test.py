@@ -0,0 +1,61 @@
+import asyncio
+import gzip
+import importlib.util
+
+import pytest
+
+from extractor import load_test
+from extractor.load_test import LoadStats, PageLoader, decode_body
+
+PAGE = b"<script>const categoryFiles = ['good.json', 'bad.json'];</script>"
+GOOD = gzip.compress(b'{"badges": []}')
+
+def test_decode_body():
+    assert decode_body({"content-encoding": "gzip"}, GOOD) == b'{"badges": []}'
+    assert decode_body({}, b"plain") == b"plain"
+    with pytest.raises(ValueError, match="gzip"):
+        decode_body({"content-encoding": "gzip"}, b"not gzip at all")
+
+def test_br_is_only_advertised_when_brotli_imports(monkeypatch):
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec",
+                        lambda name, *args: None if name == "brotli" else real_find_spec(name, *args))
+    assert "Accept-Encoding: gzip\r\n" in load_test.browser_headers()
+
+def test_corrupt_bodies_count_as_errors():
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                path = head.split(b" ")[1]
+                if path == b"/":
+                    body, encoding = PAGE, b""
+                elif path.startswith(b"/badge_categories/good"):
+                    body, encoding = GOOD, b"Content-Encoding: gzip\r\n"
+                else:
+                    body, encoding = b"\x1f\x8b corrupt", b"Content-Encoding: gzip\r\n"
+                writer.write(b"HTTP/1.1 200 OK\r\n" + encoding + b"Content-Length: "
+                             + str(len(body)).encode() + b"\r\n\r\n" + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def scenario():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        stats = LoadStats()
+        loader = PageLoader("127.0.0.1", port, "/", stats)
+        try:
+            await loader.load_page()
+        finally:
+            await loader.close()
+            server.close()
+            await server.wait_closed()
+        return loader, stats
+
+    loader, stats = asyncio.run(scenario())
+    assert stats.errors == 1
+    assert list(loader.cached_json) == ["/badge_categories/good.json"]
+    assert len(stats.page_times) == 1
@@ -0,0 +1,181 @@
+import random
+
+import pytest
+
+from extractor import main
+
+BADGE = "![Go](https://img.shields.io/badge/go-00ADD8?logo=go)"
+# Header markers, ASCII and Unicode whitespace (str.strip() removes both) and badges
+PIECES = ["# ", "## ", "### ", "#### ", "#", "# #", " ", "\t", "\f", "\v", "\x1c", "\xa0",
+          "\u3000", "\u2003", "\x85", "x", "Sec", "\xe9", BADGE]
+
+def reference(path):
+    """
+    Records of the original line-by-line parser for the file at path
+    """
+    return main.extract_badges_from_content(main.read_markdown_file(str(path)), "doc.md")
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+def test_scanner_matches_line_parser(tmp_path, newline, encoding):
+    rng = random.Random(2028)
+    pieces = [piece for piece in PIECES if piece.encode(encoding, "ignore").decode(encoding) == piece]
+    if encoding == "latin-1":
+        # "\xff" makes most files invalid UTF-8, exercising the latin-1 fallback
+        pieces.append("\xff")
+    path = tmp_path / "doc.md"
+
+    for _ in range(2000):
+        lines = ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 8)))
+                 for _ in range(rng.randint(1, 6))]
+        text = newline.join(lines)
+        path.write_bytes(text.encode(encoding))
+
+        assert (main.scan_markdown_file(str(path), "doc.md") or []) == reference(path), repr(text)
+
+@pytest.mark.parametrize("line, section", [
+    ("# Title", "Title"),
+    ("  ### Nested  ", "Nested"),
+    ("\xa0## Spaced\xa0", "Spaced"),
+    ("# #", ""),
+    ("# \xa0# Hash", "# Hash"),
+    ("#### Too deep", None),
+    ("#NoSpace", None),
+    ("# \xa0", None),
+])
+def test_header_section(line, section):
+    assert main.header_section(line) == section
+
+HTML_PAGE = """<html><body>
+<p><img alt="Top" src="https://img.shields.io/badge/top-blue"></p>
+<h2>Languages <img alt="Python" src="https://img.shields.io/badge/python-blue"></h2>
+<div><img alt="Go" src="https://img.shields.io/badge/go-blue"><img src="/logo.png" alt="logo"></div>
+<h3><span>Data   bases</span></h3>
+<p><img alt="Redis" src="https://img.shields.io/badge/redis-red"></p>
+</body></html>
+"""
+
+def test_html_badges_take_their_heading_section(tmp_path):
+    pytest.importorskip("lxml")
+    path = tmp_path / "page.html"
+    path.write_text(HTML_PAGE, encoding="utf-8")
+
+    badges = main.extract_badges_from_html(str(path), "page.html")
+
+    assert [(badge["alt_text"], badge["section"], badge["line_number"]) for badge in badges] == [
+        ("Top", "General", 2),
+        ("Python", "Languages", 3),
+        ("Go", "Languages", 4),
+        ("Redis", "Data bases", 6),
+    ]
+    assert badges[1]["markdown"] == "![Python](https://img.shields.io/badge/python-blue)"
+    assert {badge["source_file"] for badge in badges} == {"page.html"}
+
+TECHNOLOGIES = ["Python", "Go", "Rust", "React", "Docker", "PostgreSQL", "Redis", "Vim"]
+
+def write_corpus(directory, files=12):
+    """
+    Markdown files with headers and repeated badges, of varying sizes
+    """
+    directory.mkdir()
+    for number in range(files):
+        lines = [f"# Project {number}"]
+        for index in range(number * 3 + 1):
+            if index % 4 == 0:
+                lines.append(f"## Section {index}")
+            tech = TECHNOLOGIES[(number + index) % len(TECHNOLOGIES)]
+            lines.append(f"![{tech}](https://img.shields.io/badge/{tech.lower()}-blue?logo={tech.lower()})")
+        (directory / f"doc{number:02}.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return directory
+
+def output_files(directory):
+    return {path.name: path.read_bytes() for path in sorted(directory.iterdir())}
+
+def test_chunks_keep_input_indices_biggest_first(tmp_path):
+    corpus = write_corpus(tmp_path / "corpus")
+    jobs = [(str(path), False) for path in sorted(corpus.iterdir())]
+
+    chunks = main.chunk_files_by_size(jobs, target_bytes=600)
+
+    sizes = [sum((corpus / f"doc{index:02}.md").stat().st_size for index, _, _ in chunk) for chunk in chunks]
+    assert sizes == sorted(sizes, reverse=True)
+    assert sorted(index for chunk in chunks for index, _, _ in chunk) == list(range(len(jobs)))
+    assert all(jobs[index][0] == path for chunk in chunks for index, path, _ in chunk)
+
+def test_parallel_output_is_byte_identical(tmp_path):
+    corpus = write_corpus(tmp_path / "corpus")
+
+    main.main([str(corpus), "-o", str(tmp_path / "serial")])
+    main.main([str(corpus), "-o", str(tmp_path / "parallel"), "--jobs", "2"])
+
+    serial = output_files(tmp_path / "serial")
+    assert "extraction_summary.json" in serial and len(serial) > 2
+    assert output_files(tmp_path / "parallel") == serial
+
+README = f"# Tools\n{BADGE}\n".encode("utf-8")
+
+def write_archives(directory):
+    """
+    The same README inside a .tar.gz, a .zip and a plain .gz, plus non-markdown members
+    """
+    import gzip
+    import io
+    import tarfile
+    import zipfile
+
+    directory.mkdir()
+    with tarfile.open(directory / "repo.tar.gz", "w:gz") as archive:
+        for name, data in (("repo/README.md", README), ("repo/docs/guide.markdown", README),
+                           ("repo/setup.py", README), ("repo/README.tar", README)):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+        archive.addfile(tarfile.TarInfo("repo/notes.md"), io.BytesIO(b""))
+    with zipfile.ZipFile(directory / "repo.zip", "w") as archive:
+        archive.writestr("repo/README", README)
+        archive.writestr("repo/image.png", README)
+        archive.writestr("repo/docs/", b"")
+    (directory / "README.md.gz").write_bytes(gzip.compress(README))
+    (directory / "data.json.gz").write_bytes(gzip.compress(README))
+    return directory
+
+def test_archive_members_are_selected_by_name(tmp_path):
+    directory = write_archives(tmp_path / "archives")
+
+    members = {path.name: [name for name, _ in main.iter_archive_markdown(str(path))]
+               for path in sorted(directory.iterdir())}
+
+    assert members == {
+        "README.md.gz": ["README.md"],
+        "data.json.gz": [],
+        "repo.tar.gz": ["repo/README.md", "repo/docs/guide.markdown", "repo/notes.md"],
+        "repo.zip": ["repo/README"],
+    }
+
+def test_archive_badges_name_their_member(tmp_path):
+    directory = write_archives(tmp_path / "archives")
+
+    badges = main.extract_badges_from_file(str(directory / "repo.tar.gz"))
+
+    assert [(badge["source_file"], badge["section"], badge["line_number"]) for badge in badges] == [
+        ("repo.tar.gz!repo/README.md", "Tools", 2),
+        ("repo.tar.gz!repo/docs/guide.markdown", "Tools", 2),
+    ]
+
+def test_oversized_members_are_skipped_with_a_warning(tmp_path, monkeypatch, capsys):
+    directory = write_archives(tmp_path / "archives")
+    monkeypatch.setattr(main, "MAX_ARCHIVE_MEMBER_BYTES", len(README) - 1)
+
+    assert [name for name, _ in main.iter_archive_markdown(str(directory / "repo.zip"))] == []
+    (name, data), = main.iter_archive_markdown(str(directory / "README.md.gz"))
+    assert data == README[:-1]
+
+    output = capsys.readouterr().out
+    assert "Skipping" in output and "repo/README" in output
+    assert "Truncated" in output
+
+def test_unreadable_archive_returns_none(tmp_path, capsys):
+    path = tmp_path / "broken.zip"
+    path.write_bytes(b"not a zip")
+    assert main.scan_archive(str(path), "broken.zip") is None
+    assert "Error reading archive" in capsys.readouterr().out
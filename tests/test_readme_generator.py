@@ -0,0 +1,110 @@
+import json
+
+import pytest
+
+from extractor import catalog, readme_generator
+from extractor.readme_generator import generate_readme
+
+HAND_WRITTEN = """# Project
+
+## Table of Contents
+
+- [🐍 Languages](#-languages)
+
+# Badges
+
+### 🐍 Languages
+
+| Name | Badge | Markdown |
+| ---- | ----- | -------- |
+| Old | ![Old](https://img.shields.io/badge/old-red) | `![Old](https://img.shields.io/badge/old-red)` |
+
+### Notes
+
+Kept as written.
+
+### ☁️ Hosting
+
+| Name | Badge | Markdown |
+| ---- | ----- | -------- |
+
+"""
+
+def write_category(catalog_dir, key, category, names):
+    badges = [{"name": name, "badge": f"https://img.shields.io/badge/{name}-blue"} for name in names]
+    (catalog_dir / f"{key}.json").write_text(json.dumps({"category": category, "badges": badges}),
+                                             encoding="utf-8")
+    catalog.clear_cache()
+
+@pytest.fixture
+def catalog_dir(tmp_path):
+    directory = tmp_path / "badge_categories"
+    directory.mkdir()
+    write_category(directory, "languages", "Languages", ["Go", "Rust"])
+    write_category(directory, "hosting", "Hosting", ["Netlify"])
+    yield directory
+    catalog.clear_cache()
+
+def sections(text):
+    return [line for line in text.splitlines() if line.startswith("### ")]
+
+def test_hand_written_sections_are_adopted_in_place(tmp_path, catalog_dir):
+    readme = tmp_path / "README.md"
+    readme.write_text(HAND_WRITTEN, encoding="utf-8")
+
+    assert generate_readme(str(readme), str(catalog_dir)) == (2, 0)
+
+    text = readme.read_text(encoding="utf-8")
+    assert sections(text) == ["### 🐍 Languages", "### Notes", "### ☁️ Hosting"]
+    assert text.startswith(HAND_WRITTEN.split("### ")[0])
+    assert "Kept as written.\n" in text
+    assert "| Old |" not in text
+    assert "| Rust |" in text and "| Netlify |" in text
+    assert "<!-- badges:languages " in text and "<!-- /badges:hosting -->" in text
+
+    # Nothing changed, so the second run renders nothing and keeps the file
+    assert generate_readme(str(readme), str(catalog_dir)) == (0, 2)
+    assert readme.read_text(encoding="utf-8") == text
+
+def test_stale_sections_are_re_rendered_dropped_and_appended(tmp_path, catalog_dir):
+    readme = tmp_path / "README.md"
+    readme.write_text(HAND_WRITTEN, encoding="utf-8")
+    generate_readme(str(readme), str(catalog_dir))
+
+    write_category(catalog_dir, "languages", "Languages", ["Go", "Zig"])
+    (catalog_dir / "hosting.json").unlink()
+    write_category(catalog_dir, "databases", "Databases", ["Redis"])
+
+    assert generate_readme(str(readme), str(catalog_dir)) == (2, 0)
+
+    text = readme.read_text(encoding="utf-8")
+    assert sections(text) == ["### 🐍 Languages", "### Notes", "### Databases"]
+    assert "| Zig |" in text and "| Rust |" not in text
+    assert "Netlify" not in text
+    assert text.rstrip("\n").endswith("<!-- /badges:databases -->")
+
+def test_missing_replace_from_heading_is_an_error(tmp_path, catalog_dir):
+    readme = tmp_path / "README.md"
+    original = HAND_WRITTEN.replace("\n# Badges\n", "\n## Badges\n")
+    readme.write_text(original, encoding="utf-8")
+
+    with pytest.raises(ValueError, match="# Badges"):
+        generate_readme(str(readme), str(catalog_dir))
+
+    assert readme.read_text(encoding="utf-8") == original
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["README.md", "badge_categories"]
+
+def test_missing_heading_is_a_usage_error(tmp_path, catalog_dir, capsys):
+    readme = tmp_path / "README.md"
+    readme.write_text("# Project\n", encoding="utf-8")
+
+    with pytest.raises(SystemExit) as excinfo:
+        readme_generator.main([str(readme), "--catalog-dir", str(catalog_dir)])
+    assert excinfo.value.code == 2
+    assert "heading line" in capsys.readouterr().err
+
+def test_new_readme_gets_every_section(tmp_path, catalog_dir):
+    readme = tmp_path / "README.md"
+
+    assert generate_readme(str(readme), str(catalog_dir)) == (2, 0)
+    assert sections(readme.read_text(encoding="utf-8")) == ["### Hosting", "### Languages"]
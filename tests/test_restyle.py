@@ -0,0 +1,124 @@
+import os
+
+import pytest
+
+from extractor import restyle
+from extractor.restyle import restyle_file, restyle_url
+
+PYTHON = "https://img.shields.io/badge/python-3670A0?style=for-the-badge&logo=python&logoColor=ffdd54"
+
+@pytest.mark.parametrize("url, options, expected", [
+    # Existing parameters are replaced in place
+    (PYTHON, {"style": "flat"},
+     "https://img.shields.io/badge/python-3670A0?style=flat&logo=python&logoColor=ffdd54"),
+    # Missing parameters are appended
+    ("https://img.shields.io/badge/Go-blue", {"style": "flat-square"},
+     "https://img.shields.io/badge/Go-blue?style=flat-square"),
+    (PYTHON, {"logo_color": "#ffffff"},
+     "https://img.shields.io/badge/python-3670A0?style=for-the-badge&logo=python&logoColor=ffffff"),
+    # logoColor only applies to badges with a logo
+    ("https://img.shields.io/badge/Go-blue", {"logo_color": "white"},
+     "https://img.shields.io/badge/Go-blue"),
+    # Colour overrides by logo slug rewrite the static badge path
+    (PYTHON, {"colors": {"python": "#000000"}},
+     "https://img.shields.io/badge/python-000000?style=for-the-badge&logo=python&logoColor=ffdd54"),
+    # ... or by label when there is no logo
+    ("https://img.shields.io/badge/Rust--lang-orange.svg", {"colors": {"rust": "red"}},
+     "https://img.shields.io/badge/Rust--lang-red.svg"),
+    # An explicit color= parameter is what gets changed
+    ("https://img.shields.io/badge/x-y?logo=go&color=blue", {"colors": {"go": "00ADD8"}},
+     "https://img.shields.io/badge/x-y?logo=go&color=00ADD8"),
+    # Encoding and empty parameters of untouched parts are kept as written
+    ("https://img.shields.io/badge/a%20b-blue?&logo=a%20b", {"style": "flat"},
+     "https://img.shields.io/badge/a%20b-blue?&logo=a%20b&style=flat"),
+    ("https://shields.io/badge/style-plastic-03650f?logo=appveyor&style=plastic", {"style": "flat"},
+     "https://shields.io/badge/style-plastic-03650f?logo=appveyor&style=flat"),
+    # Non-shields URLs and no-op changes come back unchanged
+    ("https://example.com/badge/x-blue?style=plastic", {"style": "flat"},
+     "https://example.com/badge/x-blue?style=plastic"),
+    ("https://img.shields.io/badge/Go-blue?", {"colors": {"python": "red"}},
+     "https://img.shields.io/badge/Go-blue?"),
+])
+def test_restyle_url(url, options, expected):
+    assert restyle_url(url, **options) == expected
+
+def write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return path
+
+def test_unchanged_files_are_not_written(tmp_path):
+    readme = write(tmp_path / "README.md", f"# Title\n![Python]({PYTHON})\n")
+    os.utime(readme, ns=(1_000_000_000, 1_000_000_000))
+    before = os.stat(readme)
+
+    assert restyle_file(str(readme), style="for-the-badge") == []
+
+    after = os.stat(readme)
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+    assert os.listdir(tmp_path) == ["README.md"]
+
+def test_changes_report_lines_and_rewrite_the_file(tmp_path):
+    readme = write(tmp_path / "README.md", f"# Title\n\ntext ![Python]({PYTHON}) more\n")
+    os.chmod(readme, 0o640)
+
+    changes = restyle_file(str(readme), style="flat")
+
+    new_url = PYTHON.replace("for-the-badge", "flat")
+    assert changes == [(3, PYTHON, new_url)]
+    assert readme.read_text(encoding="utf-8") == f"# Title\n\ntext ![Python]({new_url}) more\n"
+    assert os.stat(readme).st_mode & 0o777 == 0o640
+
+def test_dry_run_leaves_the_file_alone(tmp_path):
+    text = f"![Python]({PYTHON})\n"
+    readme = write(tmp_path / "README.md", text)
+    assert len(restyle_file(str(readme), style="flat", dry_run=True)) == 1
+    assert readme.read_text(encoding="utf-8") == text
+
+def test_symlink_target_is_edited(tmp_path):
+    target = write(tmp_path / "docs.md", f"![Python]({PYTHON})\n")
+    link = tmp_path / "README.md"
+    link.symlink_to(target.name)
+
+    restyle_file(str(link), style="flat")
+
+    assert link.is_symlink()
+    assert "style=flat" in target.read_text(encoding="utf-8")
+
+def test_hard_links_stay_shared(tmp_path):
+    first = write(tmp_path / "a.md", f"![Python]({PYTHON})\n")
+    second = tmp_path / "b.md"
+    os.link(first, second)
+
+    restyle_file(str(first), style="flat")
+
+    assert os.path.samefile(first, second)
+    assert "style=flat" in second.read_text(encoding="utf-8")
+
+def test_walk_only_picks_text_markdown(tmp_path):
+    for name in ("README.md", "README", "notes.markdown", "README.pdf", "readme.md.gz", "readme.txt"):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "README.md").write_bytes(b"")
+
+    found = {os.path.basename(path) for path in restyle.find_markdown_files_recursive(str(tmp_path))}
+    assert found == {"README.md", "README", "notes.markdown"}
+
+@pytest.mark.parametrize("destination, expected", [
+    ('https://img.shields.io/badge/a-blue "Title"',
+     'https://img.shields.io/badge/a-blue?style=for-the-badge "Title"'),
+    ("https://img.shields.io/badge/a-blue?style=flat 'Title'",
+     "https://img.shields.io/badge/a-blue?style=for-the-badge 'Title'"),
+    ('https://img.shields.io/badge/a-blue?style=flat (Title)',
+     'https://img.shields.io/badge/a-blue?style=for-the-badge (Title)'),
+    ('<https://img.shields.io/badge/a-blue> "Title"',
+     '<https://img.shields.io/badge/a-blue?style=for-the-badge> "Title"'),
+    ('  https://img.shields.io/badge/a-blue  ',
+     '  https://img.shields.io/badge/a-blue?style=for-the-badge  '),
+])
+def test_link_titles_are_kept(tmp_path, destination, expected):
+    readme = write(tmp_path / "README.md", f"![a]({destination})\n")
+
+    changes = restyle_file(str(readme), style="for-the-badge")
+
+    assert len(changes) == 1
+    assert readme.read_text(encoding="utf-8") == f"![a]({expected})\n"
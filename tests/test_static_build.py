@@ -0,0 +1,80 @@
+import json
+import os
+import re
+
+import pytest
+
+from extractor import catalog, static_build
+
+PRESERVED_PATTERN = re.compile(r'<(script|textarea|pre)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+def preserved_elements(html):
+    return [match.group(0) for match in PRESERVED_PATTERN.finditer(html)]
+
+def test_comment_text_inside_script_and_textarea_survives():
+    html = ("<div>\n    <!-- layout note -->\n    <textarea><!-- placeholder --></textarea>\n"
+            "</div>\n<script>\n    if (s.includes('<!-- marker -->')) {}\n</script>\n")
+    minified = static_build.minify_html(html)
+    assert "layout note" not in minified
+    assert "<textarea><!-- placeholder --></textarea>" in minified
+    assert "    if (s.includes('<!-- marker -->')) {}\n" in minified
+
+def test_commented_out_script_tag_does_not_open_a_block():
+    minified = static_build.minify_html("<!-- <script> -->\n    <p>\n        text\n    </p>\n")
+    assert minified == "<p>\ntext\n</p>\n"
+
+def test_built_pages_keep_preserved_elements(tmp_path):
+    manifest = static_build.build_site(output_dir=str(tmp_path), compress=False)
+    renames = {os.path.basename(name): os.path.basename(hashed) for name, hashed in manifest.items()}
+
+    for name in os.listdir(static_build.UTILS_DIR):
+        if not name.endswith(".html"):
+            continue
+        with open(os.path.join(static_build.UTILS_DIR, name), encoding="utf-8") as f:
+            source = static_build.rewrite_references(f.read(), renames)
+        with open(tmp_path / name, encoding="utf-8") as f:
+            built = f.read()
+        assert preserved_elements(built) == preserved_elements(source), name
+
+def test_built_json_names_are_content_hashed(tmp_path):
+    manifest = static_build.build_site(output_dir=str(tmp_path), compress=False)
+    assert len(manifest) == len(catalog.category_files())
+    for hashed in manifest.values():
+        with open(tmp_path / hashed, "rb") as f:
+            data = f.read()
+        assert static_build.content_hash(data) in hashed
+        json.loads(data)
+
+def test_source_tree_is_never_used_as_output(tmp_path):
+    source = tmp_path / "utils"
+    (source / "badge_categories").mkdir(parents=True)
+    (source / "index.html").write_text("<p>page</p>\n", encoding="utf-8")
+
+    for output in (source, tmp_path, source / "badge_categories"):
+        with pytest.raises(ValueError, match="contains the"):
+            static_build.build_site(str(source), str(output), compress=False)
+    assert (source / "index.html").exists()
+
+def test_only_previous_builds_are_replaced(tmp_path):
+    source = tmp_path / "utils"
+    (source / "badge_categories").mkdir(parents=True)
+    (source / "index.html").write_text("<p>page</p>\n", encoding="utf-8")
+    output = tmp_path / "dist"
+    output.mkdir()
+    (output / "notes.txt").write_text("mine", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="asset-manifest.json"):
+        static_build.build_site(str(source), str(output), compress=False)
+    assert (output / "notes.txt").exists()
+
+    (output / "notes.txt").unlink()
+    static_build.build_site(str(source), str(output), compress=False)
+    # A second build replaces the first
+    static_build.build_site(str(source), str(output), compress=False)
+    assert sorted(os.listdir(output)) == ["asset-manifest.json", "badge_categories", "index.html"]
+
+def test_unsafe_output_is_a_usage_error(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        static_build.main(["-o", static_build.UTILS_DIR, "--no-compress"])
+    assert excinfo.value.code == 2
+    assert os.path.exists(os.path.join(static_build.UTILS_DIR, "index.html"))
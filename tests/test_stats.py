@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from extractor.stats import BadgeStats, HyperLogLog, TopCounter
+
+@pytest.mark.parametrize("count", [10, 1_000, 50_000])
+def test_hyperloglog_estimate_is_within_a_few_percent(count):
+    sketch = HyperLogLog()
+    for number in range(count):
+        sketch.add(f"item-{number}")
+        sketch.add(f"item-{number}")
+    assert abs(sketch.estimate() - count) <= max(1, 0.05 * count)
+
+def test_hyperloglog_merge_equals_one_sketch():
+    left, right, both = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    for number in range(5_000):
+        (left if number % 2 else right).add(str(number))
+        both.add(str(number))
+    left.merge(right)
+    assert left.registers == both.registers
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLog(precision=10))
+
+def test_top_counter_is_exact_below_capacity_and_keeps_heavy_hitters():
+    exact = TopCounter(capacity=10)
+    for key in "aaabbc":
+        exact.add(key)
+    assert exact.top(2) == [["a", 3], ["b", 2]]
+
+    rng = random.Random(36)
+    counter = TopCounter(capacity=50)
+    for _ in range(20_000):
+        counter.add("hot" if rng.random() < 0.2 else f"cold-{rng.randrange(5_000)}")
+    (key, count), *_ = counter.top(1)
+    assert key == "hot" and count >= 3_500
+    assert len(counter.counts) == 50
+
+def badge(technology, url, section="Intro", source_file="a.md"):
+    return {"technology": technology, "badge_url": url, "section": section, "source_file": source_file}
+
+def test_badge_stats_summary_and_merge():
+    first, second = BadgeStats(), BadgeStats()
+    first.add_category("languages", [badge("Python", "u1"), badge("Go", "u2")])
+    second.add_category("languages", [badge("Python", "u1", source_file="b.md")])
+    second.add(badge("Docker", "u3", section="Ops", source_file="b.md"), "devops")
+
+    first.merge(second)
+    summary = first.summary()
+
+    assert summary["total_badges_found"] == 4
+    assert summary["files_processed"] == ["a.md", "b.md"]
+    assert first.categories == {"languages": 3, "devops": 1}
+    assert first.unique_technologies() == ["Docker", "Go", "Python"]
+    assert summary["unique_badge_urls_estimate"] == 3
+    assert summary["top_technologies"][0] == ["Python", 2]
+    assert summary["top_sections"] == [["Intro", 3], ["Ops", 1]]
+
+def test_exact_technologies_give_way_to_the_estimate():
+    stats = BadgeStats(exact_limit=100)
+    for number in range(1_000):
+        stats.add(badge(f"tech-{number}", f"url-{number}"))
+
+    assert stats.unique_technologies() is None
+    assert stats.summary()["unique_technologies_exact"] is False
+    assert abs(stats.unique_technologies_count() - 1_000) <= 50
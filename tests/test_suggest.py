@@ -0,0 +1,20 @@
+from extractor.suggest import parse_manifest
+
+REQUIREMENTS = """\
+requests>=2.31  # HTTP
+Django==5.0
+-r base.txt
+--index-url https://pypi.example.com/simple
+git+https://github.com/x/y.git
+git+https://github.com/x/celery-fork.git@main#egg=celery
+-e git+ssh://git@github.com/x/z.git#egg=flask
+https://example.com/packages/thing-1.0.tar.gz
+numpy @ https://example.com/numpy-2.0-py3-none-any.whl
+hg+https://hg.example.com/repo
+"""
+
+def test_requirements_skip_url_and_vcs_schemes(tmp_path):
+    path = tmp_path / "requirements.txt"
+    path.write_text(REQUIREMENTS, encoding="utf-8")
+
+    assert parse_manifest(str(path)) == ["python", "requests", "Django", "celery", "flask", "numpy"]